@@ -1,13 +1,66 @@
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from src.utils.budget import RunBudget
 
 
 class QueryRequest(BaseModel):
     query: str
     model: Optional[str] = "gpt-4o-mini"
     temperature: Optional[float] = 0.2
+    max_tokens: Optional[int] = Field(default=None, ge=1)
+    # 요청별 실행 예산 (서버 설정값 RUN_*보다 느슨하게 설정할 수 없음)
+    budget: Optional[RunBudget] = None
+    # 같은 thread_id의 요청은 이전 대화(메시지, worker 결과)에 이어서 실행됨
+    thread_id: Optional[str] = Field(default=None, min_length=1, max_length=128)
 
 
 class QueryResponse(BaseModel):
     answer: str
     timestamp: str
+    thread_id: Optional[str] = None
+    # 실행 예산 소진으로 조기 종료된 경우 그 이유 (answer는 부분 결과)
+    stopped_reason: Optional[str] = None
+
+
+class BatchQueryRequest(BaseModel):
+    queries: list[QueryRequest] = Field(min_length=1)
+    # 배치 내 동시 실행 수 (서버 설정값 BATCH_MAX_CONCURRENCY를 넘을 수 없음)
+    max_concurrency: Optional[int] = Field(default=None, ge=1)
+
+
+class BatchQueryItem(BaseModel):
+    index: int
+    query: str
+    answer: Optional[str] = None
+    error: Optional[str] = None
+    stopped_reason: Optional[str] = None
+    timestamp: str
+
+
+class BatchQueryResponse(BaseModel):
+    results: list[BatchQueryItem]
+    succeeded: int
+    failed: int
+
+
+class JobCreateResponse(BaseModel):
+    job_id: str
+    status: str
+
+
+class JobMessage(BaseModel):
+    node: str
+    name: Optional[str] = None
+    content: str
+
+
+class JobResponse(BaseModel):
+    job_id: str
+    status: str
+    query: str
+    messages: list[JobMessage]
+    answer: Optional[str] = None
+    error: Optional[str] = None
+    created_at: str
+    updated_at: str
@@ -1,21 +1,54 @@
-from typing import Annotated
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Annotated, Any, AsyncIterator, Awaitable, Callable, Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+import asyncio
 import datetime as dt
-from langchain_openai import ChatOpenAI
+import json
+import os
+from langchain_core.messages import BaseMessage
 
 from dependency_injector.wiring import inject, Provide
 
 from startup import Container
 from src.graph.builder import BuilderABC
+from src.graph.pre_router import FastPathRouter
+from src.graph.nodes.base import Node
 from src.models.graph_state import SupervisorState
+from src.services.job_runner import JobRunner
+from src.services.node_executor import (
+    NodeExecutor,
+    NodeExecutorPool,
+    NodeQueueTimeoutError,
+    NodeSaturatedError,
+)
+from src.services.response_cache import ResponseCache, parse_cache_control
+from src.services.single_flight import SingleFlight
+from src.utils.budget import RunBudget, stopped_message
+from src.utils.concurrency import provider_limiter
+from src.utils.llm import LLMRegistry
 from src.utils.logger import setup_logger
-from api.models import QueryRequest, QueryResponse
+from src.utils import metrics as prometheus_metrics
+from src.utils.resilience import breakers
+from src.utils.tracing import tracer
+from api.models import (
+    BatchQueryItem,
+    BatchQueryRequest,
+    BatchQueryResponse,
+    JobCreateResponse,
+    JobResponse,
+    QueryRequest,
+    QueryResponse,
+)
 
 # 로거 설정
 logger = setup_logger("market_agent.routes")
 
 router = APIRouter(prefix="/api")
 
+# 배치 요청 하나가 동시에 실행할 수 있는 최대 쿼리 수
+BATCH_MAX_CONCURRENCY = int(os.getenv("BATCH_MAX_CONCURRENCY", "4"))
+
 
 @router.get("/")
 async def root():
@@ -32,16 +65,79 @@ async def health_check():
     }
 
 
+@router.get("/stats")
+@inject
+async def stats(
+    cache: Annotated[ResponseCache, Depends(Provide[Container.response_cache])],
+    single_flight: Annotated[SingleFlight, Depends(Provide[Container.single_flight])],
+    node_executors: Annotated[
+        NodeExecutorPool, Depends(Provide[Container.node_executors])
+    ],
+    pre_router: Annotated[FastPathRouter, Depends(Provide[Container.pre_router])],
+):
+    """응답 캐시, 중복 요청 병합(coalescing), 노드 실행기, 사전 라우팅, 외부 API 호출 한도 통계 엔드포인트"""
+    return {
+        "cache": cache.stats(),
+        "coalescing": single_flight.stats(),
+        "nodes": node_executors.stats(),
+        "routing": pre_router.stats(),
+        "providers": provider_limiter.stats(),
+        "timestamp": dt.datetime.now().isoformat(),
+    }
+
+
+async def metrics():
+    """Prometheus 메트릭 엔드포인트 (/metrics)"""
+    body, content_type = prometheus_metrics.render()
+    return Response(content=body, media_type=content_type)
+
+
+@router.get("/traces")
+async def traces(trace_id: Optional[str] = None, limit: int = 200):
+    """최근 실행의 span 목록 엔드포인트 (TRACE_EXPORTER에 memory가 포함된 경우)
+
+    trace_id를 지정하면 해당 실행의 span만 반환합니다.
+    """
+    return {"spans": tracer.recent(trace_id, limit)}
+
+
+@router.get("/admin/breakers")
+async def circuit_breakers():
+    """외부 호스트별 차단기(circuit breaker) 상태 엔드포인트"""
+    return {
+        "breakers": breakers.stats(),
+        "timestamp": dt.datetime.now().isoformat(),
+    }
+
+
+@router.post("/admin/breakers/{host}/reset")
+async def reset_circuit_breaker(host: str):
+    """차단기를 수동으로 닫습니다. (장애 복구를 확인한 경우)"""
+    if not breakers.reset(host):
+        raise HTTPException(status_code=404, detail=f"No circuit breaker for '{host}'")
+    return {"host": host, **breakers.get(host).stats()}
+
+
 # TODO: 의존성 주입 방식이 적절치 않아보임.
 @router.post("/query", response_model=QueryResponse)
 @inject
 async def process_query(
     request: QueryRequest,
+    http_request: Request,
+    response: Response,
     graph: Annotated[BuilderABC, Depends(Provide[Container.supervisor_graph])],
-    llm: Annotated[ChatOpenAI, Depends(Provide[Container.llm])],
+    llms: Annotated[LLMRegistry, Depends(Provide[Container.llm_registry])],
+    run_budget: Annotated[RunBudget, Depends(Provide[Container.run_budget])],
+    cache: Annotated[ResponseCache, Depends(Provide[Container.response_cache])],
+    single_flight: Annotated[SingleFlight, Depends(Provide[Container.single_flight])],
 ):
     """
     사용자 쿼리를 처리하고 에이전트 네트워크의 응답을 반환합니다.
+    동일한 쿼리/모델/temperature의 응답은 캐시되며,
+    `Cache-Control: no-cache` 헤더로 캐시를 우회할 수 있습니다.
+    동시에 들어온 동일한 요청은 하나의 그래프 실행 결과를 공유합니다.
+    실행 예산이 소진되면 부분 결과와 함께 stopped_reason을 반환하며, 캐시하지 않습니다.
+    thread_id가 있으면 같은 스레드의 이전 대화에 이어서 실행하며, 캐시하지 않습니다.
     """
     try:
         if not graph:
@@ -51,24 +147,364 @@ async def process_query(
 
         logger.info(f"Received query: {request.query}")
 
-        # LLM 인스턴스 생성
-        _llm = llm.bind(**request.model_dump())
-        #  ChatOpenAI(model=request.model, temperature=request.temperature)
+        if request.thread_id:
+            # 대화 스레드의 응답은 이전 대화에 따라 달라지므로 캐시/병합하지 않음
+            return await _execute_query(graph, llms, run_budget, request)
 
-        # 그래프 실행
-        state = SupervisorState(llm=_llm, messages=[("user", request.query)])
-        answer = graph.execute(state)
+        key = cache.make_key(
+            "query",
+            request.query,
+            request.model,
+            request.temperature,
+            request.max_tokens,
+        )
+        answer = await _cached(
+            cache,
+            single_flight,
+            "query",
+            key,
+            http_request,
+            response,
+            lambda: _execute_query(graph, llms, run_budget, request),
+        )
+        return QueryResponse(**answer)
 
-        logger.info(f"Generated answer for query: {request.query}")
+    except Exception as e:
+        logger.error(f"Error processing query: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Error processing query: {str(e)}")
+
+
+@router.post("/query/batch", response_model=BatchQueryResponse)
+@inject
+async def process_batch_query(
+    request: BatchQueryRequest,
+    graph: Annotated[BuilderABC, Depends(Provide[Container.supervisor_graph])],
+    llms: Annotated[LLMRegistry, Depends(Provide[Container.llm_registry])],
+    run_budget: Annotated[RunBudget, Depends(Provide[Container.run_budget])],
+):
+    """
+    여러 쿼리를 동시에 처리하고 항목별 응답 또는 오류를 반환합니다.
+
+    배치 내 동시 실행 수는 max_concurrency(최대 BATCH_MAX_CONCURRENCY)로 제한되며,
+    외부 provider 호출은 provider별 동시 호출 제한을 추가로 받습니다.
+    """
+    if not graph:
+        raise HTTPException(status_code=500, detail="그래프가 초기화되지 않았습니다.")
+
+    concurrency = min(
+        request.max_concurrency or BATCH_MAX_CONCURRENCY, BATCH_MAX_CONCURRENCY
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+    logger.info(
+        f"Received batch of {len(request.queries)} queries (concurrency: {concurrency})"
+    )
+
+    async def run(index: int, query: QueryRequest) -> BatchQueryItem:
+        async with semaphore:
+            try:
+                response = await _execute_query(graph, llms, run_budget, query)
+                return BatchQueryItem(
+                    index=index,
+                    query=query.query,
+                    answer=response.answer,
+                    stopped_reason=response.stopped_reason,
+                    timestamp=response.timestamp,
+                )
+            except Exception as e:
+                logger.error(
+                    f"Error processing batch query #{index}: {str(e)}", exc_info=True
+                )
+                return BatchQueryItem(
+                    index=index,
+                    query=query.query,
+                    error=f"Error processing query: {str(e)}",
+                    timestamp=dt.datetime.now().isoformat(),
+                )
+
+    results = await asyncio.gather(
+        *(run(index, query) for index, query in enumerate(request.queries))
+    )
+    failed = sum(1 for result in results if result.error is not None)
+
+    logger.info(f"Batch completed: {len(results) - failed} succeeded, {failed} failed")
+    return BatchQueryResponse(
+        results=results, succeeded=len(results) - failed, failed=failed
+    )
+
+
+@router.post("/jobs", response_model=JobCreateResponse, status_code=202)
+@inject
+async def create_job(
+    request: QueryRequest,
+    job_runner: Annotated[JobRunner, Depends(Provide[Container.job_runner])],
+):
+    """
+    쿼리를 비동기 작업으로 등록하고 작업 ID를 반환합니다.
+    결과는 GET /api/jobs/{job_id}로 조회합니다.
+    """
+    job_id = await job_runner.submit(request.model_dump())
+    return JobCreateResponse(job_id=job_id, status="queued")
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+@inject
+async def get_job(
+    job_id: str,
+    job_runner: Annotated[JobRunner, Depends(Provide[Container.job_runner])],
+):
+    """
+    작업의 상태, 진행 중 메시지, 최종 답변을 반환합니다.
+    """
+    job = await job_runner.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+
+    return JobResponse(
+        job_id=job["id"],
+        status=job["status"],
+        query=job["request"]["query"],
+        messages=job["messages"],
+        answer=job["answer"],
+        error=job["error"],
+        created_at=job["created_at"],
+        updated_at=job["updated_at"],
+    )
+
+
+def create_node_endpoint(
+    node: Node,
+    name: str,
+    cache: ResponseCache,
+    single_flight: SingleFlight,
+    executor: NodeExecutor,
+    llms: LLMRegistry,
+) -> Callable:
+    """노드를 직접 호출하는 API 엔드포인트를 생성합니다.
 
-        # 응답 생성
-        response = QueryResponse(
-            answer=answer["messages"][-1].content,
-            timestamp=dt.datetime.now().isoformat(),
+    노드는 요청의 model/temperature/max_tokens에 해당하는 LLM으로 전용 실행기에서
+    실행되며(응답 캐시 및 동일 요청 병합 적용), `_ainvoke`를 구현한 노드는 스레드 대신
+    이벤트 루프에서 실행됩니다.
+    실행기가 포화 상태이면 대기하지 않고 429, 대기 시간이 초과되면 503을 반환합니다.
+    그래프를 거치지 않으므로 budget, thread_id를 지정하면 422를 반환합니다.
+    """
+
+    async def endpoint(body: QueryRequest, request: Request, response: Response):
+        unsupported = [
+            field for field in ("budget", "thread_id") if getattr(body, field)
+        ]
+        if unsupported:
+            raise HTTPException(
+                status_code=422,
+                detail=f"/api/{name} does not support: {', '.join(unsupported)}",
+            )
+
+        llm = llms.get(body.model, body.temperature, body.max_tokens)
+        key = cache.make_key(
+            name, body.query, body.model, body.temperature, body.max_tokens
         )
+        try:
+            return await _cached(
+                cache,
+                single_flight,
+                name,
+                key,
+                request,
+                response,
+                # 비동기 노드는 이벤트 루프에서, 동기 노드는 노드 전용 스레드 풀에서 실행
+                lambda: executor.arun(node.ainvoke, body.query, llm)
+                if node.supports_async
+                else executor.run(node.invoke, body.query, llm),
+            )
+        except NodeSaturatedError as e:
+            logger.warning(f"Rejected request for /api/{name}: {str(e)}")
+            raise HTTPException(
+                status_code=429, detail=str(e), headers={"Retry-After": "1"}
+            )
+        except NodeQueueTimeoutError as e:
+            logger.warning(f"Timed out request for /api/{name}: {str(e)}")
+            raise HTTPException(status_code=503, detail=str(e))
+
+    endpoint.__name__ = f"{name}_invoke"
+    endpoint.__doc__ = f"{node.__class__.__name__} 노드를 직접 호출합니다."
+    return endpoint
 
-        return response
 
+async def _cached(
+    cache: ResponseCache,
+    single_flight: SingleFlight,
+    endpoint: str,
+    key: str,
+    request: Request,
+    response: Response,
+    compute: Callable[[], Awaitable[Any]],
+) -> Any:
+    use_cache, store = parse_cache_control(request.headers.get("cache-control"))
+    if use_cache:
+        cached = await cache.aget(endpoint, key)
+        if cached is not None:
+            logger.info(f"Cache hit for /api/{endpoint}")
+            response.headers["X-Cache"] = "HIT"
+            return cached
+
+    async def compute_and_store() -> Any:
+        result = jsonable_encoder(await compute())
+        # 예산 소진으로 조기 종료된 부분 결과는 캐시하지 않음
+        partial = isinstance(result, dict) and result.get("stopped_reason")
+        if store and not partial:
+            await cache.aset(endpoint, key, result)
+        return result
+
+    coalesced = single_flight.is_in_flight(key)
+    result = await single_flight.do(key, compute_and_store)
+    if coalesced:
+        logger.info(f"Coalesced request for /api/{endpoint} with in-flight execution")
+        response.headers["X-Coalesced"] = "true"
+    response.headers["X-Cache"] = "MISS"
+    return result
+
+
+async def _execute_query(
+    graph: BuilderABC, llms: LLMRegistry, run_budget: RunBudget, request: QueryRequest
+) -> QueryResponse:
+    # 요청의 model/temperature/max_tokens에 해당하는 공유 LLM 클라이언트
+    llm = llms.get(request.model, request.temperature, request.max_tokens)
+
+    # 그래프 실행
+    state = SupervisorState(llm=llm, messages=[("user", request.query)])
+    result = await graph.aexecute(
+        state, run_budget.merge(request.budget), request.thread_id
+    )
+    stopped_reason = result.get("stopped_reason")
+
+    if stopped_reason:
+        logger.warning(f"Partial answer for query ({stopped_reason}): {request.query}")
+    else:
+        logger.info(f"Generated answer for query: {request.query}")
+
+    # 응답 생성
+    return QueryResponse(
+        answer=_final_answer(result["messages"], stopped_reason),
+        stopped_reason=stopped_reason,
+        thread_id=request.thread_id,
+        timestamp=dt.datetime.now().isoformat(),
+    )
+
+
+def _final_answer(messages: list, stopped_reason: Optional[str]) -> str:
+    """마지막 worker 메시지를 답변으로 사용합니다.
+
+    조기 종료된 경우에는 부분 결과가 되며, 대화 스레드에서 새 worker 실행 없이
+    종료된 경우에는 이전 턴의 답변이 됩니다.
+    worker 응답이 없으면 사용자 질문 대신 안내 메시지를 반환합니다.
+    """
+    for message in reversed(messages):
+        if getattr(message, "name", None):
+            return message.content
+    if stopped_reason:
+        return stopped_message(stopped_reason)
+    return messages[-1].content
+
+
+@router.post("/query/stream")
+@inject
+async def stream_query(
+    request: QueryRequest,
+    graph: Annotated[BuilderABC, Depends(Provide[Container.supervisor_graph])],
+    llms: Annotated[LLMRegistry, Depends(Provide[Container.llm_registry])],
+    run_budget: Annotated[RunBudget, Depends(Provide[Container.run_budget])],
+):
+    """
+    사용자 쿼리를 처리하며 그래프 이벤트를 Server-Sent Events로 스트리밍합니다.
+
+    이벤트 종류:
+    - start: 요청 수신
+    - route: supervisor가 선택한 다음 worker
+    - message: worker의 응답 메시지
+    - token: worker LLM이 생성하는 토큰
+    - budget: 실행 예산 소진으로 인한 조기 종료 (이유와 사용량)
+    - done: 최종 답변 (조기 종료된 경우 부분 결과)
+    - error: 실행 중 오류
+    """
+    if not graph:
+        raise HTTPException(status_code=500, detail="그래프가 초기화되지 않았습니다.")
+
+    logger.info(f"Received streaming query: {request.query}")
+
+    llm = llms.get(request.model, request.temperature, request.max_tokens)
+    state = SupervisorState(llm=llm, messages=[("user", request.query)])
+
+    return StreamingResponse(
+        _stream_events(
+            graph,
+            state,
+            request.query,
+            run_budget.merge(request.budget),
+            request.thread_id,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _stream_events(
+    graph: BuilderABC,
+    state: SupervisorState,
+    query: str,
+    budget: RunBudget,
+    thread_id: Optional[str] = None,
+) -> AsyncIterator[str]:
+    yield _sse("start", {"query": query, "timestamp": dt.datetime.now().isoformat()})
+
+    answer = ""
+    try:
+        async for mode, chunk in graph.astream(
+            state, ("updates", "messages"), budget, thread_id
+        ):
+            if mode == "budget":
+                answer = answer or stopped_message(chunk["reason"])
+                yield _sse("budget", chunk)
+                continue
+            if mode == "messages":
+                message, metadata = chunk
+                node = _source_node(metadata)
+                if node != "supervisor" and isinstance(message.content, str):
+                    if message.content:
+                        yield _sse("token", {"node": node, "content": message.content})
+                continue
+
+            for node, update in chunk.items():
+                if not update:
+                    continue
+                if node == "supervisor" and "next" in update:
+                    yield _sse("route", {"next": update["next"]})
+                for message in update.get("messages", []):
+                    answer = _message_content(message)
+                    yield _sse(
+                        "message",
+                        {"node": node, "name": message.name, "content": answer},
+                    )
     except Exception as e:
-        logger.error(f"Error processing query: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Error processing query: {str(e)}")
+        logger.error(f"Error streaming query: {str(e)}", exc_info=True)
+        yield _sse("error", {"detail": f"Error processing query: {str(e)}"})
+        return
+
+    logger.info(f"Streamed answer for query: {query}")
+    yield _sse("done", {"answer": answer, "timestamp": dt.datetime.now().isoformat()})
+
+
+def _sse(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _source_node(metadata: dict) -> str:
+    """중첩된 에이전트 그래프의 이벤트를 최상위 그래프 노드 이름으로 매핑합니다."""
+    checkpoint_ns = metadata.get("langgraph_checkpoint_ns", "")
+    return checkpoint_ns.split("|")[0].split(":")[0] or metadata.get(
+        "langgraph_node", ""
+    )
+
+
+def _message_content(message: Any) -> str:
+    if isinstance(message, BaseMessage):
+        return message.content
+    return str(message)
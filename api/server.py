@@ -1,17 +1,41 @@
+from contextlib import asynccontextmanager
+from typing import Awaitable, Callable
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from api.route import router as api_router
+from api.route import metrics, router as api_router
+
+Hook = Callable[[], Awaitable[None]]
 
 
 class APIBuilder:
     def __init__(self):
         self.app = None
+        self._startup_hooks: list[Hook] = []
+        self._shutdown_hooks: list[Hook] = []
+
+    def on_startup(self, hook: Hook):
+        """서버 시작 시 실행할 비동기 함수를 등록합니다."""
+        self._startup_hooks.append(hook)
+
+    def on_shutdown(self, hook: Hook):
+        """서버 종료 시 실행할 비동기 함수를 등록합니다. 등록의 역순으로 실행됩니다."""
+        self._shutdown_hooks.append(hook)
+
+    @asynccontextmanager
+    async def _lifespan(self, app: FastAPI):
+        for hook in self._startup_hooks:
+            await hook()
+        yield
+        for hook in reversed(self._shutdown_hooks):
+            await hook()
 
     def __build(self):
         self.app = FastAPI(
             title="Market Analysis API",
             description="주식 시장 분석을 위한 AI 에이전트 네트워크 API",
             version="0.1.0",
+            lifespan=self._lifespan,
         )
         self.app.add_middleware(
             CORSMiddleware,
@@ -21,6 +45,7 @@ class APIBuilder:
             allow_headers=["*"],
         )
         self.app.include_router(api_router)
+        self.app.add_api_route("/metrics", metrics, include_in_schema=False)
 
     def create_app(self) -> FastAPI:
         self.__build()
@@ -0,0 +1,142 @@
+import asyncio
+import re
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Sequence
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import RunnableLambda
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+# 티커 추출 프롬프트에 대한 응답 (USFinancialStatementTool._extract_ticker)
+COMPANY_TICKERS = {
+    "apple": "AAPL",
+    "애플": "AAPL",
+    "microsoft": "MSFT",
+    "마이크로소프트": "MSFT",
+    "nvidia": "NVDA",
+    "엔비디아": "NVDA",
+}
+
+
+class ScriptedChatModel(BaseChatModel):
+    """벤치마크용 chat model. 호출마다 latency만큼 기다린 뒤 정해진 규칙대로 응답합니다.
+
+    - supervisor(structured output): plans에 등록된 질문별 단계에 따라 worker를 선택
+    - ReAct 에이전트: query 인자를 받는 도구를 한 번 호출한 뒤 도구 결과를 요약
+    - 그 외 호출: 티커 추출 프롬프트에는 티커를, 나머지에는 answer_words 길이의 답변을 반환
+    """
+
+    plans: Dict[str, List[List[str]]] = {}
+    latency: float = 0.05
+    answer_words: int = 120
+    model_name: str = "scripted"
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any):
+        return self.bind(
+            tools=[convert_to_openai_tool(tool) for tool in tools], **kwargs
+        )
+
+    def with_structured_output(self, schema: Any, **kwargs: Any):
+        def route(messages: List[BaseMessage]) -> Dict:
+            time.sleep(self.latency)
+            return self._route(messages)
+
+        async def aroute(messages: List[BaseMessage]) -> Dict:
+            await asyncio.sleep(self.latency)
+            return self._route(messages)
+
+        return RunnableLambda(route, afunc=aroute)
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        time.sleep(self.latency)
+        return self._result(messages, kwargs.get("tools"))
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        await asyncio.sleep(self.latency)
+        return self._result(messages, kwargs.get("tools"))
+
+    def _route(self, messages: List[BaseMessage]) -> Dict:
+        index = _last_query_index(messages)
+        plan = self.plans.get(messages[index].content if index is not None else "", [])
+        # 마지막 질문 이후 worker 결과 수로 진행한 단계를 계산
+        done = sum(1 for message in messages[index + 1 :] if message.name)
+        for step in plan:
+            if done < len(step):
+                return {"next": step}
+            done -= len(step)
+        return {"next": ["FINISH"]}
+
+    def _result(
+        self, messages: List[BaseMessage], tools: Optional[List[Dict]]
+    ) -> ChatResult:
+        return ChatResult(
+            generations=[ChatGeneration(message=self._respond(messages, tools))]
+        )
+
+    def _respond(
+        self, messages: List[BaseMessage], tools: Optional[List[Dict]]
+    ) -> AIMessage:
+        last = messages[-1]
+        if isinstance(last, ToolMessage):
+            summary = " ".join(str(last.content).split()[: self.answer_words])
+            return AIMessage(content=f"{last.name} 결과 요약: {summary}")
+
+        tool = _query_tool(tools or [])
+        index = _last_query_index(messages)
+        if tool is not None and index is not None:
+            call = {
+                "name": tool,
+                "args": {"query": messages[index].content},
+                "id": f"call_{uuid.uuid4().hex[:12]}",
+            }
+            return AIMessage(content="", tool_calls=[call])
+
+        text = str(last.content)
+        if "Ticker:" in text:
+            return AIMessage(content=_ticker(text))
+        return AIMessage(content=" ".join(["분석"] * self.answer_words))
+
+
+def _last_query_index(messages: List[BaseMessage]) -> Optional[int]:
+    # worker 결과는 name이 있으므로 name이 없는 마지막 HumanMessage가 사용자 질문
+    for i in range(len(messages) - 1, -1, -1):
+        message = messages[i]
+        if isinstance(message, HumanMessage) and not message.name:
+            return i
+    return None
+
+
+def _query_tool(tools: List[Dict]) -> Optional[str]:
+    for tool in tools:
+        function = tool["function"]
+        if "query" in function.get("parameters", {}).get("properties", {}):
+            return function["name"]
+    return None
+
+
+def _ticker(prompt: str) -> str:
+    lowered = prompt.lower()
+    for company, ticker in COMPANY_TICKERS.items():
+        if company in lowered:
+            return ticker
+    match = re.search(r'"[^"]*\b([A-Z]{1,5})\b[^"]*"', prompt)
+    return match.group(1) if match else "UNKNOWN"
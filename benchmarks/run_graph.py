@@ -0,0 +1,354 @@
+"""멀티 에이전트 그래프 end-to-end 벤치마크
+
+운영 구성(main.py)과 같은 노드로 SupervisorGraphBuilder를 빌드하고, 스크립트 chat model과
+로컬 스텁 서버(Naver, Alpha Vantage, 한국투자증권, RSS)를 사용해 동시성 단계별로 실행합니다.
+
+Example:
+python -m benchmarks.run_graph --concurrency 1 4 16 --queries 64
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, List, NamedTuple, Optional
+
+from langchain_core.vectorstores import InMemoryVectorStore
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.fake_llm import ScriptedChatModel
+from benchmarks.scenarios import QUERY_MIX, plans, sample_queries
+from benchmarks.stubs import StubServer
+from src.graph.builder import SupervisorGraphBuilder
+from src.graph.compaction import MessageCompactor
+from src.graph.nodes import (
+    ChosunRSSFeederNode,
+    HantooFinancialAnalyzerNode,
+    NaverNewsSearcherNode,
+    ReportAssistantNode,
+    USFinancialAnalyzerNode,
+    WeeklyReporterNode,
+    WSJEconomyRSSFeederNode,
+    WSJMarketRSSFeederNode,
+)
+from src.graph.pre_router import FastPathRouter, HashingEmbeddings
+from src.models.graph_state import SupervisorState
+from src.tools.rss_feeder.tool import RSSFeederTool
+from src.utils.budget import RunBudget
+from src.utils.concurrency import RateLimiter, provider_limiter
+from src.utils.http_client import http_clients
+
+console = Console()
+
+RECAP_DOCUMENTS = [
+    "Weekly market recap: US equities rose 1.2% as inflation cooled and yields fell.",
+    "Weekly market recap: The Fed held rates steady; markets price two cuts this year.",
+    "Weekly market recap: Korean exporters rallied on semiconductor demand.",
+]
+
+
+class Sample(NamedTuple):
+    seconds: float
+    hops: int
+    error: Optional[str]
+
+
+@contextlib.contextmanager
+def _stub_environment(stubs: StubServer):
+    """도구가 스텁 서버를 사용하도록 환경변수와 호출 속도 제한을 바꾸고, 끝나면 되돌립니다."""
+    saved_env = {key: os.environ.get(key) for key in stubs.env()}
+    saved_rate_limiter = provider_limiter.rate_limiter
+    os.environ.update(stubs.env())
+    # 스텁 서버에는 실제 API의 호출 속도/일일 한도를 적용하지 않음
+    provider_limiter.rate_limiter = RateLimiter()
+    try:
+        yield
+    finally:
+        provider_limiter.rate_limiter = saved_rate_limiter
+        for key, value in saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def build_graph(llm: ScriptedChatModel, stubs: StubServer) -> SupervisorGraphBuilder:
+    """main.py와 같은 노드 구성(한국투자증권 노드 포함)으로 그래프를 빌드합니다.
+
+    도구가 스텁 서버를 사용하도록 `_stub_environment` 안에서 호출해야 합니다.
+    """
+    builder = SupervisorGraphBuilder(
+        pre_router=FastPathRouter.from_env(), compactor=MessageCompactor.from_env()
+    )
+    builder.add_node(NaverNewsSearcherNode())
+    builder.add_node(ReportAssistantNode())
+    for node, feed in (
+        (ChosunRSSFeederNode(), "chosun"),
+        (WSJEconomyRSSFeederNode(), "wsj-economy"),
+        (WSJMarketRSSFeederNode(), "wsj-market"),
+    ):
+        node.tools = [RSSFeederTool(url=stubs.rss_url(feed))]
+        builder.add_node(node)
+    builder.add_node(HantooFinancialAnalyzerNode())
+    builder.add_node(USFinancialAnalyzerNode())
+
+    vector_store = InMemoryVectorStore(HashingEmbeddings())
+    vector_store.add_texts(RECAP_DOCUMENTS)
+    weekly_reporter = WeeklyReporterNode(vector_store)
+    # 주간 리포터는 state의 llm 대신 자체 llm을 사용
+    weekly_reporter.llm = llm
+    builder.add_node(weekly_reporter)
+    return builder.build()
+
+
+async def run_async(
+    builder: SupervisorGraphBuilder,
+    llm: ScriptedChatModel,
+    queries: List[str],
+    concurrency: int,
+    budget: RunBudget,
+) -> List[Sample]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(query: str) -> Sample:
+        async with semaphore:
+            start_time = time.perf_counter()
+            try:
+                result = await builder.aexecute(_state(llm, query), budget)
+                return Sample(
+                    time.perf_counter() - start_time, result.get("hops", 0), None
+                )
+            except Exception as e:
+                return Sample(time.perf_counter() - start_time, 0, repr(e))
+
+    try:
+        return await asyncio.gather(*(run(query) for query in queries))
+    finally:
+        # 단계마다 새 이벤트 루프를 사용하므로 루프가 닫히기 전에 커넥션 풀을 닫음
+        await http_clients.aclose()
+
+
+def run_sync(
+    builder: SupervisorGraphBuilder,
+    llm: ScriptedChatModel,
+    queries: List[str],
+    concurrency: int,
+    budget: RunBudget,
+) -> List[Sample]:
+    def run(query: str) -> Sample:
+        start_time = time.perf_counter()
+        try:
+            result = builder.execute(_state(llm, query), budget)
+            return Sample(time.perf_counter() - start_time, result.get("hops", 0), None)
+        except Exception as e:
+            return Sample(time.perf_counter() - start_time, 0, repr(e))
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(run, queries))
+
+
+def summarize(samples: List[Sample], concurrency: int, wall_seconds: float) -> Dict:
+    latencies = sorted(sample.seconds * 1000 for sample in samples)
+    hops = [sample.hops for sample in samples if sample.error is None]
+    errors = [sample.error for sample in samples if sample.error is not None]
+    return {
+        "concurrency": concurrency,
+        "queries": len(samples),
+        "errors": len(errors),
+        "error_samples": sorted(set(errors))[:5],
+        "wall_seconds": round(wall_seconds, 3),
+        "throughput_qps": round(len(samples) / wall_seconds, 3) if wall_seconds else 0,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50), 1),
+            "p95": round(percentile(latencies, 95), 1),
+            "p99": round(percentile(latencies, 99), 1),
+            "mean": round(sum(latencies) / len(latencies), 1) if latencies else 0,
+            "max": round(latencies[-1], 1) if latencies else 0,
+        },
+        "hops": {
+            "mean": round(sum(hops) / len(hops), 2) if hops else 0,
+            "max": max(hops, default=0),
+        },
+        # 프로세스 시작 이후의 최대값이므로 동시성 단계가 올라갈수록 누적됨
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def percentile(values: List[float], q: float) -> float:
+    """정렬된 값에서 선형 보간으로 백분위수를 계산합니다."""
+    if not values:
+        return 0.0
+    position = (len(values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 byte 단위
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def benchmark(args: argparse.Namespace) -> Dict:
+    llm = ScriptedChatModel(
+        plans=plans(), latency=args.llm_latency, answer_words=args.answer_words
+    )
+    budget = RunBudget.from_env()
+    levels = []
+    with (
+        StubServer(latency=args.stub_latency) as stubs,
+        _stub_environment(stubs),
+    ):
+        builder = build_graph(llm, stubs)
+
+        def run(queries: List[str], concurrency: int) -> List[Sample]:
+            if args.mode == "sync":
+                return run_sync(builder, llm, queries, concurrency, budget)
+            return asyncio.run(run_async(builder, llm, queries, concurrency, budget))
+
+        # 에이전트 생성, 커넥션 등 최초 실행 비용은 측정에서 제외
+        with _quiet(args.verbose):
+            run([scenario.query for scenario in QUERY_MIX], len(QUERY_MIX))
+
+        for concurrency in args.concurrency:
+            queries = sample_queries(args.queries, seed=args.seed)
+            with _quiet(args.verbose):
+                start_time = time.perf_counter()
+                samples = run(queries, concurrency)
+                wall_seconds = time.perf_counter() - start_time
+            levels.append(summarize(samples, concurrency, wall_seconds))
+        upstream_requests = dict(stubs.requests)
+
+    return {
+        "benchmark": "graph",
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {
+            "mode": args.mode,
+            "queries": args.queries,
+            "seed": args.seed,
+            "llm_latency": args.llm_latency,
+            "stub_latency": args.stub_latency,
+            "answer_words": args.answer_words,
+            "budget": budget.model_dump(),
+        },
+        "levels": levels,
+        "upstream_requests": upstream_requests,
+    }
+
+
+def print_report(report: Dict):
+    table = Table(
+        title=f"graph benchmark ({report['config']['mode']}, {report['commit']})"
+    )
+    for column in (
+        "concurrency",
+        "qps",
+        "p50 ms",
+        "p95 ms",
+        "p99 ms",
+        "hops",
+        "errors",
+        "peak RSS MB",
+    ):
+        table.add_column(column, justify="right")
+    for level in report["levels"]:
+        latency = level["latency_ms"]
+        table.add_row(
+            str(level["concurrency"]),
+            f"{level['throughput_qps']:.2f}",
+            f"{latency['p50']:.0f}",
+            f"{latency['p95']:.0f}",
+            f"{latency['p99']:.0f}",
+            f"{level['hops']['mean']:.2f}",
+            str(level["errors"]),
+            f"{level['peak_rss_mb']:.0f}",
+        )
+    console.print(table)
+
+
+def save_report(report: Dict, output_dir: str) -> str:
+    os.makedirs(output_dir, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    path = os.path.join(
+        output_dir, f"graph-{timestamp}-{report['commit'] or 'local'}.json"
+    )
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    return path
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 32])
+    parser.add_argument("--queries", type=int, default=64, help="동시성 단계별 질문 수")
+    parser.add_argument("--mode", choices=("async", "sync"), default="async")
+    parser.add_argument(
+        "--llm-latency", type=float, default=0.05, help="LLM 호출당 지연(초)"
+    )
+    parser.add_argument(
+        "--stub-latency", type=float, default=0.02, help="외부 API 응답 지연(초)"
+    )
+    parser.add_argument("--answer-words", type=int, default=120)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=os.path.join("benchmarks", "results"))
+    parser.add_argument("--verbose", action="store_true", help="노드/도구 로그 출력")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> Dict:
+    args = parse_args(argv)
+    report = benchmark(args)
+    print_report(report)
+    if args.output:
+        console.print(f"saved: {save_report(report, args.output)}")
+    return report
+
+
+def _state(llm: ScriptedChatModel, query: str) -> SupervisorState:
+    return SupervisorState(llm=llm, messages=[("user", query)])
+
+
+@contextlib.contextmanager
+def _quiet(verbose: bool):
+    """측정 중에는 노드 로그와 도구의 print 출력을 끕니다."""
+    if verbose:
+        yield
+        return
+    logging.disable(logging.INFO)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import random
+from typing import Dict, List, NamedTuple
+
+
+class Scenario(NamedTuple):
+    query: str
+    # supervisor가 단계별로 선택할 worker 목록 (한 단계에 여러 개면 병렬 실행)
+    plan: List[List[str]]
+    weight: int = 1
+
+
+# 사전 라우터 규칙으로 처리되는 요청과 supervisor LLM 라우팅이 필요한 요청을 섞은 구성
+QUERY_MIX = [
+    Scenario("삼성전자 관련 최신 뉴스 알려줘", [["navernewssearchernode"]], 3),
+    Scenario("AAPL 재무 분석해줘", [["usfinancialanalyzernode"]], 2),
+    Scenario("이번 주 주간 리캡 요약해줘", [["weeklyreporternode"]], 2),
+    Scenario(
+        "조선일보랑 WSJ 경제 뉴스 요약해줘",
+        [["chosunrssfeedernode", "wsjeconomyrssfeedernode"]],
+        2,
+    ),
+    Scenario(
+        "WSJ 시장 동향과 국내 뉴스를 비교해줘",
+        [["wsjmarketrssfeedernode"], ["navernewssearchernode"]],
+    ),
+    Scenario(
+        "금리 인하가 미국 증시에 미칠 영향을 보고서로 정리해줘",
+        [
+            ["navernewssearchernode", "wsjmarketrssfeedernode"],
+            ["reportassistantnode"],
+        ],
+    ),
+    Scenario(
+        "Compare Microsoft profitability and stability",
+        [["usfinancialanalyzernode"], ["reportassistantnode"]],
+    ),
+    Scenario("삼성전자(005930) 재무제표 분석해줘", [["hantoofinancialanalyzernode"]]),
+]
+
+
+def plans() -> Dict[str, List[List[str]]]:
+    return {scenario.query: scenario.plan for scenario in QUERY_MIX}
+
+
+def sample_queries(count: int, seed: int = 0) -> List[str]:
+    """가중치에 따라 count개의 질문을 뽑습니다. 같은 seed는 같은 순서를 반환합니다."""
+    rng = random.Random(seed)
+    queries = [scenario.query for scenario in QUERY_MIX]
+    weights = [scenario.weight for scenario in QUERY_MIX]
+    return rng.choices(queries, weights=weights, k=count)
@@ -0,0 +1,227 @@
+import asyncio
+import threading
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from aiohttp import web
+
+# 스텁 응답에 사용하는 기사 수
+ITEMS = 10
+
+
+class StubServer:
+    """Naver, Alpha Vantage, 한국투자증권, RSS(기사 본문 포함) API를 흉내 내는 로컬 HTTP 서버
+
+    별도 스레드의 이벤트 루프에서 실행되며, 모든 응답은 latency만큼 지연됩니다.
+    """
+
+    def __init__(self, latency: float = 0.02, host: str = "127.0.0.1"):
+        self.latency = latency
+        self.host = host
+        self.base_url: Optional[str] = None
+        self.requests: Dict[str, int] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._runner: Optional[web.AppRunner] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "StubServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def env(self) -> Dict[str, str]:
+        """도구의 API wrapper가 스텁 서버를 사용하도록 하는 환경변수"""
+        return {
+            "NAVER_API_URL": f"{self.base_url}/naver/v1/search",
+            "ALPHA_VANTAGE_BASE_URL": f"{self.base_url}/alpha_vantage/query",
+            "HANTOO_BASE_URL": f"{self.base_url}/hantoo",
+            "NAVER_CLIENT_ID": "benchmark",
+            "NAVER_CLIENT_SECRET": "benchmark",
+            "ALPHA_VANTAGE_API_KEY": "benchmark",
+            "HANTOO_APP_KEY": "benchmark",
+            "HANTOO_APP_SECRET": "benchmark",
+        }
+
+    def rss_url(self, feed: str) -> str:
+        return f"{self.base_url}/rss/{feed}"
+
+    def start(self):
+        self._loop = asyncio.new_event_loop()
+        started = threading.Event()
+        self._thread = threading.Thread(
+            target=self._serve, args=(started,), name="benchmark-stubs", daemon=True
+        )
+        self._thread.start()
+        started.wait()
+
+    def stop(self):
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+
+    def _serve(self, started: threading.Event):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(self._start_site())
+        started.set()
+        self._loop.run_forever()
+
+    async def _start_site(self):
+        app = web.Application(middlewares=[self._delay])
+        app.router.add_get("/naver/v1/search/{kind}.json", self._naver)
+        app.router.add_get("/alpha_vantage/query", self._alpha_vantage)
+        app.router.add_post("/hantoo/oauth2/tokenP", self._hantoo_token)
+        app.router.add_get(
+            "/hantoo/uapi/domestic-stock/v1/{group}/{kind}", self._hantoo
+        )
+        app.router.add_get("/rss/{feed}", self._rss)
+        app.router.add_get("/articles/{feed}/{index}", self._article)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.base_url = f"http://{self.host}:{port}"
+
+    @web.middleware
+    async def _delay(self, request: web.Request, handler):
+        upstream = request.path.split("/")[1]
+        self.requests[upstream] = self.requests.get(upstream, 0) + 1
+        await asyncio.sleep(self.latency)
+        return await handler(request)
+
+    async def _naver(self, request: web.Request) -> web.Response:
+        query = request.query.get("query", "")
+        display = int(request.query.get("display", ITEMS))
+        items = [
+            {
+                "title": f"<b>{query}</b> 관련 기사 {i}",
+                "originallink": f"https://news.example.com/{i}",
+                "link": f"https://n.news.naver.com/article/{i}",
+                "description": f"{query}에 대한 시장 반응과 전문가 분석 {i}. " * 3,
+                "pubDate": _pub_date(i),
+            }
+            for i in range(display)
+        ]
+        return web.json_response({"total": display, "items": items})
+
+    async def _alpha_vantage(self, request: web.Request) -> web.Response:
+        function = request.query.get("function")
+        symbol = request.query.get("symbol", "AAPL")
+        if function == "OVERVIEW":
+            return web.json_response(
+                {
+                    "Symbol": symbol,
+                    "Name": f"{symbol} Inc",
+                    "Sector": "TECHNOLOGY",
+                    "Industry": "ELECTRONIC COMPUTERS",
+                    "MarketCapitalization": "3000000000000",
+                    "PERatio": "30.5",
+                    "EPS": "6.5",
+                    "ReturnOnEquityTTM": "1.5",
+                    "FullTimeEmployees": "160000",
+                }
+            )
+        reports = [_us_report(year) for year in (2024, 2023, 2022)]
+        return web.json_response(
+            {"symbol": symbol, "annualReports": reports, "quarterlyReports": reports}
+        )
+
+    async def _hantoo_token(self, request: web.Request) -> web.Response:
+        return web.json_response({"access_token": "stub-token", "expires_in": 86400})
+
+    async def _hantoo(self, request: web.Request) -> web.Response:
+        if request.match_info["kind"] == "search-stock-info":
+            return web.json_response({"output": {"prdt_name": "삼성전자"}})
+        return web.json_response(
+            {"output": [_kr_report(f"{year}12") for year in (2024, 2023, 2022)]}
+        )
+
+    async def _rss(self, request: web.Request) -> web.Response:
+        feed = request.match_info["feed"]
+        items = "".join(
+            f"<item><title>{feed} headline {i}</title>"
+            f"<link>{self.base_url}/articles/{feed}/{i}</link>"
+            f"<description>{feed} market summary {i}</description>"
+            f"<pubDate>{_pub_date(i)}</pubDate></item>"
+            for i in range(ITEMS)
+        )
+        body = (
+            '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+            f"<title>{feed}</title><link>{self.base_url}/rss/{feed}</link>"
+            f"<description>{feed} feed</description>{items}</channel></rss>"
+        )
+        return web.Response(text=body, content_type="application/rss+xml")
+
+    async def _article(self, request: web.Request) -> web.Response:
+        feed, index = request.match_info["feed"], request.match_info["index"]
+        paragraphs = "".join(
+            f"<p>{feed} article {index} paragraph {i}. "
+            "Stocks moved as investors weighed inflation data and central bank guidance.</p>"
+            for i in range(8)
+        )
+        body = (
+            f"<html><head><title>{feed} headline {index}</title></head>"
+            f"<body><article><h1>{feed} headline {index}</h1>{paragraphs}</article></body></html>"
+        )
+        return web.Response(text=body, content_type="text/html")
+
+
+def _pub_date(i: int) -> str:
+    return format_datetime(
+        datetime(2025, 3, 7, tzinfo=timezone.utc) - timedelta(hours=i)
+    )
+
+
+def _us_report(year: int) -> Dict[str, str]:
+    scale = 1 + (year - 2022) * 0.08
+    values = {
+        "totalRevenue": 380e9,
+        "grossProfit": 170e9,
+        "operatingIncome": 115e9,
+        "netIncome": 95e9,
+        "ebitda": 130e9,
+        "interestExpense": 3e9,
+        "totalAssets": 350e9,
+        "totalLiabilities": 290e9,
+        "totalShareholderEquity": 60e9,
+        "totalCurrentAssets": 140e9,
+        "totalCurrentLiabilities": 150e9,
+        "cashAndShortTermInvestments": 60e9,
+        "inventory": 6e9,
+        "longTermDebt": 95e9,
+        "operatingCashflow": 110e9,
+        "capitalExpenditures": 10e9,
+    }
+    report = {key: str(int(value * scale)) for key, value in values.items()}
+    report["fiscalDateEnding"] = f"{year}-09-30"
+    return report
+
+
+def _kr_report(period: str) -> Dict[str, str]:
+    return {
+        "stac_yymm": period,
+        "total_aset": "455905980",
+        "cras": "218163185",
+        "fxas": "237742795",
+        "flow_lblt": "75719452",
+        "fix_lblt": "16509006",
+        "total_lblt": "92228458",
+        "total_cptl": "363677522",
+        "sale_account": "300870903",
+        "sale_cost": "186562268",
+        "sale_totl_prfi": "114308635",
+        "bsop_prti": "32725961",
+        "thtr_ntin": "34451351",
+        "roe_val": "9.03",
+        "eps": "4950",
+        "bps": "57930",
+        "rsrv_rate": "44000.5",
+        "lblt_rate": "25.36",
+    }
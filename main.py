@@ -1,9 +1,13 @@
+import os
+
 from dotenv import load_dotenv
 
 from dependency_injector.wiring import Provide, inject
 import uvicorn
 from apscheduler.schedulers.background import BackgroundScheduler
+from fastapi import FastAPI
 
+from api.route import create_node_endpoint
 from api.server import APIBuilder
 from src.graph.nodes import (
     NaverNewsSearcherNode,
@@ -14,8 +18,11 @@ from src.graph.nodes import (
     WeeklyReporterNode,
     USFinancialAnalyzerNode
 )
+from src.utils.leader import LeaderLock
 from src.utils.logger import setup_logger
+from src.utils.tracing import tracer
 from src.graph.builder import SupervisorGraphBuilder
+from src.graph.checkpointer import ThreadedSqliteSaver
 from startup import Container
 from rich.console import Console
 
@@ -54,12 +61,31 @@ logo = """
 """
 
 
+def create_app() -> FastAPI:
+    """API 서버 앱 팩토리
+
+    단일 프로세스 실행뿐 아니라 멀티 워커 환경에서도 사용할 수 있으며,
+    워커 프로세스마다 한 번씩 호출되어 그래프를 미리 빌드합니다.
+
+    Example:
+    uvicorn main:create_app --factory --workers 4
+    gunicorn -k uvicorn.workers.UvicornWorker -w 4 "main:create_app()"
+    """
+    container = Container()
+    container.wire(modules=[__name__, "api.route", "src.tasks.weekly_recap_scraper"])
+    return _create_app(container)
+
+
 @inject
-def main(
+def _create_app(
+    container: Container,
     graph_builder: SupervisorGraphBuilder = Provide[Container.supervisor_graph],
-):
-    console.print(logo)
-    logger.info("Starting Market Analysis Agent service...")
+) -> FastAPI:
+    """라우트와 같은 싱글턴을 사용하도록 wire된 container 인스턴스에서 의존성을 가져옵니다.
+
+    `Container.<provider>()`(클래스)는 wire된 인스턴스와 다른 싱글턴을 만드므로 사용하지 않습니다.
+    """
+    logger.info(f"Building Market Analysis Agent app (pid: {os.getpid()})...")
 
     ## 그래프 빌더
     """
@@ -85,21 +111,45 @@ def main(
     # 미국 주식 분석 에이전트 노드 추가 (Alpha Vantage API 사용)
     graph_builder.add_node(USFinancialAnalyzerNode())
 
-    vector_store = Container.vector_store_recap()
+    vector_store = container.vector_store_recap()
     graph_builder.add_node(WeeklyReporterNode(vector_store))
 
     graph_builder.build()
 
     ## API 서버 빌더
     api_builder = APIBuilder()
+    # 종료 중 마지막 span까지 내보내도록 가장 먼저 등록 (종료 훅은 역순 실행)
+    api_builder.on_shutdown(tracer.ashutdown)
+    # 실행 중인 작업이 모두 정리된 뒤 닫히도록 작업 실행기보다 먼저 등록
+    checkpointer = container.checkpointer()
+    if isinstance(checkpointer, ThreadedSqliteSaver):
+        api_builder.on_shutdown(checkpointer.aclose)
+    api_builder.on_shutdown(container.llm_registry().aclose)
+    api_builder.on_shutdown(container.http_clients().aclose)
+    job_runner = container.job_runner()
+    api_builder.on_startup(job_runner.start)
+    api_builder.on_shutdown(job_runner.stop)
     app = api_builder.create_app()
+    response_cache = container.response_cache()
+    single_flight = container.single_flight()
+    node_executors = container.node_executors()
+    api_builder.on_shutdown(node_executors.shutdown)
     for node in graph_builder.get_nodes():
+        name = node.__class__.__name__.lower().replace("node", "")
         app.add_api_route(
-            f"/api/{node.__class__.__name__.lower().replace('node', '')}",
+            f"/api/{name}",
             methods=["POST"],
-            endpoint=node.invoke,
+            endpoint=create_node_endpoint(
+                node,
+                name,
+                response_cache,
+                single_flight,
+                node_executors.get(name),
+                container.llm_registry(),
+            ),
         )
 
+    ## 스케줄러: 여러 워커 중 리더 프로세스 하나에서만 실행
     scheduler = BackgroundScheduler(daemon=True)
     scheduler.add_job(
         scrape_jp_weekly_recap,
@@ -108,12 +158,41 @@ def main(
         minute=0,
         args=[vector_store],
     )
-    scheduler.start()
+    leader = LeaderLock(
+        os.getenv("SCHEDULER_LOCK_PATH", "market_agent_scheduler.lock")
+    )
+
+    async def start_scheduler():
+        leader.run_when_elected(scheduler.start)
+
+    async def stop_scheduler():
+        leader.stop()
+        if scheduler.running:
+            scheduler.shutdown(wait=False)
+
+    api_builder.on_startup(start_scheduler)
+    api_builder.on_shutdown(stop_scheduler)
+
+    return app
+
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+def main():
+    console.print(logo)
+    logger.info("Starting Market Analysis Agent service...")
+
+    workers = int(os.getenv("API_WORKERS", "1"))
+    if workers > 1:
+        # 워커 프로세스마다 create_app이 호출됨
+        uvicorn.run(
+            "main:create_app",
+            factory=True,
+            host="0.0.0.0",
+            port=8000,
+            workers=workers,
+        )
+    else:
+        uvicorn.run(create_app(), host="0.0.0.0", port=8000)
 
 
 if __name__ == "__main__":
-    container = Container()
-    container.wire(modules=[__name__, "api.route", "src.tasks.weekly_recap_scraper"])
     main()
@@ -52,8 +52,8 @@ class Pipeline:
 
         try:
             r = requests.post(
-                url=f"{self.endpoint}?query={user_message}",
-                json={},
+                url=self.endpoint,
+                json={"query": user_message},
                 headers=headers,
             )
 
@@ -56,8 +56,8 @@ class Pipeline:
 
         try:
             r = requests.post(
-                url=f"{self.endpoint}?query={query}",
-                json={},
+                url=self.endpoint,
+                json={"query": query},
                 headers=headers,
             )
 
@@ -1,14 +1,34 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any
+from contextlib import suppress
+from typing import Any, AsyncIterator, Optional, Sequence
 from typing_extensions import Self
 
+from langchain_core.messages import HumanMessage, convert_to_messages
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.errors import GraphRecursionError
 from langgraph.graph import StateGraph, START
+from langgraph.pregel import Pregel
+from langgraph.types import StateSnapshot
+from langgraph.utils.runnable import RunnableCallable
 from src.graph.nodes.base import Node
 from src.graph.nodes import (
     SupervisorNode,
 )
+from src.graph.compaction import MessageCompactor
+from src.graph.pre_router import FastPathRouter
 from src.models.graph_state import SimpleState, SupervisorState
+from src.utils.budget import (
+    BudgetExceededError,
+    BudgetTracker,
+    RunBudget,
+    budget_scope,
+)
 from src.utils.logger import setup_logger
+from src.utils.memo import ToolMemo, memo_scope, new_run_memo
+from src.utils.metrics import GRAPH_RUN_SECONDS, observe_hops, timed
+from src.utils.tracing import tracer
 
 logger = setup_logger("market_agent")
 
@@ -21,17 +41,48 @@ class BuilderABC(ABC):
     def build(self) -> Self: ...
 
     @abstractmethod
-    def execute(self, state: SimpleState) -> Any: ...
+    def execute(
+        self,
+        state: SimpleState,
+        budget: Optional[RunBudget] = None,
+        thread_id: Optional[str] = None,
+    ) -> Any: ...
+
+    @abstractmethod
+    async def aexecute(
+        self,
+        state: SimpleState,
+        budget: Optional[RunBudget] = None,
+        thread_id: Optional[str] = None,
+    ) -> Any: ...
+
+    @abstractmethod
+    def astream(
+        self,
+        state: SimpleState,
+        stream_mode: Sequence[str],
+        budget: Optional[RunBudget] = None,
+        thread_id: Optional[str] = None,
+    ) -> AsyncIterator[tuple[str, Any]]: ...
 
     @abstractmethod
     def run(self): ...
 
 
 class SupervisorGraphBuilder(BuilderABC):
-    def __init__(self):
+    def __init__(
+        self,
+        pre_router: Optional[FastPathRouter] = None,
+        checkpointer: Optional[BaseCheckpointSaver] = None,
+        compactor: Optional[MessageCompactor] = None,
+    ):
         super().__init__()
+        self.pre_router = pre_router
+        self.checkpointer = checkpointer
+        self.compactor = compactor
         self._builder = None
         self._graph = None
+        self._thread_graph = None
         self._node_list = []
         # TODO: OPENAI 라이브러리 처리
 
@@ -39,9 +90,21 @@ class SupervisorGraphBuilder(BuilderABC):
         self.logger.info("Building graph...")
         self._builder = StateGraph(SupervisorState)
 
-        self._builder.add_node("supervisor", SupervisorNode())
+        if self.pre_router is not None:
+            self.pre_router.fit(
+                {
+                    node.__class__.__name__.lower(): node.description
+                    or getattr(node, "system_prompt", "")
+                    for node in self._node_list
+                }
+            )
+        self._builder.add_node(
+            "supervisor",
+            self._as_runnable(SupervisorNode(pre_router=self.pre_router), "supervisor"),
+        )
         for node in self._node_list:
-            self._builder.add_node(node.__class__.__name__.lower(), node)
+            name = node.__class__.__name__.lower()
+            self._builder.add_node(name, self._as_runnable(node, name))
             # self._builder.add_node(
             #     node.__class__.__name__,
             #     _make_call_agent(
@@ -58,21 +121,265 @@ class SupervisorGraphBuilder(BuilderABC):
         self._builder.add_edge(START, "supervisor")
 
         self._graph = self._builder.compile()
+        # 대화 스레드(thread_id)가 있는 실행은 노드마다 checkpoint를 저장하는 그래프를 사용
+        if self.checkpointer is not None:
+            self._thread_graph = self._builder.compile(checkpointer=self.checkpointer)
 
         self.logger.info("Graph built successfully")
         return self
 
-    def execute(self, state: SupervisorState) -> Any:
-        state["members"] = self.members
+    def execute(
+        self,
+        state: SupervisorState,
+        budget: Optional[RunBudget] = None,
+        thread_id: Optional[str] = None,
+    ) -> Any:
+        """그래프를 실행하고 최종 state를 반환합니다.
+
+        thread_id가 주어지면 같은 스레드의 이전 대화에 이어서 실행합니다.
+        예산이 소진되면 그 시점까지의 state에 `stopped_reason`을 담아 반환합니다.
+        동기 실행에서는 제한 시간을 supervisor와 LLM 호출 시점에만 확인합니다.
+        같은 실행 안에서 같은 인자로 반복되는 도구 호출은 결과를 재사용합니다.
+        """
+        graph, config = self._prepare(state, budget, thread_id)
 
         self.logger.info(f"Executing graph with state: {state}")
-        assert self._graph is not None, "Graph is not built"
-        result = self._graph.invoke(state)
+        snapshot = graph.get_state(config) if graph.checkpointer else None
+        graph_input = self._resume_input(state, snapshot)
+        tracker = BudgetTracker(budget) if budget else None
+        memo = new_run_memo()
+        result = dict(state)
+        with (
+            tracer.span(
+                "graph run", kind="run", mode="invoke", thread_id=thread_id
+            ) as span,
+            timed(GRAPH_RUN_SECONDS, mode="invoke"),
+            budget_scope(tracker),
+            memo_scope(memo),
+        ):
+            try:
+                for result in graph.stream(
+                    graph_input, config=config, stream_mode="values"
+                ):
+                    pass
+            except (BudgetExceededError, GraphRecursionError) as e:
+                result["stopped_reason"] = self._stopped_reason(e)
+            span.set_attribute("hops", result.get("hops", 0))
+            span.set_attribute("stopped_reason", result.get("stopped_reason"))
+        self._log_stopped(result.get("stopped_reason"), tracker)
+        self._log_memo(memo)
+        observe_hops(result.get("hops", 0))
         self.logger.info(f"Execution completed with result: {result}")
         return result
 
+    async def aexecute(
+        self,
+        state: SupervisorState,
+        budget: Optional[RunBudget] = None,
+        thread_id: Optional[str] = None,
+    ) -> Any:
+        """그래프를 비동기로 실행하고 최종 state를 반환합니다.
+
+        thread_id가 주어지면 같은 스레드의 이전 대화에 이어서 실행합니다.
+        예산이 소진되면 그 시점까지의 state에 `stopped_reason`을 담아 반환합니다.
+        """
+        self.logger.info(f"Executing graph asynchronously with state: {state}")
+        result = dict(state)
+        async for mode, chunk in self._astream(
+            state, ("values",), budget, thread_id, "ainvoke"
+        ):
+            if mode == "values":
+                result = chunk
+            elif mode == "budget":
+                result = {**result, "stopped_reason": chunk["reason"]}
+        self.logger.info(f"Execution completed with result: {result}")
+        return result
+
+    def astream(
+        self,
+        state: SupervisorState,
+        stream_mode: Sequence[str] = ("updates", "messages"),
+        budget: Optional[RunBudget] = None,
+        thread_id: Optional[str] = None,
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """그래프를 실행하며 (stream_mode, chunk) 이벤트를 순서대로 반환합니다.
+
+        예산이 소진되어 조기 종료되면 마지막에
+        ("budget", {"reason": ..., "usage": ...}) 이벤트를 반환합니다.
+        """
+        return self._astream(state, stream_mode, budget, thread_id, "astream")
+
+    async def _astream(
+        self,
+        state: SupervisorState,
+        stream_mode: Sequence[str],
+        budget: Optional[RunBudget],
+        thread_id: Optional[str],
+        run_mode: str,
+    ) -> AsyncIterator[tuple[str, Any]]:
+        graph, config = self._prepare(state, budget, thread_id)
+
+        self.logger.info(f"Streaming graph with state: {state}")
+        snapshot = await graph.aget_state(config) if graph.checkpointer else None
+        graph_input = self._resume_input(state, snapshot)
+        tracker = BudgetTracker(budget) if budget else None
+        memo = new_run_memo()
+        # supervisor hop 수를 집계하기 위해 updates 이벤트는 항상 구독
+        modes = list(dict.fromkeys([*stream_mode, "updates"]))
+        queue: asyncio.Queue = asyncio.Queue()
+
+        # 그래프는 별도 task에서 실행하고, 제한 시간이 지나면 task를 취소함
+        # 이벤트를 소비하는 쪽의 context와 섞이지 않도록 span은 그래프 task 안에서만 활성화
+        span = tracer.start_span(
+            "graph run", kind="run", mode=run_mode, thread_id=thread_id
+        )
+
+        async def produce():
+            token = tracer.activate(span)
+            try:
+                with budget_scope(tracker), memo_scope(memo):
+                    async for event in graph.astream(
+                        graph_input, config=config, stream_mode=modes
+                    ):
+                        queue.put_nowait(event)
+            finally:
+                tracer.deactivate(token)
+                queue.put_nowait(None)
+
+        hops, reason = 0, None
+        with timed(GRAPH_RUN_SECONDS, mode=run_mode):
+            task = asyncio.create_task(produce())
+            try:
+                while True:
+                    timeout = tracker.remaining_seconds() if tracker else None
+                    event = await asyncio.wait_for(queue.get(), timeout)
+                    if event is None:
+                        break
+                    mode, chunk = event
+                    if mode == "updates":
+                        hops = (chunk.get("supervisor") or {}).get("hops", hops)
+                        reason = (chunk.get("supervisor") or {}).get(
+                            "stopped_reason", reason
+                        )
+                    if mode in stream_mode:
+                        yield mode, chunk
+                await task
+            except asyncio.TimeoutError:
+                reason = "deadline"
+            except (BudgetExceededError, GraphRecursionError) as e:
+                reason = self._stopped_reason(e)
+            except Exception as e:
+                span.record_error(e)
+                raise
+            finally:
+                if not task.done():
+                    task.cancel()
+                    with suppress(asyncio.CancelledError):
+                        await task
+                span.set_attribute("hops", hops)
+                span.set_attribute("stopped_reason", reason)
+                tracer.end_span(span)
+
+        observe_hops(hops)
+        self._log_memo(memo)
+        if reason is not None:
+            self._log_stopped(reason, tracker)
+            usage = tracker.usage() if tracker else None
+            yield "budget", {"reason": reason, "usage": usage}
+        self.logger.info("Streaming completed")
+
+    def _prepare(
+        self,
+        state: SupervisorState,
+        budget: Optional[RunBudget],
+        thread_id: Optional[str],
+    ) -> tuple[Pregel, RunnableConfig]:
+        """실행할 그래프와 config를 준비합니다."""
+        assert self._graph is not None, "Graph is not built"
+        state["members"] = self.members
+        # 이전 턴의 라우팅 상태가 이어지지 않도록 실행마다 초기화
+        for key, value in (("hops", 0), ("routed_by", None), ("stopped_reason", None)):
+            state.setdefault(key, value)
+
+        # LLM 클라이언트는 checkpoint에 저장되지 않도록 state 대신 config로 전달
+        config: RunnableConfig = {"configurable": {"llm": state.pop("llm", None)}}
+        # supervisor와 worker가 번갈아 실행되므로 hop 하나에 두 단계가 필요
+        if budget is not None and budget.max_hops is not None:
+            config["recursion_limit"] = 2 * budget.max_hops + 4
+
+        if thread_id is None:
+            return self._graph, config
+        if self._thread_graph is None:
+            self.logger.warning(
+                f"No checkpointer configured, running thread {thread_id} without history"
+            )
+            return self._graph, config
+        config["configurable"]["thread_id"] = thread_id
+        return self._thread_graph, config
+
+    def _resume_input(
+        self, state: SupervisorState, snapshot: Optional[StateSnapshot]
+    ) -> Optional[SupervisorState]:
+        """같은 질문으로 중단된 실행이 있으면 마지막으로 완료된 노드부터 이어서 실행합니다.
+
+        다른 질문이면 중단된 작업은 버리고 새 턴으로 실행합니다.
+        """
+        if snapshot is None or not snapshot.next:
+            return state
+        if _last_query(snapshot.values.get("messages", [])) != _last_query(
+            state["messages"]
+        ):
+            return state
+
+        self.logger.info(f"Resuming interrupted run at {list(snapshot.next)}")
+        return None
+
     def run(self): ...
 
+    @staticmethod
+    def _stopped_reason(error: Exception) -> str:
+        if isinstance(error, BudgetExceededError):
+            return error.reason
+        return "recursion_limit"
+
+    def _log_stopped(self, reason: Optional[str], tracker: Optional[BudgetTracker]):
+        if reason is not None:
+            usage = tracker.usage() if tracker else {}
+            self.logger.warning(f"Run stopped early ({reason}), usage: {usage}")
+
+    def _log_memo(self, memo: Optional[ToolMemo]):
+        if memo is not None and memo.hits:
+            self.logger.info(f"Reused tool results in run: {memo.stats()}")
+
+    def _as_runnable(self, node: Node, name: str) -> RunnableCallable:
+        """동기(invoke)/비동기(ainvoke) 실행 경로를 모두 갖는 그래프 노드로 변환합니다."""
+
+        def call(state: dict, config: RunnableConfig):
+            return node(self._node_state(node, name, state, config))
+
+        async def acall(state: dict, config: RunnableConfig):
+            return await node.acall(self._node_state(node, name, state, config))
+
+        return RunnableCallable(call, acall, name=name, trace=False)
+
+    def _node_state(
+        self, node: Node, name: str, state: dict, config: RunnableConfig
+    ) -> dict:
+        """노드에 전달할 state를 만듭니다.
+
+        config로 전달된 LLM 클라이언트를 state의 `llm`으로 넘겨주고, compactor가 있으면
+        대화 기록을 압축한 사본을 넘겨줍니다. (그래프 state의 메시지는 바뀌지 않음)
+        """
+        llm = config.get("configurable", {}).get("llm")
+        if llm is not None:
+            state = {**state, "llm": llm}
+        if self.compactor is not None and node.compact_history:
+            state = {
+                **state,
+                "messages": self.compactor.compact(state["messages"], name),
+            }
+        return state
+
     def add_node(self, node: Node):
         self._node_list.append(node)
 
@@ -84,3 +391,11 @@ class SupervisorGraphBuilder(BuilderABC):
 
     def get_members(self) -> list[str]:
         return self.members
+
+
+def _last_query(messages: list) -> Optional[str]:
+    """마지막 사용자 질문 (worker가 반환한 메시지는 name이 있음)"""
+    for message in reversed(convert_to_messages(messages)):
+        if isinstance(message, HumanMessage) and not message.name:
+            return message.content
+    return None
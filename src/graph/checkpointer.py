@@ -0,0 +1,93 @@
+import asyncio
+import os
+import sqlite3
+from typing import Any, AsyncIterator, Dict, Optional, Sequence
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+
+class ThreadedSqliteSaver(SqliteSaver):
+    """비동기 그래프 실행에서도 사용할 수 있는 SQLite checkpointer
+
+    SqliteSaver는 동기 메서드만 제공하므로, 비동기 메서드는 같은 연결을
+    스레드에서 사용하여 구현합니다. (연결 사용은 SqliteSaver의 lock으로 직렬화됨)
+    """
+
+    @classmethod
+    def from_path(cls, path: str) -> "ThreadedSqliteSaver":
+        conn = sqlite3.connect(path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return cls(conn)
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        checkpoints = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for checkpoint in checkpoints:
+            yield checkpoint
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await asyncio.to_thread(
+            self.put, config, checkpoint, metadata, new_versions
+        )
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def aclose(self):
+        def close():
+            with self.lock:
+                self.conn.close()
+
+        await asyncio.to_thread(close)
+
+
+def create_checkpointer(
+    backend: Optional[str] = None, path: Optional[str] = None
+) -> Optional[BaseCheckpointSaver]:
+    """환경변수 설정에 따라 대화 스레드용 checkpointer를 생성합니다.
+
+    - CHECKPOINT_BACKEND: sqlite(기본), memory 또는 none(사용 안 함)
+    - CHECKPOINT_PATH: sqlite 파일 경로
+    """
+    backend = (backend or os.getenv("CHECKPOINT_BACKEND", "sqlite")).lower()
+    if backend == "none":
+        return None
+    if backend == "memory":
+        return MemorySaver()
+    if backend == "sqlite":
+        return ThreadedSqliteSaver.from_path(
+            path or os.getenv("CHECKPOINT_PATH", "checkpoints.sqlite3")
+        )
+    raise ValueError(f"Unknown checkpoint backend: {backend}")
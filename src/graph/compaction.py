@@ -0,0 +1,137 @@
+import os
+import threading
+from functools import lru_cache
+from typing import List, Optional
+
+import tiktoken
+from langchain_core.messages import BaseMessage, convert_to_messages
+
+from src.utils.logger import setup_logger
+from src.utils.metrics import observe_prompt_tokens
+
+logger = setup_logger("market_agent.compaction")
+
+
+class TokenCounter:
+    """tiktoken 기반 로컬 토큰 계산기
+
+    BPE 파일을 받을 수 없는 환경(오프라인 등)에서는 UTF-8 바이트 수로 추정합니다.
+    """
+
+    def __init__(self, model: str = "gpt-4o-mini"):
+        self.model = model
+        self._encoding = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def encoding(self) -> Optional[tiktoken.Encoding]:
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self._encoding = self._load_encoding()
+                    self._loaded = True
+        return self._encoding
+
+    def _load_encoding(self) -> Optional[tiktoken.Encoding]:
+        try:
+            try:
+                return tiktoken.encoding_for_model(self.model)
+            except KeyError:
+                return tiktoken.get_encoding("o200k_base")
+        except Exception as e:
+            logger.warning(f"tiktoken encoding unavailable, estimating tokens: {e}")
+            return None
+
+    def count(self, text: str) -> int:
+        return _count_tokens(self, text)
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        encoding = self.encoding
+        if encoding is None:
+            # 바이트 수 추정과 같은 비율로 문자 수를 자름
+            ratio = max_tokens / max(self.count(text), 1)
+            return text[: int(len(text) * ratio)]
+        return encoding.decode(encoding.encode(text)[:max_tokens])
+
+
+@lru_cache(maxsize=4096)
+def _count_tokens(counter: TokenCounter, text: str) -> int:
+    # 같은 worker 결과가 hop마다 반복해서 계산되므로 캐시
+    encoding = counter.encoding
+    if encoding is None:
+        return (len(text.encode("utf-8")) + 3) // 4
+    return len(encoding.encode(text))
+
+
+class MessageCompactor:
+    """LLM에 전달하는 대화 기록이 토큰 한도를 넘지 않도록 오래된 worker 결과를 줄입니다.
+
+    사용자 메시지와 최근 keep_recent개의 worker 결과는 그대로 두고, 오래된 worker 결과부터
+    앞부분(excerpt_tokens)만 남깁니다. 노드에 전달하는 사본만 바꾸므로 그래프 state에는
+    전체 내용이 그대로 남아 최종 답변과 보고서 작성에 사용됩니다.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int = 8000,
+        keep_recent: int = 2,
+        excerpt_tokens: int = 300,
+        counter: Optional[TokenCounter] = None,
+    ):
+        self.max_tokens = max_tokens
+        self.keep_recent = keep_recent
+        self.excerpt_tokens = excerpt_tokens
+        self.counter = counter or TokenCounter()
+
+    @classmethod
+    def from_env(cls) -> "MessageCompactor":
+        """환경변수로부터 생성합니다.
+
+        - MESSAGE_COMPACTION_MAX_TOKENS: 대화 기록 토큰 한도 (0이면 사용 안 함)
+        - MESSAGE_COMPACTION_KEEP_RECENT: 줄이지 않는 최근 worker 결과 수
+        - MESSAGE_COMPACTION_EXCERPT_TOKENS: 줄인 worker 결과에 남기는 토큰 수
+        """
+        return cls(
+            max_tokens=int(os.getenv("MESSAGE_COMPACTION_MAX_TOKENS", "8000")),
+            keep_recent=int(os.getenv("MESSAGE_COMPACTION_KEEP_RECENT", "2")),
+            excerpt_tokens=int(os.getenv("MESSAGE_COMPACTION_EXCERPT_TOKENS", "300")),
+        )
+
+    def count(self, messages: List[BaseMessage]) -> int:
+        return sum(self.counter.count(_text(message)) for message in messages)
+
+    def compact(self, messages: list, node: str = "") -> List[BaseMessage]:
+        messages = convert_to_messages(messages)
+        if self.max_tokens <= 0:
+            return messages
+
+        total = self.count(messages)
+        workers = [i for i, message in enumerate(messages) if message.name]
+        candidates = workers[: max(len(workers) - self.keep_recent, 0)]
+
+        compacted, changed = list(messages), False
+        for i in candidates:
+            if total <= self.max_tokens:
+                break
+            text = _text(messages[i])
+            tokens = self.counter.count(text)
+            if tokens <= self.excerpt_tokens:
+                continue
+            excerpt = self.counter.truncate(text, self.excerpt_tokens)
+            content = f"{excerpt}\n... (이전 결과 {tokens} 토큰 중 앞부분만 포함)"
+            saved = tokens - self.counter.count(content)
+            if saved <= 0:
+                continue
+            compacted[i] = messages[i].model_copy(update={"content": content})
+            total -= saved
+            changed = True
+
+        if changed:
+            logger.info(f"Compacted history for {node}: {total} tokens")
+        observe_prompt_tokens(node, total)
+        return compacted
+
+
+def _text(message: BaseMessage) -> str:
+    return message.content if isinstance(message.content, str) else str(message.content)
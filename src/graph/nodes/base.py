@@ -1,40 +1,124 @@
 from abc import ABC, abstractmethod
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+import contextvars
 from functools import wraps
-import time
-from rich.console import Console
+import inspect
+import os
+import threading
+from typing import Any, Awaitable, Callable, Hashable, Iterator, List, Optional
+
+from langchain_core.messages import HumanMessage
+from langgraph.types import Command
 
 from src.models.do import RawResponse
+from src.utils.llm import llm_config_key, llm_registry
 from src.utils.logger import setup_logger
+from src.utils.metrics import NODE_RUN_SECONDS, timed
+from src.utils.resilience import CircuitOpenError, unavailable_upstream
+from src.utils.tracing import tracer
 
-console = Console()
 
+# 직접 호출(`invoke`, `ainvoke`)에서 요청한 LLM. 없으면 노드의 기본 모델을 사용
+_invoke_llm: contextvars.ContextVar[Optional[Any]] = contextvars.ContextVar(
+    "market_agent_invoke_llm", default=None
+)
 
-def logging_node(func):
-    @wraps(func)
-    def wrapper(self, *args, **kwargs):
-        console.print("\n" + "=" * (console.width))
-        logger = setup_logger(f"market_agent.nodes.{self.__class__.__name__.lower()}")
-        logger.info(f"Starting {self.__class__.__name__}...")
 
-        start_time = time.time()
+@contextmanager
+def _invoke_llm_scope(llm: Optional[Any]) -> Iterator[None]:
+    token = _invoke_llm.set(llm)
+    try:
+        yield
+    finally:
+        _invoke_llm.reset(token)
+
+
+class NodeTimeoutError(Exception):
+    """노드 실행이 제한 시간(timeout) 안에 끝나지 않은 경우"""
+
 
-        # 함수 실행
-        result = func(self, *args, **kwargs)
+def _node_timeout(name: str) -> Optional[float]:
+    """NODE_<NAME>_TIMEOUT, 없으면 NODE_TIMEOUT (초, 0이면 제한 없음)"""
+    timeout = float(
+        os.getenv(f"NODE_{name.upper()}_TIMEOUT", os.getenv("NODE_TIMEOUT", "120"))
+    )
+    return timeout or None
 
-        end_time = time.time()
-        execution_time = end_time - start_time
 
-        logger.info(
-            f"{self.__class__.__name__} completed successfully. "
-            f"(실행 시간: {execution_time:.4f}초)"
+def _node_call_threads(name: str) -> int:
+    """NODE_<NAME>_CALL_THREADS, 없으면 NODE_CALL_THREADS
+
+    제한 시간이 적용된 동기 실행에 사용하는 노드별 스레드 수. 제한 시간이 지난 호출도
+    HTTP timeout 안에 끝날 때까지 스레드를 점유하므로 노드당 스레드 수를 제한합니다.
+    """
+    return int(
+        os.getenv(
+            f"NODE_{name.upper()}_CALL_THREADS", os.getenv("NODE_CALL_THREADS", "8")
         )
-        console.print("=" * (console.width) + "\n")
+    )
+
+
+@contextmanager
+def _node_span(node: "Node") -> Iterator[None]:
+    name = node.__class__.__name__.lower()
+    with (
+        tracer.span(f"node {name}", kind="node", node=name),
+        timed(NODE_RUN_SECONDS, node=name),
+    ):
+        yield
+
+
+def traced_node(func):
+    """노드 실행(`__call__`, `acall`)을 span과 NODE_RUN_SECONDS 메트릭으로 기록합니다."""
+
+    if inspect.iscoroutinefunction(func):
 
-        return result
+        @wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            with _node_span(self):
+                return await func(self, *args, **kwargs)
+
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        with _node_span(self):
+            return func(self, *args, **kwargs)
 
     return wrapper
 
 
+class AgentCache:
+    """LLM 설정별로 생성한 에이전트를 보관하는 LRU 캐시
+
+    같은 설정의 에이전트는 한 번만 생성되도록 생성 중에는 lock을 유지합니다.
+    """
+
+    def __init__(self, max_size: int = 8):
+        self.max_size = max_size
+        self._agents: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, llm: Any, build: Callable[[Any], Any]) -> Any:
+        key = llm_config_key(llm)
+        with self._lock:
+            agent = self._agents.get(key)
+            if agent is None:
+                agent = build(llm)
+                self._agents[key] = agent
+                if len(self._agents) > self.max_size:
+                    self._agents.popitem(last=False)
+            else:
+                self._agents.move_to_end(key)
+            return agent
+
+    def __len__(self) -> int:
+        return len(self._agents)
+
+
 # TODO : singletone 로거 적용
 # TODO : 에이전트의 기능 구현시 노드 내에서 완료 또는 노드+서비스
 
@@ -45,16 +129,181 @@ class Node(ABC):
         self._logger_name = f"market_agent.nodes.{self.__class__.__name__.lower()}"
         self.logger = setup_logger(self._logger_name)
         self.DEFAULT_LLM_MODEL = "gpt-4o-mini"
+        # supervisor 사전 라우팅(임베딩 분류)에 사용하는 노드 설명
+        self.description = None
+        # False이면 대화 기록을 압축하지 않고 전체 내용을 전달 (보고서 작성 노드 등)
+        self.compact_history = True
+        self._agents = AgentCache(int(os.getenv("NODE_AGENT_CACHE_SIZE", "8")))
+        # 실행 제한 시간. 초과하면 기다리지 않고 supervisor에 소스를 사용할 수 없다고 알림
+        self.timeout = _node_timeout(self.name)
+        self._call_pool: Optional[ThreadPoolExecutor] = None
+        self._call_pool_lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        """노드 이름 (API 경로, 환경변수, worker 메시지 이름에 사용)"""
+        return self.__class__.__name__.lower().replace("node", "")
 
-    @logging_node
+    @property
+    def upstreams(self) -> List[str]:
+        """노드가 사용하는 외부 API 주소. 도구의 `url` 또는 `api_wrapper.base_url`에서 가져옵니다."""
+        urls = []
+        for tool in getattr(self, "tools", []):
+            wrapper = getattr(tool, "api_wrapper", None)
+            url = getattr(tool, "url", None) or getattr(wrapper, "base_url", None)
+            if isinstance(url, str):
+                urls.append(url)
+        return urls
+
+    @property
+    def default_llm(self):
+        """직접 호출(`_invoke`)에 사용하는 LLM.
+
+        `invoke(query, llm)`로 요청한 LLM이 있으면 그것을, 없으면 공유 클라이언트
+        레지스트리의 DEFAULT_LLM_MODEL을 사용합니다.
+        """
+        return _invoke_llm.get() or llm_registry.get(self.DEFAULT_LLM_MODEL)
+
+    def get_agent(self, llm: Any) -> Any:
+        """llm 설정(model, temperature, max_tokens)에 맞는 에이전트를 반환합니다.
+
+        에이전트는 설정마다 처음 요청될 때 한 번만 생성(`_build_agent`)됩니다.
+        """
+        return self._agents.get(llm, self._build_agent)
+
+    def _build_agent(self, llm: Any) -> Any:
+        raise NotImplementedError(f"{self.__class__.__name__} does not use an agent")
+
+    @traced_node
     def __call__(self, *args, **kwargs):
-        return self._run(*args, **kwargs)
+        breaker = unavailable_upstream(self.upstreams)
+        if breaker is not None:
+            return self._source_unavailable(
+                CircuitOpenError(breaker.host, breaker.retry_after())
+            )
+        try:
+            return self._call_with_timeout(self._run, *args, **kwargs)
+        except (CircuitOpenError, NodeTimeoutError) as e:
+            return self._source_unavailable(e)
+
+    @traced_node
+    async def acall(self, *args, **kwargs):
+        breaker = unavailable_upstream(self.upstreams)
+        if breaker is not None:
+            return self._source_unavailable(
+                CircuitOpenError(breaker.host, breaker.retry_after())
+            )
+        try:
+            return await self._await_with_timeout(self._arun(*args, **kwargs))
+        except (CircuitOpenError, NodeTimeoutError) as e:
+            return self._source_unavailable(e)
+
+    async def _await_with_timeout(self, coro: Awaitable) -> Any:
+        """비동기 실행에 제한 시간을 적용합니다. 시간이 지나면 작업을 취소합니다."""
+        task = asyncio.ensure_future(coro)
+        try:
+            done, _ = await asyncio.wait({task}, timeout=self.timeout)
+            if not done:
+                raise NodeTimeoutError(
+                    f"Node '{self.name}' did not finish within {self.timeout}s"
+                )
+            return task.result()
+        finally:
+            task.cancel()
+
+    def _call_with_timeout(self, fn: Callable, *args, **kwargs):
+        """동기 실행에 제한 시간을 적용합니다.
+
+        스레드는 강제로 중단할 수 없으므로 노드 전용 스레드 풀에서 실행하고 제한 시간이
+        지나면 결과를 기다리지 않습니다. (남은 외부 호출은 HTTP timeout 안에 끝남)
+        스레드 풀의 크기가 제한되어 있으므로 풀이 모두 사용 중이면 대기 시간도 제한 시간에 포함됩니다.
+        """
+        if self.timeout is None:
+            return fn(*args, **kwargs)
+
+        context = contextvars.copy_context()
+        future = self._get_call_pool().submit(context.run, fn, *args, **kwargs)
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            # 아직 시작하지 못한 호출은 실행하지 않음
+            future.cancel()
+            raise NodeTimeoutError(
+                f"Node '{self.name}' did not finish within {self.timeout}s"
+            ) from None
+
+    def _get_call_pool(self) -> ThreadPoolExecutor:
+        with self._call_pool_lock:
+            if self._call_pool is None:
+                self._call_pool = ThreadPoolExecutor(
+                    _node_call_threads(self.name),
+                    thread_name_prefix=f"node-{self.name}-call",
+                )
+            return self._call_pool
+
+    def _source_unavailable(self, error: Exception) -> Command:
+        """외부 소스를 사용할 수 없을 때 supervisor에 바로 돌려줄 결과"""
+        self.logger.warning(f"Source unavailable for {self.name}: {error}")
+        return Command(
+            update={
+                "messages": [
+                    HumanMessage(
+                        content=f"데이터 소스를 일시적으로 사용할 수 없어 {self.name} 작업을 건너뜁니다: {error}",
+                        name=self.name,
+                    )
+                ]
+            },
+            goto="supervisor",
+        )
 
     @abstractmethod
     def _run(self, *args, **kwargs): ...
 
+    async def _arun(self, *args, **kwargs):
+        """비동기 실행. 구현하지 않은 노드는 스레드에서 `_run`을 실행합니다."""
+        return await asyncio.to_thread(self._run, *args, **kwargs)
+
     @abstractmethod
     def _invoke(self, query: str) -> RawResponse: ...
 
-    def invoke(self, query: str) -> RawResponse:
-        return self._invoke(query)
+    async def _ainvoke(self, query: str) -> RawResponse:
+        """비동기 직접 호출. 구현하지 않은 노드는 스레드에서 `_invoke`를 실행합니다."""
+        return await asyncio.to_thread(self._invoke, query)
+
+    def invoke(self, query: str, llm: Optional[Any] = None) -> RawResponse:
+        with _invoke_llm_scope(llm):
+            try:
+                return self._unavailable_response() or self._call_with_timeout(
+                    self._invoke, query
+                )
+            except (CircuitOpenError, NodeTimeoutError) as e:
+                return self._unavailable_answer(e)
+
+    async def ainvoke(self, query: str, llm: Optional[Any] = None) -> RawResponse:
+        with _invoke_llm_scope(llm):
+            try:
+                return self._unavailable_response() or await self._await_with_timeout(
+                    self._ainvoke(query)
+                )
+            except (CircuitOpenError, NodeTimeoutError) as e:
+                return self._unavailable_answer(e)
+
+    def _unavailable_response(self) -> Optional[RawResponse]:
+        breaker = unavailable_upstream(self.upstreams)
+        if breaker is None:
+            return None
+        return self._unavailable_answer(
+            CircuitOpenError(breaker.host, breaker.retry_after())
+        )
+
+    def _unavailable_answer(self, error: Exception) -> RawResponse:
+        """직접 호출에서 외부 소스를 사용할 수 없을 때의 답변"""
+        self.logger.warning(f"Source unavailable for {self.name}: {error}")
+        return RawResponse(
+            answer=f"데이터 소스를 일시적으로 사용할 수 없습니다: {error}"
+        )
+
+    @property
+    def supports_async(self) -> bool:
+        """`_ainvoke`를 직접 구현해 이벤트 루프에서 실행할 수 있는 노드인지 여부"""
+        return type(self)._ainvoke is not Node._ainvoke
@@ -1,4 +1,3 @@
-from langchain_openai import ChatOpenAI
 from langgraph.prebuilt import create_react_agent
 from langgraph.types import Command
 from langchain_core.messages import HumanMessage
@@ -11,25 +10,35 @@ from src.tools.google_searcher.tool import GoogleSearch
 class GoogleSearcherNode(Node):
     def __init__(self):
         super().__init__()
+        self.description = "구글 웹 검색으로 해외 뉴스와 일반 정보를 찾습니다. google web search, global news"
         self.system_prompt = (
             "You are a news search agent for financial news using google search api."
             "Only use financial source and data to conduct US stock market analysis."
             "Do nothing else"
             "print result in Korean"
         )
-        self.agent = None
         self.tools = [GoogleSearch()]
 
     def _run(self, state: dict) -> dict:
-        if self.agent is None:
-            assert state["llm"] is not None, "The State model should include llm"
-            llm = state["llm"]
-            self.agent = create_react_agent(
-                llm,
-                self.tools,
-                prompt=self.system_prompt,
-            )
-        result = self.agent.invoke(state)
+        result = self._get_agent(state).invoke(state)
+        return self._to_command(result)
+
+    async def _arun(self, state: dict) -> dict:
+        result = await self._get_agent(state).ainvoke(state)
+        return self._to_command(result)
+
+    def _get_agent(self, state: dict):
+        assert state["llm"] is not None, "The State model should include llm"
+        return self.get_agent(state["llm"])
+
+    def _build_agent(self, llm):
+        return create_react_agent(
+            llm,
+            self.tools,
+            prompt=self.system_prompt,
+        )
+
+    def _to_command(self, result: dict) -> Command:
         self.logger.info(f"   result: \n{result['messages'][-1].content}")
         return Command(
             update={
@@ -44,10 +53,11 @@ class GoogleSearcherNode(Node):
         )
 
     def _invoke(self, query: str) -> RawResponse:
-        agent = self.agent or create_react_agent(
-            ChatOpenAI(model=self.DEFAULT_LLM_MODEL),
-            self.tools,
-            prompt=self.system_prompt,
-        )
+        agent = self.get_agent(self.default_llm)
         result = agent.invoke({"messages": [("human", query)]})
         return RawResponse(answer=result["messages"][-1].content)
+
+    async def _ainvoke(self, query: str) -> RawResponse:
+        agent = self.get_agent(self.default_llm)
+        result = await agent.ainvoke({"messages": [("human", query)]})
+        return RawResponse(answer=result["messages"][-1].content)
@@ -1,7 +1,6 @@
 from langgraph.prebuilt import create_react_agent
 from langgraph.types import Command
 from langchain_core.messages import HumanMessage
-from langchain_openai import ChatOpenAI
 
 from src.graph.nodes.base import Node
 from src.models.do import RawResponse
@@ -11,6 +10,7 @@ from src.tools.hantoo_stock.tool import HantooFinancialStatementTool
 class HantooFinancialAnalyzerNode(Node):
     def __init__(self):
         super().__init__()
+        self.description = "한국 상장 기업의 재무제표(대차대조표, 손익계산서)와 재무비율을 분석합니다. 종목코드 삼성전자 005930 재무 분석"
         self.system_prompt = (
             "You are a financial statement analysis agent using Korea Investment & Securities API. "
             "Your task is to analyze balance sheets, income statements, and financial ratios "
@@ -19,22 +19,30 @@ class HantooFinancialAnalyzerNode(Node):
             "Present your findings clearly and concisely, but do not provide investment advice or recommendations. "
             "If a specific stock code isn't mentioned, ask for clarification."
         )
-        self.agent = None
         self.tools = [HantooFinancialStatementTool()]
 
     def _run(self, state: dict) -> Command:
-        if self.agent is None:
-            assert state["llm"] is not None, "The State model should include llm"
-            llm = state["llm"]
-            self.agent = create_react_agent(
-                llm,
-                self.tools,
-                prompt=self.system_prompt,
-            )
+        # Run the agent
+        result = self._get_agent(state).invoke(state)
+        return self._to_command(result)
 
+    async def _arun(self, state: dict) -> Command:
         # Run the agent
-        result = self.agent.invoke(state)
+        result = await self._get_agent(state).ainvoke(state)
+        return self._to_command(result)
+
+    def _get_agent(self, state: dict):
+        assert state["llm"] is not None, "The State model should include llm"
+        return self.get_agent(state["llm"])
+
+    def _build_agent(self, llm):
+        return create_react_agent(
+            llm,
+            self.tools,
+            prompt=self.system_prompt,
+        )
 
+    def _to_command(self, result: dict) -> Command:
         self.logger.info(
             f"Financial analysis result: \n{result['messages'][-1].content}"
         )
@@ -62,14 +70,15 @@ class HantooFinancialAnalyzerNode(Node):
         )
 
     def _invoke(self, query: str) -> RawResponse:
-        agent = self.agent or create_react_agent(
-            ChatOpenAI(model=self.DEFAULT_LLM_MODEL),
-            self.tools,
-            prompt=self.system_prompt,
-        )
+        agent = self.get_agent(self.default_llm)
         result = agent.invoke({"messages": [("human", query)]})
         return RawResponse(answer=result["messages"][-1].content)
 
+    async def _ainvoke(self, query: str) -> RawResponse:
+        agent = self.get_agent(self.default_llm)
+        result = await agent.ainvoke({"messages": [("human", query)]})
+        return RawResponse(answer=result["messages"][-1].content)
+
     def _extract_stock_code_from_result(self, result_text: str) -> str:
         """Extract stock code from result text"""
         import re
@@ -1,4 +1,3 @@
-from langchain_openai import ChatOpenAI
 from langgraph.prebuilt import create_react_agent
 from langgraph.types import Command
 from langchain_core.messages import HumanMessage
@@ -11,24 +10,36 @@ from src.tools.naver_searcher.tool import NaverNewsSearch
 class NaverNewsSearcherNode(Node):
     def __init__(self):
         super().__init__()
+        self.description = (
+            "네이버 뉴스 검색으로 국내 최신 뉴스 기사를 찾습니다. 한국 뉴스, 기사, 속보"
+        )
         self.system_prompt = (
             "You are a news search agent for korean news using naver search api."
             "Only use korean source and data to conduct news search."
             "Do nothing else"
         )
-        self.agent = None
         self.tools = [NaverNewsSearch(sort="date")]
 
     def _run(self, state: dict) -> dict:
-        if self.agent is None:
-            assert state["llm"] is not None, "The State model should include llm"
-            llm = state["llm"]
-            self.agent = create_react_agent(
-                llm,
-                self.tools,
-                prompt=self.system_prompt,
-            )
-        result = self.agent.invoke(state)
+        result = self._get_agent(state).invoke(state)
+        return self._to_command(result)
+
+    async def _arun(self, state: dict) -> dict:
+        result = await self._get_agent(state).ainvoke(state)
+        return self._to_command(result)
+
+    def _get_agent(self, state: dict):
+        assert state["llm"] is not None, "The State model should include llm"
+        return self.get_agent(state["llm"])
+
+    def _build_agent(self, llm):
+        return create_react_agent(
+            llm,
+            self.tools,
+            prompt=self.system_prompt,
+        )
+
+    def _to_command(self, result: dict) -> Command:
         self.logger.info(f"   result: \n{result['messages'][-1].content}")
         return Command(
             update={
@@ -43,10 +54,11 @@ class NaverNewsSearcherNode(Node):
         )
 
     def _invoke(self, query: str) -> RawResponse:
-        agent = self.agent or create_react_agent(
-            ChatOpenAI(model=self.DEFAULT_LLM_MODEL),
-            self.tools,
-            prompt=self.system_prompt,
-        )
+        agent = self.get_agent(self.default_llm)
         result = agent.invoke({"messages": [("human", query)]})
         return RawResponse(answer=result["messages"][-1].content)
+
+    async def _ainvoke(self, query: str) -> RawResponse:
+        agent = self.get_agent(self.default_llm)
+        result = await agent.ainvoke({"messages": [("human", query)]})
+        return RawResponse(answer=result["messages"][-1].content)
@@ -1,6 +1,5 @@
 import os
 
-from langchain_openai import ChatOpenAI
 from langgraph.prebuilt import create_react_agent
 from langgraph.types import Command
 from langchain_core.messages import HumanMessage
@@ -11,8 +10,10 @@ from src.graph.nodes.base import Node
 class ReportAssistantNode(Node):
     def __init__(self):
         super().__init__()
-        self.agent = None
+        self.description = "수집된 정보를 마크다운 보고서 형식으로 정리합니다. 보고서 작성, 리포트 정리, report"
         self.llm = None
+        # 보고서는 수집된 worker 결과 전체를 바탕으로 작성
+        self.compact_history = False
         self.template_path = os.path.join("assets", "report_template.md")
         self.tools = [ReadFileTool()]
 
@@ -32,16 +33,25 @@ class ReportAssistantNode(Node):
         """
 
     def _run(self, state: dict) -> dict:
-        if self.agent is None:
-            llm = state["llm"]
-            self.agent = create_react_agent(
-                llm,
-                self.tools,
-                prompt=self.template_instruction,
-            )
+        result = self._get_agent(state).invoke(state)
+        return self._to_command(result)
 
-        result = self.agent.invoke(state)
+    async def _arun(self, state: dict) -> dict:
+        result = await self._get_agent(state).ainvoke(state)
+        return self._to_command(result)
 
+    def _get_agent(self, state: dict):
+        assert state["llm"] is not None, "The State model should include llm"
+        return self.get_agent(state["llm"])
+
+    def _build_agent(self, llm):
+        return create_react_agent(
+            llm,
+            self.tools,
+            prompt=self.template_instruction,
+        )
+
+    def _to_command(self, result: dict) -> Command:
         return Command(
             update={
                 "messages": [
@@ -55,15 +65,17 @@ class ReportAssistantNode(Node):
         )
 
     def _invoke(self, query: str) -> dict:
-        agent = self.agent or create_react_agent(
-            ChatOpenAI(model=self.DEFAULT_LLM_MODEL),
-            self.tools,
-            prompt=self.template_instruction,
-        )
+        agent = self.get_agent(self.default_llm)
 
         result = agent.invoke({"messages": [("human", query)]})
         return result["messages"][-1].content
 
+    async def _ainvoke(self, query: str) -> dict:
+        agent = self.get_agent(self.default_llm)
+
+        result = await agent.ainvoke({"messages": [("human", query)]})
+        return result["messages"][-1].content
+
     def _load_template(self):
         """템플릿 파일을 직접 읽어오는 메서드"""
         try:
@@ -1,4 +1,3 @@
-from langchain_openai import ChatOpenAI
 from langgraph.prebuilt import create_react_agent
 from langgraph.types import Command
 from langchain_core.messages import HumanMessage
@@ -16,7 +15,6 @@ class RSSFeederBase(Node):
             "If rss feed is not related to the query, do nothing."
             "Do nothing else"
         )
-        self.agent = None
         self.tools = [
             RSSFeederTool(
                 url="https://www.chosun.com/arc/outboundfeeds/rss/category/economy/?outputType=xml"
@@ -24,15 +22,25 @@ class RSSFeederBase(Node):
         ]
 
     def _run(self, state: dict) -> dict:
-        if self.agent is None:
-            assert state["llm"] is not None, "The State model should include llm"
-            llm = state["llm"]
-            self.agent = create_react_agent(
-                llm,
-                self.tools,
-                prompt=self.system_prompt,
-            )
-        result = self.agent.invoke(state)
+        result = self._get_agent(state).invoke(state)
+        return self._to_command(result)
+
+    async def _arun(self, state: dict) -> dict:
+        result = await self._get_agent(state).ainvoke(state)
+        return self._to_command(result)
+
+    def _get_agent(self, state: dict):
+        assert state["llm"] is not None, "The State model should include llm"
+        return self.get_agent(state["llm"])
+
+    def _build_agent(self, llm):
+        return create_react_agent(
+            llm,
+            self.tools,
+            prompt=self.system_prompt,
+        )
+
+    def _to_command(self, result: dict) -> Command:
         self.logger.info(f"   result: \n{result['messages'][-1].content}")
         return Command(
             update={
@@ -47,18 +55,20 @@ class RSSFeederBase(Node):
         )
 
     def _invoke(self, query: str) -> RawResponse:
-        agent = self.agent or create_react_agent(
-            ChatOpenAI(model=self.DEFAULT_LLM_MODEL),
-            self.tools,
-            prompt=self.system_prompt,
-        )
+        agent = self.get_agent(self.default_llm)
         result = agent.invoke({"messages": [("human", query)]})
         return RawResponse(answer=result["messages"][-1].content)
 
+    async def _ainvoke(self, query: str) -> RawResponse:
+        agent = self.get_agent(self.default_llm)
+        result = await agent.ainvoke({"messages": [("human", query)]})
+        return RawResponse(answer=result["messages"][-1].content)
+
 
 class ChosunRSSFeederNode(RSSFeederBase):
     def __init__(self):
         super().__init__()
+        self.description = "조선일보(조선비즈) 경제 뉴스 RSS 피드에서 국내 경제 기사를 가져옵니다. chosun economy news"
         self.tools = [
             RSSFeederTool(
                 url="https://www.chosun.com/arc/outboundfeeds/rss/category/economy/?outputType=xml"
@@ -69,6 +79,7 @@ class ChosunRSSFeederNode(RSSFeederBase):
 class WSJEconomyRSSFeederNode(RSSFeederBase):
     def __init__(self):
         super().__init__()
+        self.description = "월스트리트저널(WSJ) 경제 뉴스 RSS 피드에서 미국/글로벌 경제 기사를 가져옵니다. WSJ economy news"
         self.tools = [
             RSSFeederTool(
                 url="https://feeds.content.dowjones.io/public/rss/socialeconomyfeed"
@@ -79,6 +90,7 @@ class WSJEconomyRSSFeederNode(RSSFeederBase):
 class WSJMarketRSSFeederNode(RSSFeederBase):
     def __init__(self):
         super().__init__()
+        self.description = "월스트리트저널(WSJ) 마켓 RSS 피드에서 미국 증시와 시장 기사를 가져옵니다. WSJ markets stock market news"
         self.tools = [
             RSSFeederTool(
                 url="https://feeds.content.dowjones.io/public/rss/RSSMarketsMain"
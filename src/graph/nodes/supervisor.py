@@ -1,15 +1,29 @@
-from typing import TypedDict
+import os
+from typing import Optional, TypedDict
 
 from langgraph.graph import END
 from langgraph.types import Command
 
 from src.graph.nodes.base import Node
+from src.graph.pre_router import FastPathRouter
+from src.utils.budget import current_budget
 
 
 class SupervisorNode(Node):
-    def __init__(self):
+    def __init__(
+        self,
+        max_parallel: Optional[int] = None,
+        pre_router: Optional[FastPathRouter] = None,
+    ):
         super().__init__()
         self.members = []
+        self.pre_router = pre_router
+        # supervisor는 worker가 아니므로 노드 제한 시간 대신 실행 예산(RUN_DEADLINE_SECONDS)을 따름
+        self.timeout = None
+        # 한 번에 동시에 실행할 수 있는 worker 수 (1이면 순차 실행)
+        self.max_parallel = max_parallel or int(
+            os.getenv("SUPERVISOR_MAX_PARALLEL", "4")
+        )
         self.system_prompt_template = (
             "You are a supervisor tasked with managing a conversation between the"
             " following workers: {members}. Given the following user request and"
@@ -18,30 +32,126 @@ class SupervisorNode(Node):
             " Each worker will perform a task and respond with their results and status."
             " When the full task is completed, respond with FINISH."
         )
+        self.parallel_prompt = (
+            " If several workers can work independently of each other (for example,"
+            " gathering news from different sources), respond with all of them at"
+            " once (up to {max_parallel}) so they run in parallel. Only select"
+            " workers together when none of them needs another's result."
+        )
 
     @property
     def system_prompt(self):
-        return self.system_prompt_template.format(members=", ".join(self.members))
+        prompt = self.system_prompt_template.format(members=", ".join(self.members))
+        if self.max_parallel > 1:
+            prompt += self.parallel_prompt.format(max_parallel=self.max_parallel)
+        return prompt
 
     def _run(self, state: dict) -> dict:
+        command = self._budget_stop(state) or self._fast_path(state)
+        if command is not None:
+            return command
+
+        llm = state["llm"]
+        response = llm.with_structured_output(Router).invoke(self._messages(state))
+        return self._route(state, response)
+
+    async def _arun(self, state: dict) -> dict:
+        command = self._budget_stop(state) or self._fast_path(state)
+        if command is not None:
+            return command
+
         llm = state["llm"]
+        response = await llm.with_structured_output(Router).ainvoke(
+            self._messages(state)
+        )
+        return self._route(state, response)
+
+    def _messages(self, state: dict) -> list:
         self.members = state["members"]
 
         self.logger.info(f"prompt: {self.system_prompt}")
 
-        messages = [
+        return [
             {"role": "system", "content": self.system_prompt},
         ] + state["messages"]
 
-        response = llm.with_structured_output(Router).invoke(messages)
-        goto = response["next"]
-        if goto == "FINISH":
+    def _budget_stop(self, state: dict) -> Optional[Command]:
+        """실행 예산이 소진되었으면 worker로 넘기지 않고 종료합니다.
+
+        지금까지 worker가 반환한 메시지는 state에 남아 있으므로 부분 결과로 사용됩니다.
+        """
+        tracker = current_budget()
+        if tracker is None:
+            return None
+        reason = tracker.exhausted(hops=state.get("hops", 0))
+        if reason is None:
+            return None
+
+        self.logger.warning(f"Run budget exhausted ({reason}), stopping early")
+        return Command(goto=END, update={"next": END, "stopped_reason": reason})
+
+    def _fast_path(self, state: dict) -> Optional[Command]:
+        """사전 라우터로 supervisor LLM 호출을 건너뜁니다.
+
+        첫 hop에서 사전 라우터가 worker를 결정하면 바로 이동하고,
+        단일 의도 요청이면 그 worker들이 응답한 뒤 LLM에 FINISH를 묻지 않고 종료합니다.
+        보고서 작성, 비교처럼 여러 단계가 필요한 요청은 이후 단계를 LLM이 결정합니다.
+        """
+        if state.get("routed_by"):
+            self.logger.info(f"Fast path ({state['routed_by']}) completed")
+            return Command(goto=END, update={"next": END})
+        if self.pre_router is None or state.get("hops", 0) > 0:
+            return None
+
+        decision = self.pre_router.route(
+            state["messages"][-1].content, state["members"]
+        )
+        if decision is None:
+            return None
+
+        self.logger.info(
+            f"Fast path ({decision.source}, confidence: {decision.confidence:.2f})"
+            f" -> {decision.workers}"
+        )
+        command = self._route(state, {"next": decision.workers})
+        if command.goto != END and decision.final:
+            command.update["routed_by"] = decision.source
+        return command
+
+    def _route(self, state: dict, response: dict) -> Command:
+        """선택된 worker로 이동합니다.
+
+        여러 worker가 선택되면 같은 단계에서 동시에 실행되며, 각 worker의 메시지가
+        state에 합쳐진 뒤 supervisor가 다시 호출됩니다.
+        FINISH이거나 유효한 worker가 없으면 종료합니다.
+        """
+        selected = response["next"]
+        if isinstance(selected, str):
+            selected = [selected]
+
+        workers = []
+        for worker in selected:
+            if worker in state["members"]:
+                if worker not in workers:
+                    workers.append(worker)
+            elif worker != "FINISH":
+                self.logger.warning(f"Ignoring unknown worker: {worker}")
+        workers = workers[: self.max_parallel]
+
+        if not workers:
             goto = END
+        elif len(workers) == 1:
+            goto = workers[0]
+        else:
+            self.logger.info(f"Dispatching workers in parallel: {workers}")
+            goto = workers
 
+        hops = state.get("hops", 0)
         return Command(
             goto=goto,
             update={
                 "next": goto,
+                "hops": hops if goto == END else hops + 1,
             },
         )
 
@@ -49,4 +159,6 @@ class SupervisorNode(Node):
 
 
 class Router(TypedDict):
+    """다음에 실행할 worker 목록. 여러 개를 선택하면 동시에 실행됩니다."""
+
     next: list[str]
@@ -1,7 +1,8 @@
+from typing import Optional
+
 from langgraph.prebuilt import create_react_agent
 from langgraph.types import Command
 from langchain_core.messages import HumanMessage
-from langchain_openai import ChatOpenAI
 import logging
 import datetime
 import os
@@ -16,6 +17,7 @@ from src.tools.us_stock.tool import USFinancialStatementTool
 class USFinancialAnalyzerNode(Node):
     def __init__(self):
         super().__init__()
+        self.description = "미국 주식의 재무제표, 수익성, 안정성을 분석합니다. US stock financial statements, ticker AAPL MSFT profitability stability"
         self.system_prompt = (
             "You are a financial statement analysis agent for US stocks. "
             "Your task is to analyze balance sheets, income statements, and financial ratios "
@@ -25,7 +27,6 @@ class USFinancialAnalyzerNode(Node):
             "Only if no company name or ticker can be identified, ask for clarification. "
             "Always include the analyzed ticker symbol in your response using this format: 'Ticker: XXX'."
         )
-        self.agent = None
         self.tools = [USFinancialStatementTool()]
 
         # Configure logging
@@ -60,112 +61,169 @@ class USFinancialAnalyzerNode(Node):
         self.logger.info(f"[{start_time}] 실행 시작: _run 메소드")
 
         try:
-            # Initialize agent if needed
-            if self.agent is None:
-                assert state["llm"] is not None, "The State model should include llm"
-                llm = state["llm"]
+            agent = self._get_agent(state)
+            extracted_ticker = self._extract_ticker_from_state(state)
 
-                # Log LLM initialization
-                self.logger.info(f"에이전트 초기화 중: LLM 타입 = {type(llm).__name__}")
+            # Execute agent
+            self.logger.debug("금융 분석 에이전트 실행 중")
+            agent_start_time = self._get_current_time()
 
-                # LLM 참조를 도구의 속성에 추가
-                self.tools[0].llm = llm
+            try:
+                # Execute agent
+                result = agent.invoke(state)
+            except Exception as e:
+                error_msg = f"에이전트 실행 실패: {str(e)}"
+                self.logger.error(error_msg)
+                # Re-raise to be handled by the graph
+                raise
 
-                self.logger.debug(
-                    "ReAct 에이전트 생성 중 (도구 및 시스템 프롬프트 설정)"
-                )
-                self.agent = create_react_agent(
-                    llm,
-                    self.tools,
-                    prompt=self.system_prompt,
-                )
-                self.logger.info("에이전트 초기화 완료")
+            command = self._to_command(result, extracted_ticker, agent_start_time)
 
-            # 사용자 메시지 추출
-            user_message = state["messages"][-1].content
-            safe_message = (
-                user_message[:100] + "..." if len(user_message) > 100 else user_message
-            )
-            self.logger.info(f"사용자 쿼리 처리 중: '{safe_message}'")
+            end_time = self._get_current_time()
+            self.logger.info(f"[{end_time}] _run 메소드 실행 완료")
+            return command
 
-            # Extract ticker symbol
-            self.logger.debug("티커 심볼 추출 시도 중")
-            try:
-                extracted_ticker = self.tools[0]._extract_ticker(user_message)
+        except Exception as e:
+            self.logger.error(f"_run 메소드에서 오류 발생: {str(e)}", exc_info=True)
+            # Re-raise for proper error handling in the graph
+            raise
 
-                ticker_extraction_success = True
-                self.logger.info(f"티커 추출 결과: {extracted_ticker}")
-                self.logger.info(f"티커 추출 성공 여부: {ticker_extraction_success}")
-            except Exception as e:
-                ticker_extraction_success = False
-                extracted_ticker = None
-                error_msg = f"티커 추출 실패: {str(e)}"
-                self.logger.error(error_msg)
-                self.logger.error(f"티커 추출 성공 여부: {ticker_extraction_success}")
+    # LangSmith 추적 데코레이터 적용
+    @trace_run(name="us_financial_analyzer_arun")
+    async def _arun(self, state: dict) -> Command:
+        start_time = self._get_current_time()
+        self.logger.info(f"[{start_time}] 실행 시작: _arun 메소드")
+
+        try:
+            agent = self._get_agent(state)
+            extracted_ticker = await self._aextract_ticker_from_state(state)
 
             # Execute agent
-            self.logger.debug("금융 분석 에이전트 실행 중")
+            self.logger.debug("금융 분석 에이전트 비동기 실행 중")
             agent_start_time = self._get_current_time()
 
             try:
                 # Execute agent
-                result = self.agent.invoke(state)
-
-                # Get analysis content
-                analysis_text = result["messages"][-1].content
-
-                # Truncate log output to prevent overwhelming logs
-                log_analysis_preview = (
-                    analysis_text[:200] + "..."
-                    if len(analysis_text) > 200
-                    else analysis_text
-                )
-                agent_end_time = self._get_current_time()
-                self.logger.info(
-                    f"금융 분석 완료, 결과 미리보기: \n{log_analysis_preview}"
-                )
-                self.logger.debug(
-                    f"에이전트 실행 시간: {agent_start_time} ~ {agent_end_time}"
-                )
-
+                result = await agent.ainvoke(state)
             except Exception as e:
                 error_msg = f"에이전트 실행 실패: {str(e)}"
                 self.logger.error(error_msg)
                 # Re-raise to be handled by the graph
                 raise
 
-            # Use extracted ticker or set as unknown
-            ticker = extracted_ticker if extracted_ticker else "unknown"
-            self.logger.info(f"최종 사용 티커: {ticker}")
-
-            # Create command for next step
-            command = Command(
-                update={
-                    "messages": [
-                        HumanMessage(
-                            content=analysis_text,
-                            name="us_financial_analyzer",
-                        )
-                    ],
-                    # Store analysis results in structured format
-                    "financial_analysis": {
-                        "ticker": ticker,
-                        "market": "US",
-                        "analysis_text": analysis_text,
-                    },
-                },
-                goto="supervisor",
-            )
+            command = self._to_command(result, extracted_ticker, agent_start_time)
 
             end_time = self._get_current_time()
-            self.logger.info(f"[{end_time}] _run 메소드 실행 완료")
+            self.logger.info(f"[{end_time}] _arun 메소드 실행 완료")
             return command
 
         except Exception as e:
-            self.logger.error(f"_run 메소드에서 오류 발생: {str(e)}", exc_info=True)
+            self.logger.error(f"_arun 메소드에서 오류 발생: {str(e)}", exc_info=True)
             # Re-raise for proper error handling in the graph
             raise
 
+    def _get_agent(self, state: dict):
+        assert state["llm"] is not None, "The State model should include llm"
+        return self.get_agent(state["llm"])
+
+    def _build_agent(self, llm):
+        # Log LLM initialization
+        self.logger.info(f"에이전트 초기화 중: LLM 타입 = {type(llm).__name__}")
+
+        self.logger.debug("ReAct 에이전트 생성 중 (도구 및 시스템 프롬프트 설정)")
+        agent = create_react_agent(
+            llm,
+            [self._tool_for(llm)],
+            prompt=self.system_prompt,
+        )
+        self.logger.info("에이전트 초기화 완료")
+        return agent
+
+    def _tool_for(self, llm) -> USFinancialStatementTool:
+        # 요청마다 LLM 설정이 다를 수 있으므로 공유 도구 대신 LLM을 지정한 사본을 사용
+        tool = self.tools[0].model_copy()
+        tool.llm = llm
+        return tool
+
+    def _user_query(self, state: dict) -> str:
+        # 사용자 메시지 추출
+        user_message = state["messages"][-1].content
+        safe_message = (
+            user_message[:100] + "..." if len(user_message) > 100 else user_message
+        )
+        self.logger.info(f"사용자 쿼리 처리 중: '{safe_message}'")
+
+        # Extract ticker symbol
+        self.logger.debug("티커 심볼 추출 시도 중")
+        return user_message
+
+    def _extract_ticker_from_state(self, state: dict) -> Optional[str]:
+        user_message = self._user_query(state)
+        try:
+            extracted_ticker = self._tool_for(state["llm"])._extract_ticker(
+                user_message
+            )
+
+            ticker_extraction_success = True
+            self.logger.info(f"티커 추출 결과: {extracted_ticker}")
+            self.logger.info(f"티커 추출 성공 여부: {ticker_extraction_success}")
+        except Exception as e:
+            ticker_extraction_success = False
+            extracted_ticker = None
+            error_msg = f"티커 추출 실패: {str(e)}"
+            self.logger.error(error_msg)
+            self.logger.error(f"티커 추출 성공 여부: {ticker_extraction_success}")
+        return extracted_ticker
+
+    async def _aextract_ticker_from_state(self, state: dict) -> Optional[str]:
+        user_message = self._user_query(state)
+        try:
+            extracted_ticker = await self._tool_for(state["llm"])._aextract_ticker(
+                user_message
+            )
+            self.logger.info(f"티커 추출 결과: {extracted_ticker}")
+        except Exception as e:
+            extracted_ticker = None
+            self.logger.error(f"티커 추출 실패: {str(e)}")
+        return extracted_ticker
+
+    def _to_command(
+        self, result: dict, extracted_ticker: Optional[str], agent_start_time: str
+    ) -> Command:
+        # Get analysis content
+        analysis_text = result["messages"][-1].content
+
+        # Truncate log output to prevent overwhelming logs
+        log_analysis_preview = (
+            analysis_text[:200] + "..." if len(analysis_text) > 200 else analysis_text
+        )
+        agent_end_time = self._get_current_time()
+        self.logger.info(f"금융 분석 완료, 결과 미리보기: \n{log_analysis_preview}")
+        self.logger.debug(f"에이전트 실행 시간: {agent_start_time} ~ {agent_end_time}")
+
+        # Use extracted ticker or set as unknown
+        ticker = extracted_ticker if extracted_ticker else "unknown"
+        self.logger.info(f"최종 사용 티커: {ticker}")
+
+        # Create command for next step
+        return Command(
+            update={
+                "messages": [
+                    HumanMessage(
+                        content=analysis_text,
+                        name="us_financial_analyzer",
+                    )
+                ],
+                # Store analysis results in structured format
+                "financial_analysis": {
+                    "ticker": ticker,
+                    "market": "US",
+                    "analysis_text": analysis_text,
+                },
+            },
+            goto="supervisor",
+        )
+
     # LangSmith 추적 데코레이터 적용
     @trace_run(name="us_financial_analyzer_invoke")
     def _invoke(self, query: str) -> RawResponse:
@@ -176,25 +234,7 @@ class USFinancialAnalyzerNode(Node):
             safe_query = query[:100] + "..." if len(query) > 100 else query
             self.logger.info(f"쿼리로 직접 호출: '{safe_query}'")
 
-            # Initialize agent if needed
-            agent = self.agent
-            if agent is None:
-                self.logger.debug("직접 호출을 위한 새 에이전트 생성 중")
-                default_llm = ChatOpenAI(model=self.DEFAULT_LLM_MODEL)
-
-                agent = create_react_agent(
-                    default_llm,
-                    self.tools,
-                    prompt=self.system_prompt,
-                )
-
-            # Set LLM in tool if needed
-            if not hasattr(self.tools[0], "llm") or self.tools[0].llm is None:
-                default_llm = ChatOpenAI(model=self.DEFAULT_LLM_MODEL)
-                self.tools[0].llm = default_llm
-                self.logger.debug(
-                    f"금융 도구에 기본 LLM 설정: {self.DEFAULT_LLM_MODEL}"
-                )
+            agent = self.get_agent(self.default_llm)
 
             # Execute agent
             self.logger.debug("직접 쿼리로 에이전트 실행 중")
@@ -220,3 +260,24 @@ class USFinancialAnalyzerNode(Node):
 
             # Return error response
             return RawResponse(answer=f"금융 분석 중 오류가 발생했습니다: {str(e)}")
+
+    # LangSmith 추적 데코레이터 적용
+    @trace_run(name="us_financial_analyzer_ainvoke")
+    async def _ainvoke(self, query: str) -> RawResponse:
+        start_time = self._get_current_time()
+        self.logger.info(f"[{start_time}] 직접 호출 시작: _ainvoke 메소드")
+
+        try:
+            agent = self.get_agent(self.default_llm)
+            result = await agent.ainvoke({"messages": [("human", query)]})
+            response_content = result["messages"][-1].content
+
+            end_time = self._get_current_time()
+            self.logger.info(
+                f"[{end_time}] _ainvoke 메소드 실행 완료, 응답 길이: {len(response_content)}"
+            )
+            return RawResponse(answer=response_content)
+
+        except Exception as e:
+            self.logger.error(f"_ainvoke 메소드에서 오류 발생: {str(e)}", exc_info=True)
+            return RawResponse(answer=f"금융 분석 중 오류가 발생했습니다: {str(e)}")
@@ -1,5 +1,4 @@
 from langchain_milvus import Milvus
-from langchain_openai import ChatOpenAI
 from langgraph.types import Command
 from langchain_core.messages import HumanMessage
 from langchain_core.prompts import ChatPromptTemplate
@@ -17,6 +16,7 @@ class WeeklyReporterNode(Node):
         vector_store: Milvus,
     ):
         super().__init__()
+        self.description = "JP모건 주간 시장 리캡 보고서를 바탕으로 주간 시장 동향을 답변합니다. weekly market recap JPMorgan"
         self.retriever = vector_store.as_retriever()
         template = """
 You are a weekly reporter that reports the weekly market recap of JPMorgan.
@@ -35,7 +35,7 @@ Question:
 
 Answer:"""
         self.prompt = ChatPromptTemplate.from_template(template)
-        self.chain = None
+        # 지정하면 기본/요청 LLM 대신 사용
         self.llm = None
 
     def _run(self, state: dict) -> dict:
@@ -43,6 +43,14 @@ Answer:"""
         # TODO: 버그 픽스, state에서 llm을 가져오면 chain.invoke에서 query key 오류 발생
         # self.llm = state["llm"]
         result = self._get_chain().invoke(state["messages"][-1].content)
+        return self._to_command(result)
+
+    async def _arun(self, state: dict) -> dict:
+        assert state["llm"] is not None, "The State model should include llm"
+        result = await self._get_chain().ainvoke(state["messages"][-1].content)
+        return self._to_command(result)
+
+    def _to_command(self, result: str) -> Command:
         self.logger.info(f"   result: {result}")
         return Command(
             update={
@@ -60,14 +68,17 @@ Answer:"""
         result = self._get_chain().invoke(query)
         return RawResponse(answer=result)
 
+    async def _ainvoke(self, query: str) -> RawResponse:
+        result = await self._get_chain().ainvoke(query)
+        return RawResponse(answer=result)
+
     def _get_chain(self):
-        if not self.llm:
-            self.llm = ChatOpenAI(model=self.DEFAULT_LLM_MODEL)
-        if not self.chain:
-            self.chain = (
-                {"context": self.retriever, "query": RunnablePassthrough()}
-                | self.prompt
-                | self.llm
-                | StrOutputParser()
-            )
-        return self.chain
+        return self.get_agent(self.llm or self.default_llm)
+
+    def _build_agent(self, llm):
+        return (
+            {"context": self.retriever, "query": RunnablePassthrough()}
+            | self.prompt
+            | llm
+            | StrOutputParser()
+        )
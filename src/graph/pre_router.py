@@ -0,0 +1,299 @@
+import hashlib
+import math
+import os
+import re
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from langchain_core.embeddings import Embeddings
+from pydantic import BaseModel
+
+from src.utils.metrics import record_pre_route
+
+
+class RouteDecision(BaseModel):
+    workers: list[str]
+    confidence: float
+    source: str
+    # 선택된 worker의 응답만으로 요청이 끝나는지 여부 (False이면 이후 단계는 supervisor LLM이 결정)
+    final: bool = True
+
+
+class PreRouter(ABC):
+    """supervisor LLM을 호출하기 전에 요청을 worker로 바로 보낼 수 있는지 판단합니다."""
+
+    name: str = "pre_router"
+
+    def fit(self, descriptions: Dict[str, str]):
+        """그래프 빌드 시 worker 이름과 설명으로 한 번 호출됩니다."""
+
+    @abstractmethod
+    def route(self, query: str, members: Sequence[str]) -> Optional[RouteDecision]:
+        """확신할 수 있으면 RouteDecision을, 아니면 None을 반환합니다."""
+
+
+class RouteRule(NamedTuple):
+    worker: str
+    pattern: re.Pattern
+    # 다른 규칙이 하나도 맞지 않았을 때만 적용되는 일반 규칙 여부
+    generic: bool = False
+    # 이 패턴이 맞으면 규칙을 적용하지 않음
+    unless: Optional[re.Pattern] = None
+
+
+# 사전 라우팅에 사용하는 미국 주식 티커. 대문자 단어를 모두 티커로 보면 I, US, GDP 같은
+# 일반 약어도 맞으므로, `$TICKER` 형태가 아니면 이 목록에 있는 티커만 인정
+KNOWN_TICKERS = frozenset(
+    """
+    AAPL MSFT GOOGL GOOG AMZN NVDA META TSLA NFLX AVGO ORCL CRM ADBE AMD INTC QCOM
+    CSCO IBM TXN MU PLTR UBER SHOP PYPL SQ COIN BRK JPM BAC WFC GS MS AXP BLK
+    JNJ PFE MRK ABBV LLY UNH TMO WMT COST HD LOW TGT NKE SBUX MCD KO PEP PG DIS
+    CMCSA VZ XOM CVX COP BA CAT GE MMM HON LMT RTX GM TSM ASML BABA
+    """.split()
+)
+
+# 티커와 철자가 같더라도 질문에서 일반 약어로 더 자주 쓰이는 단어
+COMMON_ACRONYMS = frozenset(
+    """
+    I A AI US USA UK EU GDP CPI PPI ETF CEO CFO CTO IPO EPS PER PBR ROE ROA FOMC
+    FED IMF OECD KOSPI KRX API IT PC TV OK Q
+    """.split()
+)
+
+_TICKERS = "|".join(sorted(KNOWN_TICKERS - COMMON_ACRONYMS))
+_ACRONYMS = "|".join(sorted(COMMON_ACRONYMS))
+# 한글 조사가 바로 붙는 경우("AAPL의")도 있어 \b 대신 영문자 경계만 확인
+_TICKER = rf"(?<![A-Za-z])(?:{_TICKERS})(?![A-Za-z])"
+_FINANCIAL_KEYWORDS = (
+    r"재무|수익성|안정성|(?i:financial|profitability|stability"
+    r"|balance\s+sheet|income\s+statement)"
+)
+
+# 뉴스 출처. 출처만 있고 주제가 맞지 않으면 일반 뉴스 검색으로 보내지 않고 LLM에 맡김
+_CHOSUN = r"조선(?:일보|비즈)?|chosun"
+_WSJ = r"wsj|월스트리트\s*저널|wall\s+street\s+journal"
+_NEWS_SOURCES = rf"{_CHOSUN}|{_WSJ}"
+
+
+def _source_topic(source: str, topic: str) -> re.Pattern:
+    """출처와 주제가 붙어 있을 때만 맞는 패턴을 만듭니다.
+
+    "WSJ 경제", "월스트리트저널의 증시", "economy news from WSJ"는 맞지만
+    "Chosun economy headlines and WSJ markets"의 economy처럼 다른 출처에 붙은 주제는 제외합니다.
+    """
+    return re.compile(
+        rf"(?:{source})(?:'s|의|에서)?\s*(?:{topic})"
+        rf"|(?:{topic})\s+(?:news\s+|뉴스\s*)?(?:from|by|in|on)\s+(?:the\s+)?(?:{source})",
+        re.IGNORECASE,
+    )
+
+
+# 여러 단계(보고서 작성, 비교, 순차 작업)가 필요한 요청. 첫 worker는 사전 라우팅하더라도
+# 이후 단계는 supervisor LLM이 결정해야 함
+MULTI_STEP_PATTERN = re.compile(
+    r"보고서|리포트|레포트|비교|그리고|하고|한\s*(뒤|후|다음)|다음에"
+    r"|\b(report|compare|comparison|versus|vs|and\s+then|then|after\s+that)\b",
+    re.IGNORECASE,
+)
+
+DEFAULT_RULES = [
+    RouteRule(
+        "weeklyreporternode",
+        re.compile(
+            r"주간\s*(시장\s*)?리캡|weekly\s+(market\s+)?recap|jp\s*morgan|jp\s*모건",
+            re.IGNORECASE,
+        ),
+    ),
+    RouteRule("chosunrssfeedernode", re.compile(_CHOSUN, re.IGNORECASE)),
+    RouteRule("wsjeconomyrssfeedernode", _source_topic(_WSJ, r"경제|economy")),
+    RouteRule("wsjmarketrssfeedernode", _source_topic(_WSJ, r"시장|증시|마켓|market")),
+    # `$TICKER` 형태이거나, 알려진 티커와 재무 관련 키워드가 함께 있을 때만 적용
+    RouteRule(
+        "usfinancialanalyzernode",
+        re.compile(
+            rf"\$(?!(?:{_ACRONYMS})(?![A-Za-z]))[A-Z]{{1,5}}(?![A-Za-z])"
+            rf"|{_TICKER}.*(?:{_FINANCIAL_KEYWORDS})"
+            rf"|(?:{_FINANCIAL_KEYWORDS}).*{_TICKER}"
+        ),
+    ),
+    RouteRule(
+        "navernewssearchernode",
+        re.compile(r"뉴스|기사|속보|헤드라인"),
+        generic=True,
+        unless=re.compile(_NEWS_SOURCES, re.IGNORECASE),
+    ),
+]
+
+
+class RuleRouter(PreRouter):
+    """키워드/정규식 규칙 기반 라우터. 여러 worker의 규칙이 맞으면 모두 선택합니다."""
+
+    name = "rule"
+
+    def __init__(self, rules: Sequence[RouteRule] = DEFAULT_RULES):
+        self.rules = list(rules)
+
+    def route(self, query: str, members: Sequence[str]) -> Optional[RouteDecision]:
+        specific, generic = [], []
+        for rule in self.rules:
+            if rule.worker not in members or not rule.pattern.search(query):
+                continue
+            if rule.unless is not None and rule.unless.search(query):
+                continue
+            matched = generic if rule.generic else specific
+            if rule.worker not in matched:
+                matched.append(rule.worker)
+
+        workers = specific or generic
+        if not workers:
+            return None
+        return RouteDecision(workers=workers, confidence=1.0, source=self.name)
+
+
+class HashingEmbeddings(Embeddings):
+    """외부 호출 없이 문자 n-gram 해싱으로 계산하는 가벼운 로컬 임베딩
+
+    한국어와 영어 모두 형태소 분석 없이 동작하며, worker 설명과의
+    유사도 비교처럼 짧은 텍스트 분류에 사용합니다.
+    """
+
+    def __init__(self, dimensions: int = 1024, ngram_range: tuple = (2, 3)):
+        self.dimensions = dimensions
+        self.ngram_range = ngram_range
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        vector = [0.0] * self.dimensions
+        for token in text.casefold().split():
+            token = f" {token} "
+            for n in range(self.ngram_range[0], self.ngram_range[1] + 1):
+                for i in range(len(token) - n + 1):
+                    digest = hashlib.blake2b(
+                        token[i : i + n].encode("utf-8"), digest_size=8
+                    ).digest()
+                    index = int.from_bytes(digest, "little")
+                    sign = 1.0 if index & 1 else -1.0
+                    vector[(index >> 1) % self.dimensions] += sign
+        norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+        return [value / norm for value in vector]
+
+
+class EmbeddingRouter(PreRouter):
+    """worker 설명과의 임베딩 유사도로 worker를 하나 선택합니다.
+
+    가장 높은 유사도가 threshold 이상이고 두 번째와의 차이가 min_margin 이상일 때만
+    결정하며, 그렇지 않으면 supervisor LLM에 맡깁니다.
+    """
+
+    name = "embedding"
+
+    def __init__(
+        self,
+        embeddings: Optional[Embeddings] = None,
+        threshold: float = 0.3,
+        min_margin: float = 0.1,
+    ):
+        self.embeddings = embeddings or HashingEmbeddings()
+        self.threshold = threshold
+        self.min_margin = min_margin
+        self._vectors: Dict[str, List[float]] = {}
+
+    def fit(self, descriptions: Dict[str, str]):
+        names = list(descriptions)
+        vectors = self.embeddings.embed_documents([descriptions[n] for n in names])
+        self._vectors = dict(zip(names, vectors))
+
+    def scores(self, query: str, members: Sequence[str]) -> Dict[str, float]:
+        candidates = [member for member in members if member in self._vectors]
+        if not candidates:
+            return {}
+        query_vector = self.embeddings.embed_query(query)
+        return {
+            member: _cosine(query_vector, self._vectors[member])
+            for member in candidates
+        }
+
+    def route(self, query: str, members: Sequence[str]) -> Optional[RouteDecision]:
+        ranked = sorted(self.scores(query, members).items(), key=lambda item: -item[1])
+        if not ranked:
+            return None
+        worker, best = ranked[0]
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0.0
+        if best < self.threshold or best - runner_up < self.min_margin:
+            return None
+        return RouteDecision(workers=[worker], confidence=best, source=self.name)
+
+
+class FastPathRouter:
+    """여러 PreRouter를 순서대로 적용하고, 결정하지 못하면 supervisor LLM으로 넘깁니다.
+
+    결정 출처(rule, embedding, llm)별 횟수를 집계하여 short-circuit 비율을 제공합니다.
+    """
+
+    def __init__(self, routers: Sequence[PreRouter]):
+        self.routers = list(routers)
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "FastPathRouter":
+        """환경변수로부터 라우터를 생성합니다.
+
+        - PRE_ROUTER_ENABLED: false이면 항상 supervisor LLM을 사용
+        - PRE_ROUTER_EMBEDDING_THRESHOLD: 임베딩 분류기 최소 유사도
+        - PRE_ROUTER_EMBEDDING_MARGIN: 1, 2위 유사도의 최소 차이
+        """
+        if os.getenv("PRE_ROUTER_ENABLED", "true").lower() in ("0", "false", "no"):
+            return cls([])
+        return cls(
+            [
+                RuleRouter(),
+                EmbeddingRouter(
+                    threshold=float(os.getenv("PRE_ROUTER_EMBEDDING_THRESHOLD", "0.3")),
+                    min_margin=float(os.getenv("PRE_ROUTER_EMBEDDING_MARGIN", "0.1")),
+                ),
+            ]
+        )
+
+    def fit(self, descriptions: Dict[str, str]):
+        for router in self.routers:
+            router.fit(descriptions)
+
+    def route(self, query: str, members: Sequence[str]) -> Optional[RouteDecision]:
+        decision = None
+        for router in self.routers:
+            decision = router.route(query, members)
+            if decision is not None:
+                decision.final = not is_multi_step(query)
+                break
+        self._count(decision.source if decision else "llm")
+        return decision
+
+    def _count(self, source: str):
+        with self._lock:
+            self._counts[source] = self._counts.get(source, 0) + 1
+        record_pre_route(source)
+
+    def stats(self) -> Dict:
+        counts = dict(self._counts)
+        total = sum(counts.values())
+        short_circuited = total - counts.get("llm", 0)
+        return {
+            "requests": total,
+            "decisions": counts,
+            "short_circuit_rate": short_circuited / total if total else 0.0,
+        }
+
+
+def is_multi_step(query: str) -> bool:
+    """보고서 작성, 비교, 순차 작업처럼 worker 하나로 끝나지 않는 요청인지 확인합니다."""
+    return MULTI_STEP_PATTERN.search(query) is not None
+
+
+def _cosine(a: Sequence[float], b: Sequence[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
@@ -1,4 +1,4 @@
-from typing import TypedDict, Annotated, Any
+from typing import TypedDict, Annotated, Any, Union
 
 from langgraph.graph import add_messages
 from langgraph.prebuilt.chat_agent_executor import AgentState
@@ -38,3 +38,11 @@ class SimpleState(TypedDict):
 class SupervisorState(AgentState):
     llm: Any
     members: list[str]
+    # supervisor가 마지막으로 선택한 worker (또는 END)
+    next: Union[str, list[str]]
+    # supervisor가 worker로 작업을 넘긴 횟수
+    hops: int
+    # 사전 라우터가 첫 worker를 결정한 경우 그 출처 (rule, embedding)
+    routed_by: str
+    # 실행 예산 소진으로 조기 종료된 경우 그 이유 (deadline, max_hops 등)
+    stopped_reason: str
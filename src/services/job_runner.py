@@ -0,0 +1,190 @@
+import asyncio
+from typing import Dict, List, Optional
+
+from src.graph.builder import BuilderABC
+from src.models.graph_state import SupervisorState
+from src.services.job_store import JobStore
+from src.utils.budget import RunBudget, stopped_message
+from src.utils.concurrency import PRIORITY_LOW, priority_scope
+from src.utils.llm import LLMRegistry
+from src.utils.logger import setup_logger
+
+logger = setup_logger("market_agent.jobs")
+
+
+class JobRunner:
+    """등록된 분석 작업을 워커 풀에서 실행합니다.
+
+    워커는 그래프 실행 중 worker 노드가 메시지를 반환할 때마다 JobStore에 기록하므로,
+    작업이 끝나기 전에도 진행 중인 메시지를 조회할 수 있습니다.
+    실행 예산이 소진되면 그때까지의 마지막 worker 메시지를 답변으로 완료 처리합니다.
+    그래프 실행은 요청의 thread_id(없으면 작업 ID) 스레드로 checkpoint되므로,
+    서버 재시작으로 중단된 작업은 마지막으로 완료된 노드부터 이어서 실행됩니다.
+    실행 중에는 작업의 lease를 주기적으로 연장하고, 다른 프로세스가 실행하다 종료되어
+    lease가 만료된 작업은 주기적으로 다시 가져와 실행합니다.
+    """
+
+    def __init__(
+        self,
+        graph: BuilderABC,
+        llms: LLMRegistry,
+        store: JobStore,
+        workers: int = 2,
+        budget: Optional[RunBudget] = None,
+    ):
+        self.graph = graph
+        self.llms = llms
+        self.store = store
+        self.budget = budget or RunBudget()
+        self.workers = workers
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self):
+        """워커를 시작하고, 이전 실행에서 끝나지 않은 작업을 다시 등록합니다."""
+        if self._tasks:
+            return
+        pending = await asyncio.to_thread(self.store.recover)
+        for job_id in pending:
+            self._queue.put_nowait(job_id)
+        self._tasks = [
+            asyncio.create_task(self._work(), name=f"job-worker-{i}")
+            for i in range(self.workers)
+        ]
+        self._tasks.append(
+            asyncio.create_task(self._requeue_expired(), name="job-lease-monitor")
+        )
+        logger.info(
+            f"Job runner started with {self.workers} workers "
+            f"({len(pending)} pending jobs recovered)"
+        )
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("Job runner stopped")
+
+    async def submit(self, request: Dict) -> str:
+        """작업을 저장소에 등록하고 실행 대기열에 추가합니다."""
+        job_id = await asyncio.to_thread(self.store.create, request)
+        self._queue.put_nowait(job_id)
+        logger.info(f"Job {job_id} queued: {request.get('query')}")
+        return job_id
+
+    async def get(self, job_id: str) -> Optional[Dict]:
+        return await asyncio.to_thread(self.store.get, job_id)
+
+    async def _work(self):
+        while True:
+            job_id = await self._queue.get()
+            try:
+                # 다른 워커(프로세스)가 먼저 가져간 작업은 건너뜀
+                if await asyncio.to_thread(self.store.claim, job_id):
+                    await self._run_with_lease(job_id)
+            except Exception as e:
+                logger.error(f"Job {job_id} worker error: {str(e)}", exc_info=True)
+            finally:
+                self._queue.task_done()
+
+    async def _run_with_lease(self, job_id: str):
+        """lease를 연장하면서 작업을 실행합니다. lease를 잃으면 실행을 취소합니다."""
+        run = asyncio.create_task(self._run(job_id))
+        heartbeat = asyncio.create_task(self._heartbeat(job_id, run))
+        try:
+            await asyncio.wait({run})
+        finally:
+            heartbeat.cancel()
+            run.cancel()
+        if not run.cancelled():
+            run.result()
+
+    async def _heartbeat(self, job_id: str, run: asyncio.Task):
+        """작업이 실행되는 동안 lease를 연장합니다."""
+        while True:
+            await asyncio.sleep(self.store.lease_seconds / 3)
+            try:
+                renewed = await asyncio.to_thread(self.store.heartbeat, job_id)
+            except Exception as e:
+                logger.error(f"Job {job_id} heartbeat failed: {str(e)}")
+                continue
+            if not renewed:
+                # 다른 워커가 다시 실행하므로 결과를 중복으로 기록하지 않도록 중단
+                logger.warning(f"Job {job_id} lease was lost, cancelling this run")
+                run.cancel()
+                return
+
+    async def _requeue_expired(self):
+        """lease가 만료된 작업(실행하던 프로세스가 종료됨)을 다시 대기열에 추가합니다."""
+        while True:
+            await asyncio.sleep(self.store.lease_seconds)
+            try:
+                expired = await asyncio.to_thread(self.store.requeue_expired)
+            except Exception as e:
+                logger.error(f"Failed to requeue expired jobs: {str(e)}")
+                continue
+            for job_id in expired:
+                logger.warning(f"Job {job_id} lease expired, requeued")
+                self._queue.put_nowait(job_id)
+
+    async def _run(self, job_id: str):
+        job = await asyncio.to_thread(self.store.get, job_id)
+        request = job["request"]
+        logger.info(f"Job {job_id} started: {request['query']}")
+
+        llm = self.llms.get(
+            request.get("model"), request.get("temperature"), request.get("max_tokens")
+        )
+        state = SupervisorState(llm=llm, messages=[("user", request["query"])])
+        budget = self.budget.merge(
+            RunBudget(**request["budget"]) if request.get("budget") else None
+        )
+        thread_id = request.get("thread_id") or job_id
+        answer = ""
+        try:
+            # 백그라운드 작업의 외부 API 호출은 대화형 요청보다 나중에 호출 한도를 받음
+            with priority_scope(PRIORITY_LOW):
+                async for mode, chunk in self.graph.astream(
+                    state, ("updates",), budget, thread_id
+                ):
+                    if mode == "budget":
+                        logger.warning(f"Job {job_id} stopped early: {chunk['reason']}")
+                        answer = answer or stopped_message(chunk["reason"])
+                        continue
+                    messages = _worker_messages(chunk)
+                    if messages:
+                        if not await asyncio.to_thread(
+                            self.store.append_messages, job_id, messages
+                        ):
+                            logger.warning(f"Job {job_id} lease was lost, stopping")
+                            return
+                        answer = messages[-1]["content"]
+        except Exception as e:
+            logger.error(f"Job {job_id} failed: {str(e)}", exc_info=True)
+            if not await asyncio.to_thread(
+                self.store.fail, job_id, f"Error processing query: {str(e)}"
+            ):
+                logger.warning(f"Job {job_id} lease was lost, error discarded")
+            return
+
+        if await asyncio.to_thread(self.store.complete, job_id, answer):
+            logger.info(f"Job {job_id} completed")
+        else:
+            logger.warning(f"Job {job_id} lease was lost, result discarded")
+
+
+def _worker_messages(chunk: Dict) -> List[Dict]:
+    messages = []
+    for node, update in chunk.items():
+        if not update:
+            continue
+        for message in update.get("messages", []):
+            messages.append(
+                {
+                    "node": node,
+                    "name": getattr(message, "name", None),
+                    "content": getattr(message, "content", str(message)),
+                }
+            )
+    return messages
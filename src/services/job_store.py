@@ -0,0 +1,212 @@
+import datetime
+import json
+import os
+import socket
+import sqlite3
+import time
+import uuid
+from contextlib import closing
+from enum import Enum
+from typing import Dict, List, Optional
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class JobStore:
+    """SQLite 기반 분석 작업 저장소
+
+    작업 요청, 상태, 진행 중 메시지와 최종 답변을 저장하여
+    서버가 재시작되어도 결과를 다시 조회할 수 있도록 합니다.
+    여러 프로세스가 같은 파일을 공유할 수 있습니다.
+
+    실행 중인 작업은 lease_seconds 동안 유효한 lease를 가지며, 실행하는 워커가
+    `heartbeat`로 lease를 연장합니다. lease가 만료된 작업(실행하던 프로세스가 종료됨)은
+    `requeue_expired`, `recover`에서 다시 대기 상태로 되돌립니다.
+    """
+
+    def __init__(self, path: str = "jobs.sqlite3", lease_seconds: float = 60.0):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        # 재시작 후 같은 PID가 다시 쓰여도 구분되도록 인스턴스마다 고유한 소유자 ID 사용
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._create_table_if_not_exists()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _create_table_if_not_exists(self):
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    request TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    messages TEXT NOT NULL DEFAULT '[]',
+                    answer TEXT,
+                    error TEXT,
+                    owner TEXT,
+                    lease_until REAL,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+                """
+            )
+            # 이전 버전(owner_pid)으로 만든 파일에 lease 컬럼 추가
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+            for column, column_type in (("owner", "TEXT"), ("lease_until", "REAL")):
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {column_type}")
+
+    def create(self, request: Dict) -> str:
+        """작업을 등록하고 작업 ID를 반환합니다."""
+        job_id = uuid.uuid4().hex
+        now = _now()
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, request, status, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (job_id, json.dumps(request), JobStatus.QUEUED.value, now, now),
+            )
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return _to_dict(row) if row else None
+
+    def claim(self, job_id: str) -> bool:
+        """대기 중인 작업을 현재 프로세스가 실행하도록 선점합니다.
+
+        Returns:
+            bool: 선점에 성공하면 True, 이미 다른 워커가 가져갔으면 False
+        """
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, owner = ?, lease_until = ?, updated_at = ? "
+                "WHERE id = ? AND status = ?",
+                (
+                    JobStatus.RUNNING.value,
+                    self.owner,
+                    time.time() + self.lease_seconds,
+                    _now(),
+                    job_id,
+                    JobStatus.QUEUED.value,
+                ),
+            )
+            return cursor.rowcount == 1
+
+    def heartbeat(self, job_id: str) -> bool:
+        """실행 중인 작업의 lease를 연장합니다.
+
+        Returns:
+            bool: 연장에 성공하면 True, lease가 만료되어 작업을 더 이상 소유하지 않으면 False
+        """
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET lease_until = ? "
+                "WHERE id = ? AND status = ? AND owner = ?",
+                (
+                    time.time() + self.lease_seconds,
+                    job_id,
+                    JobStatus.RUNNING.value,
+                    self.owner,
+                ),
+            )
+            return cursor.rowcount == 1
+
+    # append_messages, complete, fail은 현재 인스턴스가 lease를 가진 실행 중인 작업만 갱신하고,
+    # lease를 잃어 다른 워커가 다시 실행하는 경우 False를 반환합니다.
+
+    def append_messages(self, job_id: str, messages: List[Dict]) -> bool:
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT messages FROM jobs WHERE id = ? AND owner = ? AND status = ?",
+                (job_id, self.owner, JobStatus.RUNNING.value),
+            ).fetchone()
+            if row is None:
+                conn.execute("ROLLBACK")
+                return False
+            stored = json.loads(row["messages"]) + messages
+            conn.execute(
+                "UPDATE jobs SET messages = ?, updated_at = ? WHERE id = ?",
+                (json.dumps(stored, ensure_ascii=False), _now(), job_id),
+            )
+            conn.execute("COMMIT")
+            return True
+
+    def complete(self, job_id: str, answer: str) -> bool:
+        return self._finish(job_id, JobStatus.SUCCEEDED, answer=answer)
+
+    def fail(self, job_id: str, error: str) -> bool:
+        return self._finish(job_id, JobStatus.FAILED, error=error)
+
+    def _finish(
+        self,
+        job_id: str,
+        status: JobStatus,
+        answer: Optional[str] = None,
+        error: Optional[str] = None,
+    ) -> bool:
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, answer = ?, error = ?, lease_until = NULL, "
+                "updated_at = ? WHERE id = ? AND owner = ? AND status = ?",
+                (
+                    status.value,
+                    answer,
+                    error,
+                    _now(),
+                    job_id,
+                    self.owner,
+                    JobStatus.RUNNING.value,
+                ),
+            )
+            return cursor.rowcount == 1
+
+    def requeue_expired(self) -> List[str]:
+        """lease가 만료된 실행 중 작업을 대기 상태로 되돌리고, 그 작업 ID 목록을 반환합니다."""
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                "SELECT id FROM jobs WHERE status = ? "
+                "AND (lease_until IS NULL OR lease_until < ?) ORDER BY created_at",
+                (JobStatus.RUNNING.value, time.time()),
+            ).fetchall()
+            conn.executemany(
+                "UPDATE jobs SET status = ?, owner = NULL, lease_until = NULL, "
+                "updated_at = ? WHERE id = ?",
+                [(JobStatus.QUEUED.value, _now(), row["id"]) for row in rows],
+            )
+            conn.execute("COMMIT")
+        return [row["id"] for row in rows]
+
+    def recover(self) -> List[str]:
+        """lease가 만료된 작업을 대기 상태로 되돌리고, 대기 중인 작업 ID 목록을 반환합니다."""
+        self.requeue_expired()
+        with closing(self._connect()) as conn:
+            queued = conn.execute(
+                "SELECT id FROM jobs WHERE status = ? ORDER BY created_at",
+                (JobStatus.QUEUED.value,),
+            ).fetchall()
+        return [row["id"] for row in queued]
+
+
+def _now() -> str:
+    return datetime.datetime.now().isoformat()
+
+
+def _to_dict(row: sqlite3.Row) -> Dict:
+    job = dict(row)
+    job["request"] = json.loads(job["request"])
+    job["messages"] = json.loads(job["messages"])
+    return job
@@ -0,0 +1,160 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+class NodeSaturatedError(Exception):
+    """노드의 실행 슬롯과 대기열이 모두 찬 경우"""
+
+
+class NodeQueueTimeoutError(Exception):
+    """대기열에서 queue_timeout 안에 실행을 시작하지 못한 경우"""
+
+
+class NodeExecutor:
+    """노드 전용의 크기가 제한된 실행기
+
+    노드마다 별도의 스레드 풀을 사용하므로 느린 노드가 FastAPI 기본 스레드 풀이나
+    다른 노드의 실행을 막지 않습니다. 실행 중인 작업과 대기 중인 작업의 합이
+    max_workers + max_queue에 도달하면 즉시 NodeSaturatedError를 발생시키고,
+    대기열에서 queue_timeout 안에 시작하지 못한 작업은 취소 후
+    NodeQueueTimeoutError를 발생시킵니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int = 2,
+        max_queue: int = 8,
+        queue_timeout: Optional[float] = 30.0,
+    ):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._pool = ThreadPoolExecutor(max_workers, thread_name_prefix=f"node-{name}")
+        self._lock = threading.Lock()
+        self._pending = 0
+        # 비동기 노드의 동시 실행 수 제한 (이벤트 루프에서 처음 사용할 때 생성)
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.rejected = 0
+        self.timed_out = 0
+
+    @classmethod
+    def from_env(cls, name: str) -> "NodeExecutor":
+        """환경변수로부터 실행기를 생성합니다.
+
+        노드별 설정(NODE_<NAME>_MAX_CONCURRENCY 등)이 없으면 공통 설정을 사용합니다.
+        - NODE_MAX_CONCURRENCY: 동시에 실행할 수 있는 요청 수
+        - NODE_MAX_QUEUE: 실행을 기다릴 수 있는 요청 수
+        - NODE_QUEUE_TIMEOUT: 대기열 최대 대기 시간(초, 0이면 제한 없음)
+        """
+
+        def setting(key: str, default: str) -> str:
+            return os.getenv(
+                f"NODE_{name.upper()}_{key}", os.getenv(f"NODE_{key}", default)
+            )
+
+        queue_timeout = float(setting("QUEUE_TIMEOUT", "30"))
+        return cls(
+            name,
+            max_workers=int(setting("MAX_CONCURRENCY", "2")),
+            max_queue=int(setting("MAX_QUEUE", "8")),
+            queue_timeout=queue_timeout or None,
+        )
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        self._acquire()
+
+        try:
+            future = self._pool.submit(fn, *args)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+
+        # 요청이 취소되면 wrap_future가 대기 중인 작업도 함께 취소함
+        wrapped = asyncio.wrap_future(future)
+        if self.queue_timeout is not None:
+            done, _ = await asyncio.wait({wrapped}, timeout=self.queue_timeout)
+            # 이미 실행 중인 작업은 취소되지 않으므로 끝까지 기다림
+            if not done and future.cancel():
+                self.timed_out += 1
+                raise NodeQueueTimeoutError(
+                    f"Node '{self.name}' did not start within {self.queue_timeout}s"
+                )
+        return await wrapped
+
+    async def arun(self, fn: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        """코루틴 함수를 이벤트 루프에서 실행합니다.
+
+        스레드를 점유하지 않지만 `run`과 같은 동시 실행 수, 대기열 크기, 대기 시간 제한을 적용합니다.
+        """
+        self._acquire()
+        try:
+            if self._slots is None:
+                self._slots = asyncio.Semaphore(self.max_workers)
+            try:
+                await asyncio.wait_for(self._slots.acquire(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                self.timed_out += 1
+                raise NodeQueueTimeoutError(
+                    f"Node '{self.name}' did not start within {self.queue_timeout}s"
+                ) from None
+            try:
+                return await fn(*args)
+            finally:
+                self._slots.release()
+        finally:
+            self._release()
+
+    def _acquire(self):
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue:
+                self.rejected += 1
+                raise NodeSaturatedError(f"Node '{self.name}' is saturated")
+            self._pending += 1
+
+    def _release(self):
+        with self._lock:
+            self._pending -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrency": self.max_workers,
+            "max_queue": self.max_queue,
+            "pending": self._pending,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+        }
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+class NodeExecutorPool:
+    """노드 이름별 NodeExecutor를 관리합니다."""
+
+    def __init__(self, factory: Callable[[str], NodeExecutor] = NodeExecutor.from_env):
+        self._factory = factory
+        self._executors: Dict[str, NodeExecutor] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> NodeExecutor:
+        with self._lock:
+            if name not in self._executors:
+                self._executors[name] = self._factory(name)
+            return self._executors[name]
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: executor.stats() for name, executor in self._executors.items()}
+
+    async def shutdown(self):
+        for executor in self._executors.values():
+            executor.shutdown()
@@ -0,0 +1,279 @@
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import closing
+from typing import Any, Dict, Optional, Tuple
+
+from src.utils.metrics import record_cache_lookup
+
+
+def _entry_size(key: str, data: str) -> int:
+    """항목이 차지하는 용량(UTF-8 바이트). 한글은 문자당 3바이트입니다."""
+    return len(key.encode("utf-8")) + len(data.encode("utf-8"))
+
+
+class CacheBackend(ABC):
+    # True이면 디스크 I/O로 블로킹되므로 비동기 경로에서 별도 스레드로 실행
+    blocking: bool = False
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]: ...
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: float): ...
+
+    @abstractmethod
+    def clear(self): ...
+
+
+class MemoryCacheBackend(CacheBackend):
+    """메모리 사용량 상한이 있는 LRU 캐시"""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at, size = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                self._size -= size
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float):
+        size = _entry_size(key, json.dumps(value, ensure_ascii=False))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._size -= self._entries.pop(key)[2]
+            self._entries[key] = (value, time.time() + ttl, size)
+            self._size += size
+            # 가장 오래 사용되지 않은 항목부터 제거
+            while self._size > self.max_bytes:
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self._size -= evicted
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+class DiskCacheBackend(CacheBackend):
+    """SQLite 파일 기반 캐시. 여러 워커 프로세스가 공유할 수 있습니다."""
+
+    blocking = True
+
+    def __init__(
+        self, path: str = "response_cache.sqlite3", max_bytes: int = 256 * 1024 * 1024
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                return None
+            conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any, ttl: float):
+        data = json.dumps(value, ensure_ascii=False)
+        size = _entry_size(key, data)
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?)",
+                (key, data, size, now + ttl, now),
+            )
+            conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+            (total,) = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM cache"
+            ).fetchone()
+            # 가장 오래 사용되지 않은 항목부터 제거
+            for evict_key, evict_size in conn.execute(
+                "SELECT key, size FROM cache ORDER BY accessed_at"
+            ).fetchall():
+                if total <= self.max_bytes:
+                    break
+                conn.execute("DELETE FROM cache WHERE key = ?", (evict_key,))
+                total -= evict_size
+            conn.execute("COMMIT")
+
+    def clear(self):
+        with closing(self._connect()) as conn:
+            conn.execute("DELETE FROM cache")
+
+
+class ResponseCache:
+    """API 응답 캐시
+
+    캐시 키는 엔드포인트, 정규화된 쿼리, 모델, temperature, max_tokens로 구성되며
+    엔드포인트별로 TTL을 다르게 설정할 수 있습니다(TTL 0은 캐시 사용 안 함).
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        default_ttl: float = 300,
+        ttls: Optional[Dict[str, float]] = None,
+    ):
+        self.backend = backend
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> "ResponseCache":
+        """환경변수로부터 캐시를 생성합니다.
+
+        - RESPONSE_CACHE_BACKEND: memory(기본값) 또는 disk
+        - RESPONSE_CACHE_MAX_BYTES: 캐시 용량 상한(바이트)
+        - RESPONSE_CACHE_PATH: disk 백엔드 파일 경로
+        - RESPONSE_CACHE_TTL: 기본 TTL(초)
+        - RESPONSE_CACHE_TTLS: 엔드포인트별 TTL (예: "query=300,weeklyreporter=3600")
+        """
+        max_bytes = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+        if os.getenv("RESPONSE_CACHE_BACKEND", "memory") == "disk":
+            backend = DiskCacheBackend(
+                os.getenv("RESPONSE_CACHE_PATH", "response_cache.sqlite3"), max_bytes
+            )
+        else:
+            backend = MemoryCacheBackend(max_bytes)
+
+        ttls = {}
+        for item in os.getenv("RESPONSE_CACHE_TTLS", "").split(","):
+            if "=" in item:
+                endpoint, ttl = item.split("=", 1)
+                ttls[endpoint.strip()] = float(ttl)
+
+        return cls(
+            backend,
+            default_ttl=float(os.getenv("RESPONSE_CACHE_TTL", 300)),
+            ttls=ttls,
+        )
+
+    def ttl_for(self, endpoint: str) -> float:
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    @staticmethod
+    def make_key(
+        endpoint: str,
+        query: str,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        raw = json.dumps(
+            [endpoint, normalize_query(query), model, temperature, max_tokens]
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, endpoint: str, key: str) -> Optional[Any]:
+        if self.ttl_for(endpoint) <= 0:
+            return None
+        value = self.backend.get(key)
+        self._record(endpoint, value)
+        return value
+
+    def set(self, endpoint: str, key: str, value: Any):
+        ttl = self.ttl_for(endpoint)
+        if ttl > 0:
+            self.backend.set(key, value, ttl)
+
+    async def aget(self, endpoint: str, key: str) -> Optional[Any]:
+        """비동기 라우트용 get. 블로킹 backend는 이벤트 루프 밖에서 조회합니다."""
+        if self.ttl_for(endpoint) <= 0:
+            return None
+        if self.backend.blocking:
+            value = await asyncio.to_thread(self.backend.get, key)
+        else:
+            value = self.backend.get(key)
+        self._record(endpoint, value)
+        return value
+
+    async def aset(self, endpoint: str, key: str, value: Any):
+        """비동기 라우트용 set. 블로킹 backend는 이벤트 루프 밖에서 저장합니다."""
+        ttl = self.ttl_for(endpoint)
+        if ttl <= 0:
+            return
+        if self.backend.blocking:
+            await asyncio.to_thread(self.backend.set, key, value, ttl)
+        else:
+            self.backend.set(key, value, ttl)
+
+    def _record(self, endpoint: str, value: Optional[Any]):
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        record_cache_lookup(endpoint, value is not None)
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+def normalize_query(query: str) -> str:
+    """유니코드 정규화, 대소문자, 공백 차이를 무시하도록 쿼리를 정규화합니다."""
+    return " ".join(unicodedata.normalize("NFKC", query).casefold().split())
+
+
+def parse_cache_control(header: Optional[str]) -> Tuple[bool, bool]:
+    """Cache-Control 헤더를 해석합니다.
+
+    Returns:
+        (캐시 조회 여부, 캐시 저장 여부)
+    """
+    directives = {d.strip().lower() for d in (header or "").split(",")}
+    if "no-store" in directives:
+        return False, False
+    if "no-cache" in directives:
+        return False, True
+    return True, True
@@ -0,0 +1,45 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+
+class SingleFlight:
+    """동일한 키로 동시에 들어온 요청이 하나의 실행 결과를 공유하도록 합니다.
+
+    첫 요청만 실제로 실행되고, 실행이 끝나기 전에 들어온 같은 키의 요청은
+    그 결과(또는 예외)를 함께 받습니다. 실행은 별도 태스크에서 진행되므로
+    대기 중인 요청 하나가 취소되어도 다른 요청에는 영향을 주지 않습니다.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._in_flight.get(key)
+        # 다른 이벤트 루프에서 시작된 실행은 공유할 수 없음
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            self.executions += 1
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Task):
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # 대기 중인 요청이 모두 취소된 경우에도 예외가 조회된 것으로 처리
+        if not task.cancelled():
+            task.exception()
+
+    def is_in_flight(self, key: str) -> bool:
+        return key in self._in_flight
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+        }
@@ -6,13 +6,16 @@ https://programmablesearchengine.google.com/
 
 import json
 from typing import Dict, List
-import urllib.request
-import urllib.parse
 
-import aiohttp
 from langchain_core.utils import get_from_dict_or_env
 from pydantic import BaseModel, ConfigDict, SecretStr, model_validator
 
+from src.utils.cassette import cassette
+from src.utils.concurrency import provider_limiter
+from src.utils.http_client import http_clients
+from src.utils.metrics import track_http
+from src.utils.resilience import breakers
+
 GOOGLE_API_URL = "https://www.googleapis.com/customsearch/v1"
 
 
@@ -21,6 +24,7 @@ class GoogleSearchAPIWrapper(BaseModel):
 
     google_api_key: SecretStr
     google_cse_id: SecretStr
+    base_url: str = GOOGLE_API_URL
 
     model_config = ConfigDict(
         extra="forbid",
@@ -36,6 +40,9 @@ class GoogleSearchAPIWrapper(BaseModel):
         google_cse_id = get_from_dict_or_env(values, "google_cse_id", "GOOGLE_CSE_ID")
         values["google_api_key"] = google_api_key
         values["google_cse_id"] = google_cse_id
+        values["base_url"] = get_from_dict_or_env(
+            values, "base_url", "GOOGLE_API_URL", default=GOOGLE_API_URL
+        )
 
         return values
 
@@ -49,19 +56,25 @@ class GoogleSearchAPIWrapper(BaseModel):
 
         params = {"key": api_key, "cx": cse_id, "q": query}
 
-        # Create a request with the URL and parameters
-        url = f"{GOOGLE_API_URL}?{urllib.parse.urlencode(params)}"
-        request = urllib.request.Request(url)
-
-        try:
-            with urllib.request.urlopen(request) as response:
-                response_code = response.getcode()
-                if response_code == 200:
-                    return json.loads(response.read().decode("utf-8"))
-                else:
-                    raise Exception(f"Error Code: {response_code}")
-        except urllib.error.HTTPError as e:
-            raise Exception(f"Error Code: {e.code}, Reason: {e.reason}")
+        def fetch() -> str:
+            response = http_clients.session().get(
+                self.base_url, params=params, timeout=http_clients.timeout("google")
+            )
+            if response.status_code == 200:
+                return response.content.decode("utf-8")
+            else:
+                raise Exception(
+                    f"Error Code: {response.status_code}, Reason: {response.reason}"
+                )
+
+        # 카세트에는 API 키를 제외한 검색어만 저장
+        with (
+            provider_limiter.limit("google"),
+            breakers.guard(self.base_url),
+            track_http("google"),
+        ):
+            data = cassette.fetch("google", {"q": query}, fetch)
+        return json.loads(data)
 
     def results(
         self,
@@ -90,14 +103,20 @@ class GoogleSearchAPIWrapper(BaseModel):
 
         params = {"key": api_key, "cx": cse_id, "q": query}
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(GOOGLE_API_URL, params=params) as response:
+        async def fetch() -> str:
+            async with http_clients.asession().get(
+                self.base_url, params=params, timeout=http_clients.atimeout("google")
+            ) as response:
                 if response.status == 200:
-                    data = await response.text()
-                    return json.loads(data)
+                    return await response.text()
                 else:
                     raise Exception(f"Error {response.status}: {response.reason}")
 
+        async with provider_limiter.alimit("google"):
+            with breakers.guard(self.base_url), track_http("google"):
+                data = await cassette.afetch("google", {"q": query}, fetch)
+        return json.loads(data)
+
     async def results_async(
         self,
         query: str,
@@ -10,6 +10,7 @@ from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
 
 from src.tools.google_searcher.google_search import GoogleSearchAPIWrapper
+from src.utils.memo import memoize_tool
 
 
 class GoogleInput(BaseModel):
@@ -59,7 +60,7 @@ class GoogleSearchResults(BaseTool):
     ) -> Union[List[Dict], str]:
         """Use the tool."""
         try:
-            return self.api_wrapper.results(query)
+            return self._search(query)
         except Exception as e:
             return repr(e)
 
@@ -70,10 +71,19 @@ class GoogleSearchResults(BaseTool):
     ) -> Union[List[Dict], str]:
         """Use the tool asynchronously."""
         try:
-            return await self.api_wrapper.results_async(query)
+            return await self._asearch(query)
         except Exception as e:
             return repr(e)
 
+    # 실패한 호출은 저장하지 않도록 예외를 문자열로 바꾸기 전 단계에서 재사용
+    @memoize_tool()
+    def _search(self, query: str) -> List[Dict]:
+        return self.api_wrapper.results(query)
+
+    @memoize_tool()
+    async def _asearch(self, query: str) -> List[Dict]:
+        return await self.api_wrapper.results_async(query)
+
 
 class GoogleSearch(GoogleSearchResults):
     """Tool specialized for Google search."""
@@ -7,11 +7,17 @@ https://apiportal.koreainvestment.com/
 import json
 import time
 from typing import Dict, Optional
-import requests
 
 from langchain_core.utils import get_from_dict_or_env
 from pydantic import BaseModel, ConfigDict, SecretStr, model_validator
 
+from src.utils.cassette import cassette
+from src.utils.concurrency import provider_limiter
+from src.utils.http_client import http_clients
+from src.utils.memo import memoize_tool
+from src.utils.metrics import track_http
+from src.utils.resilience import breakers
+
 
 class HantooStockAPIWrapper(BaseModel):
     """Wrapper for Korea Investment & Securities API."""
@@ -38,6 +44,12 @@ class HantooStockAPIWrapper(BaseModel):
         )
         values["hantoo_app_key"] = hantoo_app_key
         values["hantoo_app_secret"] = hantoo_app_secret
+        values["base_url"] = get_from_dict_or_env(
+            values,
+            "base_url",
+            "HANTOO_BASE_URL",
+            default="https://openapi.koreainvestment.com:9443",
+        )
 
         return values
 
@@ -54,10 +66,29 @@ class HantooStockAPIWrapper(BaseModel):
             "appsecret": self.hantoo_app_secret.get_secret_value(),
         }
 
-        response = requests.post(url, headers=headers, data=json.dumps(body))
-        response_data = response.json()
-
-        if response.status_code == 200:
+        def fetch() -> Dict:
+            response = http_clients.session().post(
+                url,
+                headers=headers,
+                data=json.dumps(body),
+                timeout=http_clients.timeout("hantoo"),
+            )
+            if response.status_code != 200:
+                raise Exception(f"Failed to get access token: {response.text}")
+            return {"status": response.status_code, "data": response.json()}
+
+        # 발급된 토큰은 카세트에 저장하지 않음
+        with (
+            provider_limiter.limit("hantoo"),
+            breakers.guard(self.base_url),
+            track_http("hantoo"),
+        ):
+            response = cassette.fetch(
+                "hantoo", {"url": url}, fetch, redact=("access_token",)
+            )
+        response_data = response["data"]
+
+        if response["status"] == 200:
             self.access_token = response_data.get("access_token")
             expire_in_seconds = response_data.get("expires_in", 86400)
             self.token_expire_time = time.time() + expire_in_seconds
@@ -86,15 +117,47 @@ class HantooStockAPIWrapper(BaseModel):
             "custtype": "P",  # Individual customer type
         }
 
-        if method.upper() == "GET":
-            response = requests.get(url, headers=headers, params=params)
-        else:  # POST
-            response = requests.post(url, headers=headers, data=json.dumps(data))
+        def fetch() -> Dict:
+            if method.upper() == "GET":
+                response = http_clients.session().get(
+                    url,
+                    headers=headers,
+                    params=params,
+                    timeout=http_clients.timeout("hantoo"),
+                )
+            else:  # POST
+                response = http_clients.session().post(
+                    url,
+                    headers=headers,
+                    data=json.dumps(data),
+                    timeout=http_clients.timeout("hantoo"),
+                )
+            # 차단기가 장애로 기록하도록 guard 안에서 실패를 발생시킴
+            if response.status_code != 200:
+                raise Exception(
+                    f"API request failed ({response.status_code}): {response.text}"
+                )
+            return {"status": response.status_code, "data": response.json()}
+
+        # 카세트에는 인증 헤더를 제외한 요청 내용만 저장
+        request = {
+            "method": method.upper(),
+            "url": url,
+            "tr_id": tr_id,
+            "params": params,
+            "data": data,
+        }
+        with (
+            provider_limiter.limit("hantoo"),
+            breakers.guard(self.base_url),
+            track_http("hantoo"),
+        ):
+            response = cassette.fetch("hantoo", request, fetch)
 
-        if response.status_code != 200:
-            raise Exception(f"API request failed: {response.text}")
+        if response["status"] != 200:
+            raise Exception(f"API request failed: {response['text']}")
 
-        return response.json()
+        return response["data"]
 
     def get_balance_sheet(self, stock_code: str, div_cls: int = 1) -> Dict:
         """Get balance sheet data.
@@ -174,6 +237,8 @@ class HantooStockAPIWrapper(BaseModel):
         except Exception as e:
             return {"error": f"Stock info request failed: {str(e)}"}
 
+    # 질문 표현이 달라도 같은 종목은 실행 안에서 한 번만 조회
+    @memoize_tool("analysis")
     def analyze_financial_statements(self, stock_code: str) -> Dict:
         """Analyze financial statements for a stock."""
         result = {"stock_code": stock_code, "timestamp": time.time()}
@@ -181,6 +246,8 @@ class HantooStockAPIWrapper(BaseModel):
         # Get basic stock info
         try:
             stock_info = self.get_stock_info(stock_code)
+            if "error" in stock_info:
+                result["stock_info_error"] = stock_info["error"]
             if "output" in stock_info:
                 result["stock_info"] = stock_info["output"]
                 result["stock_name"] = stock_info["output"].get("prdt_name", "")
@@ -191,6 +258,9 @@ class HantooStockAPIWrapper(BaseModel):
         try:
             balance_sheet = self.get_balance_sheet(stock_code)
             result["balance_sheet"] = balance_sheet.get("output", [])
+            if "error" in balance_sheet:
+                # 실패한 조회는 분석 결과에 표시되고 실행 안에서 재사용되지 않음
+                result["balance_sheet_error"] = balance_sheet["error"]
         except Exception as e:
             result["balance_sheet_error"] = str(e)
 
@@ -198,6 +268,8 @@ class HantooStockAPIWrapper(BaseModel):
         try:
             income_statement = self.get_income_statement(stock_code)
             result["income_statement"] = income_statement.get("output", [])
+            if "error" in income_statement:
+                result["income_statement_error"] = income_statement["error"]
         except Exception as e:
             result["income_statement_error"] = str(e)
 
@@ -205,6 +277,8 @@ class HantooStockAPIWrapper(BaseModel):
         try:
             financial_ratios = self.get_financial_ratios(stock_code)
             result["financial_ratios"] = financial_ratios.get("output", [])
+            if "error" in financial_ratios:
+                result["financial_ratios_error"] = financial_ratios["error"]
         except Exception as e:
             result["financial_ratios_error"] = str(e)
 
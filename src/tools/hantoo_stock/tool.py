@@ -1,8 +1,10 @@
 """Tool for the Korea Investment & Securities API financial statements analysis."""
 
+import asyncio
 from typing import Dict, Optional, Type, Union
 
 from langchain_core.callbacks import (
+    AsyncCallbackManagerForToolRun,
     CallbackManagerForToolRun,
 )
 from langchain_core.tools import BaseTool
@@ -63,6 +65,21 @@ class HantooFinancialStatementTool(BaseTool):
         run_manager: Optional[CallbackManagerForToolRun] = None,
     ) -> Union[Dict, str]:
         """Run the tool."""
+        return self._analyze(query)
+
+    async def _arun(
+        self,
+        query: str,
+        run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
+    ) -> Union[Dict, str]:
+        """Run the tool asynchronously.
+
+        한국투자증권 API는 접근 토큰 발급과 조회가 순서대로 이뤄지는 동기 클라이언트이므로
+        이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+        """
+        return await asyncio.to_thread(self._analyze, query)
+
+    def _analyze(self, query: str) -> Union[Dict, str]:
         try:
             stock_code = self._extract_stock_code(query)
             if not stock_code:
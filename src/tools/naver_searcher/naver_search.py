@@ -4,17 +4,30 @@ In order to set this up, follow instructions at:
 https://developers.naver.com/docs/serviceapi/search/news/news.md
 """
 
+import asyncio
+import contextvars
 import json
-from typing import Dict, List, Optional
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
 import urllib.parse
 
-import aiohttp
 from langchain_core.utils import get_from_dict_or_env
 from pydantic import BaseModel, ConfigDict, SecretStr, model_validator
 
+from src.utils.cassette import cassette
+from src.utils.concurrency import provider_limiter
+from src.utils.http_client import http_clients
+from src.utils.metrics import track_http
+from src.utils.resilience import breakers
+
 NAVER_API_URL = "https://openapi.naver.com/v1/search"
 
+# 한 번에 받을 수 있는 최대 결과 수(display)와 최대 시작 위치(start)
+NAVER_MAX_DISPLAY = 100
+NAVER_MAX_START = 1000
+# 동기 deep search에서 페이지를 동시에 요청하는 스레드 수 (실제 호출 수는 provider 제한을 따름)
+DEEP_SEARCH_MAX_WORKERS = 10
+
 SEARCH_TYPE_MAP = {
     "news": "news",
     "blog": "blog",
@@ -28,6 +41,7 @@ class NaverSearchAPIWrapper(BaseModel):
 
     naver_client_id: SecretStr
     naver_client_secret: SecretStr
+    base_url: str = NAVER_API_URL
 
     model_config = ConfigDict(
         extra="forbid",
@@ -45,9 +59,18 @@ class NaverSearchAPIWrapper(BaseModel):
         )
         values["naver_client_id"] = naver_client_id
         values["naver_client_secret"] = naver_client_secret
+        values["base_url"] = get_from_dict_or_env(
+            values, "base_url", "NAVER_API_URL", default=NAVER_API_URL
+        )
 
         return values
 
+    def _headers(self) -> Dict[str, str]:
+        return {
+            "X-Naver-Client-Id": self.naver_client_id.get_secret_value(),
+            "X-Naver-Client-Secret": self.naver_client_secret.get_secret_value(),
+        }
+
     def raw_results(
         self,
         query: str,
@@ -58,22 +81,26 @@ class NaverSearchAPIWrapper(BaseModel):
     ) -> Dict:
         """Get raw results from the Naver Search API."""
         enc_text = urllib.parse.quote(query, encoding="utf-8")
-        url = f"{NAVER_API_URL}/{search_type}.json?query={enc_text}&display={display}&start={start}&sort={sort}"
+        url = f"{self.base_url}/{search_type}.json?query={enc_text}&display={display}&start={start}&sort={sort}"
 
-        request = urllib.request.Request(url)
-        request.add_header("X-Naver-Client-Id", self.naver_client_id.get_secret_value())
-        request.add_header(
-            "X-Naver-Client-Secret", self.naver_client_secret.get_secret_value()
-        )
+        def fetch() -> str:
+            response = http_clients.session().get(
+                url, headers=self._headers(), timeout=http_clients.timeout("naver")
+            )
+            response_code = response.status_code
 
-        response = urllib.request.urlopen(request)
-        response_code = response.getcode()
+            if response_code == 200:
+                return response.content.decode("utf-8")
+            else:
+                raise Exception(f"Error Code: {response_code}")
 
-        if response_code == 200:
-            response_body = response.read().decode("utf-8")
-            return json.loads(response_body)
-        else:
-            raise Exception(f"Error Code: {response_code}")
+        with (
+            provider_limiter.limit("naver"),
+            breakers.guard(self.base_url),
+            track_http("naver"),
+        ):
+            response_body = cassette.fetch("naver", {"url": url}, fetch)
+        return json.loads(response_body)
 
     def results(
         self,
@@ -114,23 +141,21 @@ class NaverSearchAPIWrapper(BaseModel):
     ) -> Dict:
         """Get results from the Naver Search API asynchronously."""
         enc_text = urllib.parse.quote(query)
-        url = f"{NAVER_API_URL}/{search_type}.json?query={enc_text}&display={display}&start={start}&sort={sort}"
+        url = f"{self.base_url}/{search_type}.json?query={enc_text}&display={display}&start={start}&sort={sort}"
 
         async def fetch() -> str:
-            headers = {
-                "X-Naver-Client-Id": self.naver_client_id.get_secret_value(),
-                "X-Naver-Client-Secret": self.naver_client_secret.get_secret_value(),
-            }
-
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.text()
-                        return data
-                    else:
-                        raise Exception(f"Error {response.status}: {response.reason}")
+            async with http_clients.asession().get(
+                url, headers=self._headers(), timeout=http_clients.atimeout("naver")
+            ) as response:
+                if response.status == 200:
+                    data = await response.text()
+                    return data
+                else:
+                    raise Exception(f"Error {response.status}: {response.reason}")
 
-        results_json_str = await fetch()
+        async with provider_limiter.alimit("naver"):
+            with breakers.guard(self.base_url), track_http("naver"):
+                results_json_str = await cassette.afetch("naver", {"url": url}, fetch)
         return json.loads(results_json_str)
 
     async def results_async(
@@ -151,6 +176,122 @@ class NaverSearchAPIWrapper(BaseModel):
         )
         return self.clean_results(results_json["items"])
 
+    def deep_results(
+        self,
+        query: str,
+        max_results: int = 300,
+        search_type: str = "news",
+        sort: Optional[str] = "date",
+    ) -> List[Dict]:
+        """Run a deep search that fetches several result pages concurrently.
+
+        The first page is fetched alone to learn the total hit count, then the
+        remaining pages are fetched in parallel under the provider limits.
+
+        Args:
+            query: The query to search for.
+            max_results: The number of results to collect (capped at 1000).
+            search_type: The type of search (news, blog, webkr, etc.)
+            sort: The sort order (sim for similarity, date for date).
+
+        Returns:
+            Cleaned results in page order, deduplicated by link.
+        """
+        pages = deep_search_pages(max_results)
+        start, display = pages[0]
+        first = self.raw_results(query, search_type, display, start, sort)
+        rest = remaining_pages(pages, first)
+
+        raw_pages = [first]
+        if rest:
+            with ThreadPoolExecutor(
+                min(len(rest), DEEP_SEARCH_MAX_WORKERS), thread_name_prefix="naver"
+            ) as pool:
+                # 실행 예산, 트레이싱 등 현재 실행의 context를 페이지 요청에도 전달
+                futures = [
+                    pool.submit(
+                        contextvars.copy_context().run,
+                        self.raw_results,
+                        query,
+                        search_type,
+                        display,
+                        start,
+                        sort,
+                    )
+                    for start, display in rest
+                ]
+                raw_pages.extend(future.result() for future in futures)
+
+        seen: Set[str] = set()
+        results = []
+        for page in raw_pages:
+            results.extend(self.clean_results(unseen_items(page["items"], seen)))
+        return results
+
+    async def deep_results_async(
+        self,
+        query: str,
+        max_results: int = 300,
+        search_type: str = "news",
+        sort: Optional[str] = "date",
+    ) -> List[Dict]:
+        """Run a deep search asynchronously. Results keep page order."""
+        pages = deep_search_pages(max_results)
+        start, display = pages[0]
+        first = await self.raw_results_async(query, search_type, display, start, sort)
+        raw_pages = [first]
+        raw_pages.extend(
+            await asyncio.gather(
+                *(
+                    self.raw_results_async(query, search_type, display, start, sort)
+                    for start, display in remaining_pages(pages, first)
+                )
+            )
+        )
+
+        seen: Set[str] = set()
+        results = []
+        for page in raw_pages:
+            results.extend(self.clean_results(unseen_items(page["items"], seen)))
+        return results
+
+    async def deep_results_stream(
+        self,
+        query: str,
+        max_results: int = 300,
+        search_type: str = "news",
+        sort: Optional[str] = "date",
+    ) -> AsyncIterator[List[Dict]]:
+        """Yield cleaned result pages of a deep search as they arrive.
+
+        Pages after the first are yielded in completion order, and results
+        already yielded on an earlier page (same link) are left out.
+        """
+        pages = deep_search_pages(max_results)
+        start, display = pages[0]
+        first = await self.raw_results_async(query, search_type, display, start, sort)
+        seen: Set[str] = set()
+        items = unseen_items(first["items"], seen)
+        if items:
+            yield self.clean_results(items)
+
+        tasks = [
+            asyncio.ensure_future(
+                self.raw_results_async(query, search_type, display, start, sort)
+            )
+            for start, display in remaining_pages(pages, first)
+        ]
+        try:
+            for next_page in asyncio.as_completed(tasks):
+                page = await next_page
+                items = unseen_items(page["items"], seen)
+                if items:
+                    yield self.clean_results(items)
+        finally:
+            # 소비자가 중간에 멈추면 남은 페이지 요청은 취소
+            for task in tasks:
+                task.cancel()
+
     def clean_results(self, results: List[Dict]) -> List[Dict]:
         """Clean results from Naver Search API."""
         clean_results = []
@@ -174,3 +315,35 @@ class NaverSearchAPIWrapper(BaseModel):
 
             clean_results.append(clean_result)
         return clean_results
+
+
+def deep_search_pages(max_results: int) -> List[Tuple[int, int]]:
+    """max_results개를 받기 위한 페이지별 (start, display) 목록
+
+    Naver는 start를 1000까지만 허용하므로 최대 1000개까지 요청합니다.
+    """
+    total = max(1, min(max_results, NAVER_MAX_START))
+    return [
+        (start, min(NAVER_MAX_DISPLAY, total - start + 1))
+        for start in range(1, total + 1, NAVER_MAX_DISPLAY)
+    ]
+
+
+def remaining_pages(
+    pages: List[Tuple[int, int]], first_page: Dict
+) -> List[Tuple[int, int]]:
+    """첫 페이지 응답의 전체 결과 수(total)를 넘어서는 페이지는 요청하지 않습니다."""
+    total = first_page.get("total", NAVER_MAX_START)
+    return [(start, display) for start, display in pages[1:] if start <= total]
+
+
+def unseen_items(items: List[Dict], seen: Set[str]) -> List[Dict]:
+    """link 기준으로 이전 페이지에서 받지 않은 결과만 반환합니다."""
+    unseen = []
+    for item in items:
+        link = item.get("link", "")
+        if link in seen:
+            continue
+        seen.add(link)
+        unseen.append(item)
+    return unseen
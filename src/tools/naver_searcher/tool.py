@@ -11,6 +11,7 @@ from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
 
 from src.tools.naver_searcher.naver_search import NaverSearchAPIWrapper
+from src.utils.memo import memoize_tool
 
 
 class NaverInput(BaseModel):
@@ -44,6 +45,9 @@ class NaverSearchResults(BaseTool):
                 sort="sim",  # Sort by similarity, can also use "date"
             )
 
+            # Deep search: fetch up to 300 results over several pages concurrently
+            tool = NaverNewsSearch(sort="date", max_results=300)
+
     Invoke:
 
         .. code-block:: python
@@ -62,9 +66,15 @@ class NaverSearchResults(BaseTool):
     display: int = 10
     start: int = 1
     sort: Literal["sim", "date"] = "sim"
+    # display보다 크면 여러 페이지를 동시에 요청해 max_results개(최대 1000)까지 모음
+    max_results: Optional[int] = None
 
     api_wrapper: NaverSearchAPIWrapper = Field(default_factory=NaverSearchAPIWrapper)
 
+    @property
+    def _deep_search(self) -> bool:
+        return self.max_results is not None and self.max_results > self.display
+
     def _run(
         self,
         query: str,
@@ -72,13 +82,7 @@ class NaverSearchResults(BaseTool):
     ) -> Union[List[Dict], str]:
         """Use the tool."""
         try:
-            return self.api_wrapper.results(
-                query,
-                search_type=self.search_type,
-                display=self.display,
-                start=self.start,
-                sort=self.sort,
-            )
+            return self._search(query)
         except Exception as e:
             return repr(e)
 
@@ -89,15 +93,44 @@ class NaverSearchResults(BaseTool):
     ) -> Union[List[Dict], str]:
         """Use the tool asynchronously."""
         try:
-            return await self.api_wrapper.results_async(
+            return await self._asearch(query)
+        except Exception as e:
+            return repr(e)
+
+    # 실패한 호출은 저장하지 않도록 예외를 문자열로 바꾸기 전 단계에서 재사용
+    @memoize_tool()
+    def _search(self, query: str) -> List[Dict]:
+        if self._deep_search:
+            return self.api_wrapper.deep_results(
                 query,
+                max_results=self.max_results,
                 search_type=self.search_type,
-                display=self.display,
-                start=self.start,
                 sort=self.sort,
             )
-        except Exception as e:
-            return repr(e)
+        return self.api_wrapper.results(
+            query,
+            search_type=self.search_type,
+            display=self.display,
+            start=self.start,
+            sort=self.sort,
+        )
+
+    @memoize_tool()
+    async def _asearch(self, query: str) -> List[Dict]:
+        if self._deep_search:
+            return await self.api_wrapper.deep_results_async(
+                query,
+                max_results=self.max_results,
+                search_type=self.search_type,
+                sort=self.sort,
+            )
+        return await self.api_wrapper.results_async(
+            query,
+            search_type=self.search_type,
+            display=self.display,
+            start=self.start,
+            sort=self.sort,
+        )
 
 
 class NaverNewsSearch(NaverSearchResults):
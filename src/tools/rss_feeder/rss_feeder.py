@@ -3,12 +3,18 @@
 In order to set this up, you need to have an RSS feed URL.
 """
 
+import asyncio
 from typing import Dict, List, Literal, Optional
 
-import aiohttp
 import feedparser
 from pydantic import BaseModel, ConfigDict
 
+from src.utils.budget import BudgetExceededError
+from src.utils.cassette import cassette
+from src.utils.http_client import http_clients
+from src.utils.metrics import track_http
+from src.utils.resilience import CircuitOpenError, breakers, http_timeout
+
 
 class RSSFeederAPIWrapper(BaseModel):
     """Wrapper for RSS Feeder API."""
@@ -23,10 +29,28 @@ class RSSFeederAPIWrapper(BaseModel):
         limit: Optional[int] = 10,
     ) -> Dict:
         """Get raw results from the RSS Feed."""
+
+        def fetch() -> str:
+            response = http_clients.session().get(
+                url,
+                headers={"User-Agent": feedparser.USER_AGENT},
+                timeout=http_clients.timeout("rss"),
+            )
+            response.raise_for_status()
+            # requests는 charset이 없는 text/*를 ISO-8859-1로 가정하므로 직접 확인
+            content_type = response.headers.get("content-type", "")
+            charset = response.encoding if "charset" in content_type else "utf-8"
+            return response.content.decode(charset, errors="replace")
+
         try:
-            feed = feedparser.parse(url)
+            with breakers.guard(url), track_http("rss"):
+                feed_content = cassette.fetch("rss", {"url": url}, fetch)
+            feed = feedparser.parse(feed_content)
             entries = feed.entries[:limit] if limit else feed.entries
             return {"items": entries, "feed_info": feed.feed}
+        # 노드가 차단기 열림과 예산 초과를 구분해 처리하도록 감싸지 않고 그대로 전달
+        except (CircuitOpenError, BudgetExceededError):
+            raise
         except Exception as e:
             raise Exception(f"Error fetching RSS feed: {str(e)}")
 
@@ -69,19 +93,24 @@ class RSSFeederAPIWrapper(BaseModel):
         """Get results from the RSS Feed asynchronously."""
 
         async def fetch() -> str:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(feed_url) as response:
-                    if response.status == 200:
-                        data = await response.text()
-                        return data
-                    else:
-                        raise Exception(f"Error {response.status}: {response.reason}")
+            async with http_clients.asession().get(
+                feed_url, timeout=http_clients.atimeout("rss")
+            ) as response:
+                if response.status == 200:
+                    data = await response.text()
+                    return data
+                else:
+                    raise Exception(f"Error {response.status}: {response.reason}")
 
         try:
-            feed_content = await fetch()
+            with breakers.guard(feed_url), track_http("rss"):
+                feed_content = await cassette.afetch("rss", {"url": feed_url}, fetch)
             feed = feedparser.parse(feed_content)
             entries = feed.entries[:limit] if limit else feed.entries
             return {"items": entries, "feed_info": feed.feed}
+        # 노드가 차단기 열림과 예산 초과를 구분해 처리하도록 감싸지 않고 그대로 전달
+        except (CircuitOpenError, BudgetExceededError):
+            raise
         except Exception as e:
             raise Exception(f"Error fetching RSS feed asynchronously: {str(e)}")
 
@@ -91,15 +120,20 @@ class RSSFeederAPIWrapper(BaseModel):
         limit: Optional[int] = 10,
         extract_content: Optional[bool] = False,
         nlp: Optional[bool] = False,
+        extractor: str = "newspaper",  # "newspaper" 또는 "goose"
     ) -> List[Dict]:
         """Get cleaned results from RSS Feed asynchronously."""
         results_json = await self.raw_results_async(
             feed_url=feed_url,
             limit=limit,
-            nlp=nlp,
         )
-        return self.clean_results(
-            results_json["items"], extract_content=extract_content, nlp=nlp
+        # 본문 추출은 동기 HTTP 호출이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+        return await asyncio.to_thread(
+            self.clean_results,
+            results_json["items"],
+            extract_content=extract_content,
+            nlp=nlp,
+            extractor=extractor,
         )
 
     def extract_article_content_goose(self, url: str) -> Dict:
@@ -118,8 +152,19 @@ class RSSFeederAPIWrapper(BaseModel):
             config = Configuration()
             config.browser_user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
 
+            def fetch() -> str:
+                response = http_clients.session().get(
+                    url,
+                    headers={"User-Agent": config.browser_user_agent},
+                    timeout=http_clients.timeout("article"),
+                )
+                response.raise_for_status()
+                return response.text
+
             with Goose(config) as g:
-                article = g.extract(url=url)
+                with breakers.guard(url), track_http("article"):
+                    html = cassette.fetch("article", {"url": url}, fetch)
+                article = g.extract(url=url, raw_html=html)
                 return {
                     "title": article.title,
                     # TODO: Get the content of the article
@@ -152,8 +197,16 @@ class RSSFeederAPIWrapper(BaseModel):
         try:
             from newspaper import Article
 
-            article = Article(url)
-            article.download()
+            article = Article(url, request_timeout=http_timeout("article"))
+
+            def fetch() -> str:
+                article.download()
+                article.throw_if_not_downloaded_verbose()
+                return article.html
+
+            with breakers.guard(url), track_http("article"):
+                html = cassette.fetch("article", {"url": url}, fetch)
+            article.download(input_html=html)
             article.parse()
 
             if nlp:
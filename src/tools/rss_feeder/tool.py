@@ -1,6 +1,6 @@
 """Tool for the RSS feed."""
 
-from typing import Optional, Type
+from typing import Dict, List, Optional, Type
 from langchain_core.callbacks import (
     AsyncCallbackManagerForToolRun,
     CallbackManagerForToolRun,
@@ -9,6 +9,7 @@ from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
 
 from src.tools.rss_feeder.rss_feeder import RSSFeederAPIWrapper
+from src.utils.memo import memoize_tool
 
 
 class RSSFeederInput(BaseModel):
@@ -44,13 +45,7 @@ class RSSFeederTool(BaseTool):
     ) -> str:
         """Use the tool."""
         try:
-            return self.api_wrapper.results(
-                # query=query,
-                url=self.url,
-                limit=self.limit,
-                extract_content=self.extract_content,
-                nlp=self.nlp,
-            )
+            return self._fetch(query)
         except Exception as e:
             return repr(e)
 
@@ -61,12 +56,27 @@ class RSSFeederTool(BaseTool):
     ) -> str:
         """Use the tool asynchronously."""
         try:
-            return await self.api_wrapper.results_async(
-                # query=query,
-                url=self.url,
-                limit=self.limit,
-                extract_content=self.extract_content,
-                nlp=self.nlp,
-            )
+            return await self._afetch(query)
         except Exception as e:
             return repr(e)
+
+    # 실패한 호출은 저장하지 않도록 예외를 문자열로 바꾸기 전 단계에서 재사용
+    @memoize_tool()
+    def _fetch(self, query: str) -> List[Dict]:
+        return self.api_wrapper.results(
+            # query=query,
+            url=self.url,
+            limit=self.limit,
+            extract_content=self.extract_content,
+            nlp=self.nlp,
+        )
+
+    @memoize_tool()
+    async def _afetch(self, query: str) -> List[Dict]:
+        return await self.api_wrapper.results_async(
+            # query=query,
+            feed_url=self.url,
+            limit=self.limit,
+            extract_content=self.extract_content,
+            nlp=self.nlp,
+        )
@@ -1,12 +1,18 @@
 """Util that calls Alpha Vantage API."""
 
+import asyncio
 import time
 from typing import Dict, Optional, Any
-import requests
 
 from langchain_core.utils import get_from_dict_or_env
 from pydantic import BaseModel, ConfigDict, SecretStr, model_validator
 
+from src.utils.cassette import cassette
+from src.utils.concurrency import provider_limiter
+from src.utils.http_client import http_clients
+from src.utils.metrics import track_http
+from src.utils.resilience import breakers
+
 
 class AlphaVantageAPIWrapper(BaseModel):
     """Wrapper for Alpha Vantage API."""
@@ -27,6 +33,12 @@ class AlphaVantageAPIWrapper(BaseModel):
         """Validate that api key exists in environment."""
         api_key = get_from_dict_or_env(values, "api_key", "ALPHA_VANTAGE_API_KEY")
         values["api_key"] = api_key
+        values["base_url"] = get_from_dict_or_env(
+            values,
+            "base_url",
+            "ALPHA_VANTAGE_BASE_URL",
+            default="https://www.alphavantage.co/query",
+        )
         return values
 
     def safe_float_or_empty(self, value: Any) -> Optional[float]:
@@ -35,10 +47,10 @@ class AlphaVantageAPIWrapper(BaseModel):
         Return None when conversion is not possible.
         """
         if (
-                value is None
-                or value == "None"
-                or value == ""
-                or (isinstance(value, str) and value.strip().lower() == "none")
+            value is None
+            or value == "None"
+            or value == ""
+            or (isinstance(value, str) and value.strip().lower() == "none")
         ):
             return None
         try:
@@ -47,7 +59,7 @@ class AlphaVantageAPIWrapper(BaseModel):
             return None
 
     def format_financial_value(
-            self, value: Any, include_dollar: bool = True, include_percent: bool = False
+        self, value: Any, include_dollar: bool = True, include_percent: bool = False
     ) -> str:
         """
         Format financial values.
@@ -77,21 +89,42 @@ class AlphaVantageAPIWrapper(BaseModel):
 
         # Return from cache if available and not expired
         if (
-                cache_key in self.cache
-                and current_time - self.cache_timestamp.get(cache_key, 0)
-                < self.base_cache_time
+            cache_key in self.cache
+            and current_time - self.cache_timestamp.get(cache_key, 0)
+            < self.base_cache_time
         ):
             return self.cache[cache_key]
 
         # Fetch new data
         result = func(*args, **kwargs)
 
-        # Cache the result
+        # Cache only successful results so that temporary failures are retried
+        if "error" in result:
+            return result
         self.cache[cache_key] = result
         self.cache_timestamp[cache_key] = current_time
 
         return result
 
+    async def _aget_cached_or_fetch(self, endpoint: str, func, *args, **kwargs) -> Dict:
+        """Get data from cache or fetch from API asynchronously."""
+        current_time = time.time()
+        if (
+            endpoint in self.cache
+            and current_time - self.cache_timestamp.get(endpoint, 0)
+            < self.base_cache_time
+        ):
+            return self.cache[endpoint]
+
+        result = await func(*args, **kwargs)
+
+        if "error" in result:
+            return result
+        self.cache[endpoint] = result
+        self.cache_timestamp[endpoint] = current_time
+
+        return result
+
     def make_request(self, function: str, symbol: str, **kwargs) -> Dict:
         """Make API request to Alpha Vantage."""
         try:
@@ -102,23 +135,86 @@ class AlphaVantageAPIWrapper(BaseModel):
                 **kwargs,
             }
 
-            response = requests.get(self.base_url, params=params)
+            def fetch() -> Dict:
+                response = http_clients.session().get(
+                    self.base_url,
+                    params=params,
+                    timeout=http_clients.timeout("alpha_vantage"),
+                )
+                # 차단기가 장애로 기록하도록 guard 안에서 실패를 발생시킴
+                if response.status_code != 200:
+                    raise Exception(
+                        f"API request failed ({response.status_code}): {response.text}"
+                    )
+                return {"status": response.status_code, "data": response.json()}
+
+            # 카세트에는 API 키를 제외한 파라미터만 저장
+            request = {"function": function, "symbol": symbol, **kwargs}
+            with (
+                provider_limiter.limit("alpha_vantage"),
+                breakers.guard(self.base_url),
+                track_http("alpha_vantage"),
+            ):
+                response = cassette.fetch("alpha_vantage", request, fetch)
+
+            return self._parse_response(response)
+        except Exception as e:
+            return {"error": f"Request failed: {str(e)}"}
 
-            if response.status_code != 200:
-                return {"error": f"API request failed: {response.text}"}
+    async def amake_request(self, function: str, symbol: str, **kwargs) -> Dict:
+        """Make API request to Alpha Vantage asynchronously."""
+        try:
+            params = {
+                "function": function,
+                "symbol": symbol,
+                "apikey": self.api_key.get_secret_value(),
+                **kwargs,
+            }
 
-            data = response.json()
+            async def fetch() -> Dict:
+                async with http_clients.asession().get(
+                    self.base_url,
+                    params=params,
+                    timeout=http_clients.atimeout("alpha_vantage"),
+                ) as response:
+                    if response.status != 200:
+                        raise Exception(
+                            f"API request failed ({response.status}): "
+                            f"{await response.text()}"
+                        )
+                    # Alpha Vantage는 content-type을 항상 application/json으로 주지 않음
+                    return {
+                        "status": response.status,
+                        "data": await response.json(content_type=None),
+                    }
+
+            request = {"function": function, "symbol": symbol, **kwargs}
+            async with provider_limiter.alimit("alpha_vantage"):
+                with breakers.guard(self.base_url), track_http("alpha_vantage"):
+                    response = await cassette.afetch("alpha_vantage", request, fetch)
+
+            return self._parse_response(response)
+        except Exception as e:
+            return {"error": f"Request failed: {str(e)}"}
 
-            # Check for error messages in the response
-            if "Error Message" in data:
-                return {"error": data["Error Message"]}
+    @staticmethod
+    def _parse_response(response: Dict) -> Dict:
+        """Convert a recorded API response into data or an error dict."""
+        if response["status"] != 200:
+            return {"error": f"API request failed: {response['text']}"}
 
-            if "Note" in data and "API call frequency" in data["Note"]:
-                return {"error": f"API call frequency exceeded: {data['Note']}"}
+        data = response["data"]
 
-            return data
-        except Exception as e:
-            return {"error": f"Request failed: {str(e)}"}
+        # Check for error messages in the response
+        if "Error Message" in data:
+            return {"error": data["Error Message"]}
+
+        if "Note" in data and "API call frequency" in data["Note"]:
+            # 다른 호출(다른 워커 프로세스 포함)도 1분 동안 보내지 않음
+            provider_limiter.rate_limiter.backoff("alpha_vantage", 60)
+            return {"error": f"API call frequency exceeded: {data['Note']}"}
+
+        return data
 
     def get_company_overview(self, ticker: str) -> Dict:
         """Get company overview."""
@@ -183,58 +279,87 @@ class AlphaVantageAPIWrapper(BaseModel):
 
         return self._get_cached_or_fetch(cache_key, fetch_sector_performance)
 
+    async def aget_company_overview(self, ticker: str) -> Dict:
+        """Get company overview asynchronously."""
+        return await self._aget_cached_or_fetch(
+            f"overview_{ticker}", self.amake_request, "OVERVIEW", ticker
+        )
+
+    async def aget_balance_sheet(self, ticker: str) -> Dict:
+        """Get balance sheet statement asynchronously."""
+        return await self._aget_cached_or_fetch(
+            f"balance_sheet_{ticker}", self.amake_request, "BALANCE_SHEET", ticker
+        )
+
+    async def aget_income_statement(self, ticker: str) -> Dict:
+        """Get income statement asynchronously."""
+        return await self._aget_cached_or_fetch(
+            f"income_statement_{ticker}", self.amake_request, "INCOME_STATEMENT", ticker
+        )
+
+    async def aget_cash_flow(self, ticker: str) -> Dict:
+        """Get cash flow statement asynchronously."""
+        return await self._aget_cached_or_fetch(
+            f"cash_flow_{ticker}", self.amake_request, "CASH_FLOW", ticker
+        )
+
     def analyze_financial_statements(self, ticker: str) -> Dict:
         """Analyze financial statements for a stock."""
+        sections = {}
+        for section, fetch in self._statement_fetchers(
+            self.get_company_overview,
+            self.get_balance_sheet,
+            self.get_income_statement,
+            self.get_cash_flow,
+        ):
+            try:
+                sections[section] = fetch(ticker)
+            except Exception as e:
+                sections[section] = e
+        return self._build_analysis(ticker, sections)
+
+    async def analyze_financial_statements_async(self, ticker: str) -> Dict:
+        """Analyze financial statements for a stock, fetching all statements concurrently."""
+        fetchers = self._statement_fetchers(
+            self.aget_company_overview,
+            self.aget_balance_sheet,
+            self.aget_income_statement,
+            self.aget_cash_flow,
+        )
+        responses = await asyncio.gather(
+            *(fetch(ticker) for _, fetch in fetchers), return_exceptions=True
+        )
+        return self._build_analysis(
+            ticker,
+            {section: response for (section, _), response in zip(fetchers, responses)},
+        )
+
+    @staticmethod
+    def _statement_fetchers(overview, balance_sheet, income_statement, cash_flow):
+        return [
+            ("profile", overview),
+            ("balance_sheet", balance_sheet),
+            ("income_statement", income_statement),
+            ("cash_flow", cash_flow),
+        ]
+
+    def _build_analysis(self, ticker: str, sections: Dict[str, Any]) -> Dict:
+        """Assemble fetched statements (or their errors) and run the analysis."""
         from . import analyze_financial_data
 
         result = {"ticker": ticker, "timestamp": time.time()}
 
-        # Get company overview
-        try:
-            overview = self.get_company_overview(ticker)
-            if "error" not in overview:
-                result["profile"] = overview
-                result["company_name"] = overview.get("Name", "")
-            else:
-                result["profile_error"] = overview.get("error", "Unknown error")
-        except Exception as e:
-            result["profile_error"] = str(e)
-
-        # Balance sheet data
-        try:
-            balance_sheet = self.get_balance_sheet(ticker)
-            if "error" not in balance_sheet:
-                result["balance_sheet"] = balance_sheet
-            else:
-                result["balance_sheet_error"] = balance_sheet.get(
-                    "error", "Unknown error"
-                )
-        except Exception as e:
-            result["balance_sheet_error"] = str(e)
-
-        # Income statement data
-        try:
-            income_statement = self.get_income_statement(ticker)
-            if "error" not in income_statement:
-                result["income_statement"] = income_statement
+        for section, response in sections.items():
+            if isinstance(response, Exception):
+                result[f"{section}_error"] = str(response)
+            elif "error" in response:
+                result[f"{section}_error"] = response.get("error", "Unknown error")
             else:
-                result["income_statement_error"] = income_statement.get(
-                    "error", "Unknown error"
-                )
-        except Exception as e:
-            result["income_statement_error"] = str(e)
-
-        # Cash flow data
-        try:
-            cash_flow = self.get_cash_flow(ticker)
-            if "error" not in cash_flow:
-                result["cash_flow"] = cash_flow
-            else:
-                result["cash_flow_error"] = cash_flow.get("error", "Unknown error")
-        except Exception as e:
-            result["cash_flow_error"] = str(e)
+                result[section] = response
+                if section == "profile":
+                    result["company_name"] = response.get("Name", "")
 
         # Add analysis results
         result["analysis"] = analyze_financial_data(self, result)
 
-        return result
\ No newline at end of file
+        return result
@@ -1,8 +1,10 @@
 """Tool for the Alpha Vantage financial statements analysis."""
 
+import re
 from typing import Dict, Optional, Type, Union, Any
 
 from langchain_core.callbacks import (
+    AsyncCallbackManagerForToolRun,
     CallbackManagerForToolRun,
 )
 from langchain_core.tools import BaseTool
@@ -10,6 +12,10 @@ from pydantic import BaseModel, Field
 
 from src.tools.us_stock.alpha_vantage_client import AlphaVantageAPIWrapper
 from src.tools.us_stock import format_financial_analysis
+from src.utils.logger import setup_logger
+from src.utils.memo import memoize_tool
+
+logger = setup_logger("market_agent.tools.us_stock")
 
 
 class USStockInput(BaseModel):
@@ -45,17 +51,17 @@ class USFinancialStatementTool(BaseTool):
         self._llm = value
 
     def safe_format(
-            self, value: Any, prefix: str = "", suffix: str = "", decimal_places: int = 2
+        self, value: Any, prefix: str = "", suffix: str = "", decimal_places: int = 2
     ) -> str:
         """
         Safely format financial values.
         Returns 'No data' for None or 'None' values.
         """
         if (
-                value is None
-                or value == ""
-                or value == "None"
-                or (isinstance(value, str) and value.strip().lower() == "none")
+            value is None
+            or value == ""
+            or value == "None"
+            or (isinstance(value, str) and value.strip().lower() == "none")
         ):
             return "No data"
         try:
@@ -68,15 +74,9 @@ class USFinancialStatementTool(BaseTool):
         except (ValueError, TypeError):
             return "No data"
 
-    def _extract_ticker(self, query: str) -> Optional[str]:
-        """Extract ticker from query using LLM inference and validate with Alpha Vantage API."""
-        # Return None if no LLM is available
-        if self.llm is None:
-            print("LLM is not available")
-            return None
-
-        # Ask LLM to convert company name to ticker
-        prompt = f"""
+    @staticmethod
+    def _ticker_prompt(query: str) -> str:
+        return f"""
         Identify the US stock market ticker symbol for the company mentioned in this query:
         "{query}"
         
@@ -89,43 +89,54 @@ class USFinancialStatementTool(BaseTool):
         Ticker:
         """
 
-        try:
-            # Query LLM - use .invoke instead of .predict
-            print(f"Querying LLM with prompt for: {query}")
-            response = self.llm.invoke(prompt)
-            ticker = response.content.strip().upper()
-            print(f"Extracted ticker: {ticker}")
-
-            # Check if response is a valid ticker format (1-5 uppercase letters)
-            import re
-
-            if ticker != "UNKNOWN" and re.match(r"^[A-Z]{1,5}$", ticker):
-                print(f"Valid ticker format: {ticker}")
-                # Verify ticker exists via Alpha Vantage API
-                try:
-                    print(f"Verifying ticker with Alpha Vantage: {ticker}")
-                    result = self.api_wrapper.get_company_overview(ticker)
-                    if "error" not in result:
-                        print(f"Ticker verified: {ticker}")
-                        return ticker
-                    else:
-                        print(f"Ticker verification failed: {result.get('error', 'Unknown error')}")
-                except Exception as e:
-                    print(f"Error verifying ticker with Alpha Vantage: {e}")
-                    # Return the ticker if it has the right format, even if API verification fails
-                    return ticker
-            else:
-                print(f"Invalid ticker format or 'UNKNOWN': {ticker}")
+    @staticmethod
+    def _parse_ticker(response: Any) -> Optional[str]:
+        """Return the ticker in the LLM response if it has a valid format (1-5 uppercase letters)."""
+        ticker = response.content.strip().upper()
+        logger.debug(f"Extracted ticker: {ticker}")
 
+        if ticker == "UNKNOWN" or not re.match(r"^[A-Z]{1,5}$", ticker):
+            logger.info(f"Invalid ticker format or 'UNKNOWN': {ticker}")
             return None
+        return ticker
+
+    @staticmethod
+    def _verified_ticker(ticker: str, overview: Dict) -> Optional[str]:
+        """Return the ticker if Alpha Vantage found a company overview for it."""
+        if "error" not in overview:
+            return ticker
+        logger.warning(
+            f"Ticker verification failed: {overview.get('error', 'Unknown error')}"
+        )
+        return None
+
+    @memoize_tool("ticker")
+    def _extract_ticker(self, query: str) -> Optional[str]:
+        """Extract ticker from query using LLM inference and validate with Alpha Vantage API."""
+        if self.llm is None:
+            logger.warning("LLM is not available")
+            return None
+
+        try:
+            ticker = self._parse_ticker(self.llm.invoke(self._ticker_prompt(query)))
+            if ticker is None:
+                return None
+
+            try:
+                overview = self.api_wrapper.get_company_overview(ticker)
+            except Exception as e:
+                logger.warning(f"Error verifying ticker with Alpha Vantage: {e}")
+                # Return the ticker if it has the right format, even if API verification fails
+                return ticker
+            return self._verified_ticker(ticker, overview)
         except Exception as e:
-            print(f"Error querying LLM for ticker extraction: {e}")
+            logger.error(f"Error querying LLM for ticker extraction: {e}")
             return None
 
     def _run(
-            self,
-            query: str,
-            run_manager: Optional[CallbackManagerForToolRun] = None,
+        self,
+        query: str,
+        run_manager: Optional[CallbackManagerForToolRun] = None,
     ) -> Union[Dict, str]:
         """Run the tool."""
         try:
@@ -139,7 +150,50 @@ class USFinancialStatementTool(BaseTool):
             # Format results for readability
             return format_financial_analysis(result)
         except Exception as e:
-            import traceback
-            print(f"Error analyzing financial statements: {repr(e)}")
-            print(traceback.format_exc())
-            return f"Error analyzing financial statements: {repr(e)}"
\ No newline at end of file
+            logger.error(
+                f"Error analyzing financial statements: {repr(e)}", exc_info=True
+            )
+            return f"Error analyzing financial statements: {repr(e)}"
+
+    @memoize_tool("ticker")
+    async def _aextract_ticker(self, query: str) -> Optional[str]:
+        """Async version of `_extract_ticker`. Shares memoized results with it."""
+        if self.llm is None:
+            logger.warning("LLM is not available")
+            return None
+
+        try:
+            response = await self.llm.ainvoke(self._ticker_prompt(query))
+            ticker = self._parse_ticker(response)
+            if ticker is None:
+                return None
+
+            try:
+                overview = await self.api_wrapper.aget_company_overview(ticker)
+            except Exception as e:
+                logger.warning(f"Error verifying ticker with Alpha Vantage: {e}")
+                # Return the ticker if it has the right format, even if API verification fails
+                return ticker
+            return self._verified_ticker(ticker, overview)
+        except Exception as e:
+            logger.error(f"Error querying LLM for ticker extraction: {e}")
+            return None
+
+    async def _arun(
+        self,
+        query: str,
+        run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
+    ) -> Union[Dict, str]:
+        """Run the tool asynchronously, fetching the statements concurrently."""
+        try:
+            ticker = await self._aextract_ticker(query)
+            if not ticker:
+                return "No valid ticker symbol found in the query. Please provide a query with a company name or US stock ticker (e.g., Apple, AAPL, Microsoft, MSFT)."
+
+            result = await self.api_wrapper.analyze_financial_statements_async(ticker)
+            return format_financial_analysis(result)
+        except Exception as e:
+            logger.error(
+                f"Error analyzing financial statements: {repr(e)}", exc_info=True
+            )
+            return f"Error analyzing financial statements: {repr(e)}"
@@ -0,0 +1,158 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+from pydantic import BaseModel, Field
+
+
+class BudgetExceededError(Exception):
+    """실행 예산이 소진되어 더 이상 진행할 수 없는 경우"""
+
+    def __init__(self, reason: str):
+        super().__init__(f"Run budget exceeded: {reason}")
+        self.reason = reason
+
+
+class RunBudget(BaseModel):
+    """그래프 실행 한 번에 허용되는 예산. None은 제한 없음을 의미합니다."""
+
+    deadline_seconds: Optional[float] = Field(default=None, gt=0)
+    max_hops: Optional[int] = Field(default=None, ge=1)
+    max_tokens: Optional[int] = Field(default=None, ge=1)
+    max_api_calls: Optional[int] = Field(default=None, ge=0)
+
+    @classmethod
+    def from_env(cls) -> "RunBudget":
+        """환경변수로부터 전역 기본 예산을 생성합니다.
+
+        - RUN_DEADLINE_SECONDS: 실행 제한 시간(초)
+        - RUN_MAX_HOPS: supervisor가 worker로 작업을 넘길 수 있는 최대 횟수
+        - RUN_MAX_TOKENS: LLM 토큰 사용량 상한
+        - RUN_MAX_API_CALLS: 외부 API 호출 횟수 상한
+        """
+
+        def setting(key: str, cast):
+            value = os.getenv(key)
+            return cast(value) if value else None
+
+        return cls(
+            deadline_seconds=setting("RUN_DEADLINE_SECONDS", float),
+            max_hops=setting("RUN_MAX_HOPS", int),
+            max_tokens=setting("RUN_MAX_TOKENS", int),
+            max_api_calls=setting("RUN_MAX_API_CALLS", int),
+        )
+
+    def merge(self, override: Optional["RunBudget"]) -> "RunBudget":
+        """요청별 예산을 적용합니다. 전역 예산보다 느슨하게 설정할 수는 없습니다."""
+        if override is None:
+            return self
+        values = {}
+        for field in RunBudget.model_fields:
+            limits = [
+                value
+                for value in (getattr(self, field), getattr(override, field))
+                if value is not None
+            ]
+            values[field] = min(limits) if limits else None
+        return RunBudget(**values)
+
+
+class BudgetTracker:
+    """실행 중 예산 사용량을 집계합니다. 여러 worker 스레드에서 동시에 갱신될 수 있습니다."""
+
+    def __init__(self, budget: RunBudget):
+        self.budget = budget
+        self.started_at = time.monotonic()
+        self.tokens = 0
+        self.api_calls = 0
+        self.rejected_api_calls = 0
+        self._lock = threading.Lock()
+
+    def remaining_seconds(self) -> Optional[float]:
+        if self.budget.deadline_seconds is None:
+            return None
+        elapsed = time.monotonic() - self.started_at
+        return max(self.budget.deadline_seconds - elapsed, 0.0)
+
+    def exhausted(self, hops: Optional[int] = None) -> Optional[str]:
+        """소진된 예산의 이름을 반환합니다. 여유가 있으면 None을 반환합니다."""
+        budget = self.budget
+        if budget.deadline_seconds is not None and self.remaining_seconds() <= 0:
+            return "deadline"
+        if budget.max_tokens is not None and self.tokens >= budget.max_tokens:
+            return "max_tokens"
+        # 한도까지 사용한 것은 허용하고, 한도를 넘는 호출이 거절된 뒤부터 소진으로 판단
+        if self.rejected_api_calls:
+            return "max_api_calls"
+        if hops is not None and budget.max_hops is not None and hops >= budget.max_hops:
+            return "max_hops"
+        return None
+
+    def check(self):
+        reason = self.exhausted()
+        if reason:
+            raise BudgetExceededError(reason)
+
+    def charge_tokens(self, tokens: int):
+        with self._lock:
+            self.tokens += tokens
+
+    def charge_api_call(self):
+        with self._lock:
+            limit = self.budget.max_api_calls
+            if limit is not None and self.api_calls >= limit:
+                self.rejected_api_calls += 1
+                raise BudgetExceededError("max_api_calls")
+            self.api_calls += 1
+
+    def usage(self) -> Dict:
+        return {
+            "elapsed_seconds": round(time.monotonic() - self.started_at, 3),
+            "tokens": self.tokens,
+            "api_calls": self.api_calls,
+        }
+
+
+_current_budget: ContextVar[Optional[BudgetTracker]] = ContextVar(
+    "market_agent_run_budget", default=None
+)
+
+
+def current_budget() -> Optional[BudgetTracker]:
+    return _current_budget.get()
+
+
+@contextmanager
+def budget_scope(tracker: Optional[BudgetTracker]) -> Iterator[None]:
+    """블록 안에서 실행되는 LLM/외부 API 호출이 tracker에 집계되도록 합니다."""
+    token = _current_budget.set(tracker)
+    try:
+        yield
+    finally:
+        _current_budget.reset(token)
+
+
+def check_budget():
+    tracker = _current_budget.get()
+    if tracker is not None:
+        tracker.check()
+
+
+def charge_tokens(tokens: Optional[int]):
+    tracker = _current_budget.get()
+    if tracker is not None and tokens:
+        tracker.charge_tokens(tokens)
+
+
+def charge_api_call():
+    tracker = _current_budget.get()
+    if tracker is not None:
+        tracker.charge_api_call()
+
+
+def stopped_message(reason: str) -> str:
+    """worker 응답이 하나도 없이 예산이 소진된 경우의 답변"""
+    return f"실행 예산이 소진되어({reason}) 답변을 생성하지 못했습니다. 다시 시도해 주세요."
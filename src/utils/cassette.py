@@ -0,0 +1,309 @@
+import asyncio
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, TypeVar
+
+import httpx
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger("market_agent.cassette")
+
+# 카세트 파일 형식 버전. 형식이 바뀌면 올리고 기존 카세트는 다시 녹화합니다.
+CASSETTE_VERSION = 1
+
+MODES = ("off", "record", "replay")
+
+T = TypeVar("T")
+
+
+class CassetteMissError(Exception):
+    """replay 모드에서 카세트에 녹화되지 않은 요청이 들어온 경우"""
+
+    def __init__(self, upstream: str, request: Dict):
+        super().__init__(
+            f"No recorded interaction for {upstream}: "
+            f"{json.dumps(request, ensure_ascii=False)[:200]}"
+        )
+        self.upstream = upstream
+        self.request = request
+
+
+class Cassette:
+    """LLM과 외부 API 호출을 카세트 파일에 녹화하고 재생합니다.
+
+    - record: 실제로 호출하고 요청/응답을 카세트 파일에 저장
+    - replay: 네트워크 없이 카세트의 응답을 반환. 같은 요청이 여러 번 녹화된 경우
+      녹화된 순서대로 반환하며, 끝까지 재생하면 처음부터 다시 반환합니다.
+    - off: 그대로 호출
+
+    요청은 upstream과 요청 내용(secret 제외)으로 식별하므로, 병렬 실행으로
+    호출 순서가 달라져도 같은 응답을 받습니다.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        mode: str = "off",
+        latency: Optional[float] = None,
+        latency_scale: float = 1.0,
+    ):
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        if mode != "off" and not path:
+            raise ValueError("Cassette path is required to record or replay")
+        self.path = path
+        self.mode = mode
+        # None이면 녹화 당시 응답 시간 * latency_scale만큼 대기
+        self.latency = latency
+        self.latency_scale = latency_scale
+        self._interactions: Dict[str, List[Dict]] = {}
+        self._records: List[Dict] = []
+        self._played: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        if mode == "replay":
+            self._load()
+
+    @classmethod
+    def from_env(cls) -> "Cassette":
+        """환경변수로부터 생성합니다.
+
+        - CASSETTE_MODE: off(기본), record 또는 replay
+        - CASSETTE_PATH: 카세트 파일 경로
+        - CASSETTE_LATENCY: replay 시 응답마다 대기할 시간(초). recorded(기본)이면 녹화된 응답 시간
+        - CASSETTE_LATENCY_SCALE: recorded 응답 시간에 곱할 배율
+        """
+        latency = os.getenv("CASSETTE_LATENCY", "recorded")
+        return cls(
+            path=os.getenv("CASSETTE_PATH", "cassettes/default.json"),
+            mode=os.getenv("CASSETTE_MODE", "off").lower(),
+            latency=None if latency == "recorded" else float(latency),
+            latency_scale=float(os.getenv("CASSETTE_LATENCY_SCALE", "1.0")),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    def fetch(
+        self,
+        upstream: str,
+        request: Dict,
+        fetch: Callable[[], T],
+        redact: Iterable[str] = (),
+    ) -> T:
+        """fetch()의 결과를 녹화하거나 녹화된 결과를 반환합니다.
+
+        Args:
+            upstream: 호출 대상 (naver, openai 등)
+            request: 요청을 식별하는 값. API 키 등 secret은 넣지 않습니다.
+            fetch: 실제 호출. JSON으로 저장할 수 있는 값을 반환해야 합니다.
+            redact: 카세트에 저장하지 않을 응답 필드 이름 (access token 등)
+        """
+        if self.mode == "off":
+            return fetch()
+        key = _key(upstream, request)
+        if self.mode == "replay":
+            interaction = self._next(key, upstream, request)
+            time.sleep(self._delay(interaction))
+            return copy.deepcopy(interaction["response"])
+
+        start_time = time.perf_counter()
+        response = fetch()
+        self._record(upstream, request, response, start_time, redact)
+        return response
+
+    async def afetch(
+        self,
+        upstream: str,
+        request: Dict,
+        fetch: Callable[[], Awaitable[T]],
+        redact: Iterable[str] = (),
+    ) -> T:
+        """fetch의 비동기 버전"""
+        if self.mode == "off":
+            return await fetch()
+        key = _key(upstream, request)
+        if self.mode == "replay":
+            interaction = self._next(key, upstream, request)
+            await asyncio.sleep(self._delay(interaction))
+            return copy.deepcopy(interaction["response"])
+
+        start_time = time.perf_counter()
+        response = await fetch()
+        self._record(upstream, request, response, start_time, redact)
+        return response
+
+    def transport(self, upstream: str, **kwargs: Any) -> httpx.BaseTransport:
+        """httpx 클라이언트(OpenAI SDK 등)의 요청을 녹화/재생하는 transport"""
+        return CassetteTransport(self, upstream, httpx.HTTPTransport(**kwargs))
+
+    def async_transport(self, upstream: str, **kwargs: Any) -> httpx.AsyncBaseTransport:
+        return AsyncCassetteTransport(
+            self, upstream, httpx.AsyncHTTPTransport(**kwargs)
+        )
+
+    def _next(self, key: str, upstream: str, request: Dict) -> Dict:
+        with self._lock:
+            interactions = self._interactions.get(key)
+            if not interactions:
+                raise CassetteMissError(upstream, request)
+            index = self._played.get(key, 0)
+            self._played[key] = index + 1
+            return interactions[index % len(interactions)]
+
+    def _delay(self, interaction: Dict) -> float:
+        if self.latency is not None:
+            return self.latency
+        return interaction.get("elapsed", 0.0) * self.latency_scale
+
+    def _record(
+        self,
+        upstream: str,
+        request: Dict,
+        response: Any,
+        start_time: float,
+        redact: Iterable[str],
+    ):
+        stored = json.loads(json.dumps(response, ensure_ascii=False, default=str))
+        interaction = {
+            "upstream": upstream,
+            "request": request,
+            "response": _redact(stored, set(redact)),
+            "elapsed": round(time.perf_counter() - start_time, 4),
+        }
+        with self._lock:
+            self._records.append(interaction)
+            self._save()
+
+    def _load(self):
+        with open(self.path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != CASSETTE_VERSION:
+            raise ValueError(
+                f"Cassette {self.path} has version {data.get('version')}, "
+                f"expected {CASSETTE_VERSION}. Record it again."
+            )
+        for interaction in data["interactions"]:
+            key = _key(interaction["upstream"], interaction["request"])
+            self._interactions.setdefault(key, []).append(interaction)
+        logger.info(
+            f"Loaded cassette {self.path}: {len(data['interactions'])} interactions"
+        )
+
+    def _save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"version": CASSETTE_VERSION, "interactions": self._records},
+                f,
+                ensure_ascii=False,
+                indent=1,
+            )
+        os.replace(tmp_path, self.path)
+
+
+class CassetteTransport(httpx.BaseTransport):
+    def __init__(
+        self, cassette: Cassette, upstream: str, transport: httpx.BaseTransport
+    ):
+        self.cassette = cassette
+        self.upstream = upstream
+        self.transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        def fetch() -> Dict:
+            response = self.transport.handle_request(request)
+            try:
+                response.read()
+            finally:
+                response.close()
+            return _response_payload(response)
+
+        payload = self.cassette.fetch(self.upstream, _request_payload(request), fetch)
+        return _to_response(payload, request)
+
+    def close(self):
+        self.transport.close()
+
+
+class AsyncCassetteTransport(httpx.AsyncBaseTransport):
+    def __init__(
+        self, cassette: Cassette, upstream: str, transport: httpx.AsyncBaseTransport
+    ):
+        self.cassette = cassette
+        self.upstream = upstream
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        async def fetch() -> Dict:
+            response = await self.transport.handle_async_request(request)
+            try:
+                await response.aread()
+            finally:
+                await response.aclose()
+            return _response_payload(response)
+
+        payload = await self.cassette.afetch(
+            self.upstream, _request_payload(request), fetch
+        )
+        return _to_response(payload, request)
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+def _key(upstream: str, request: Dict) -> str:
+    data = json.dumps([upstream, request], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def _redact(value: Any, fields: set) -> Any:
+    if isinstance(value, dict):
+        return {
+            key: "REDACTED" if key in fields else _redact(item, fields)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_redact(item, fields) for item in value]
+    return value
+
+
+def _request_payload(request: httpx.Request) -> Dict:
+    # 인증 정보가 담긴 헤더는 저장하지 않음
+    content = request.read().decode("utf-8")
+    try:
+        body = json.loads(content) if content else None
+    except ValueError:
+        body = content
+    return {"method": request.method, "url": str(request.url), "body": body}
+
+
+def _response_payload(response: httpx.Response) -> Dict:
+    return {
+        "status": response.status_code,
+        "content_type": response.headers.get("content-type"),
+        "text": response.text,
+    }
+
+
+def _to_response(payload: Dict, request: httpx.Request) -> httpx.Response:
+    headers = {}
+    if payload.get("content_type"):
+        headers["content-type"] = payload["content_type"]
+    return httpx.Response(
+        payload["status"],
+        headers=headers,
+        content=payload["text"].encode("utf-8"),
+        request=request,
+    )
+
+
+cassette = Cassette.from_env()
@@ -0,0 +1,570 @@
+import asyncio
+import heapq
+from collections import deque
+import itertools
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager, closing, contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, List, Optional, Tuple
+
+# 외부 provider별 기본 동시 호출 수 (환경변수 `<PROVIDER>_MAX_CONCURRENCY`로 변경 가능)
+DEFAULT_PROVIDER_LIMITS = {
+    "openai": 16,
+    "naver": 8,
+    "alpha_vantage": 1,
+    "google": 4,
+    "hantoo": 4,
+}
+
+# 외부 provider별 기본 호출 속도와 일일 한도
+# (환경변수 `<PROVIDER>_RATE_LIMIT`="10/s", `<PROVIDER>_DAILY_LIMIT`으로 변경 가능, 빈 값이면 제한 없음)
+DEFAULT_RATE_LIMITS = {
+    "naver": ("10/s", "25000"),
+    "alpha_vantage": ("5/min", "25"),
+    "hantoo": ("20/s", ""),
+    "google": ("100/min", ""),
+}
+
+# 호출 우선순위 (값이 작을수록 먼저 처리)
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 5
+PRIORITY_LOW = 10
+
+# 비동기 대기 시 토큰 대기열 확인 간격(초)
+_ASYNC_POLL_INTERVAL = 0.02
+# 대기열 맨 앞의 호출이 토큰을 기다리는 최대 간격(초). 우선순위가 높은 호출이 오면 양보함
+_MAX_TOKEN_WAIT = 1.0
+
+_RATE_UNITS = {"s": 1, "sec": 1, "min": 60, "m": 60, "h": 3600, "hour": 3600}
+_BUCKET_COLUMNS = ("tokens", "updated", "day", "used", "blocked_until")
+
+
+class RateLimitExceededError(Exception):
+    """RATE_LIMIT_MAX_WAIT 안에 호출 권한을 얻을 수 없는 경우 (일일 한도 소진 등)"""
+
+
+class RateLimit:
+    """token bucket 설정. `per`초마다 `calls`번(한 번에 최대 `calls`번까지 burst), 하루 `daily`번"""
+
+    def __init__(self, calls: int, per: float, daily: Optional[int] = None):
+        self.calls = calls
+        self.per = per
+        self.daily = daily
+
+    @property
+    def rate(self) -> float:
+        """초당 채워지는 토큰 수"""
+        return self.calls / self.per
+
+    @classmethod
+    def parse(cls, value: str, daily: str = "") -> Optional["RateLimit"]:
+        """`10/s`, `5/min`, `100/h` 형식의 설정을 읽습니다. 빈 값이면 None"""
+        if not value:
+            return None
+        calls, _, unit = value.partition("/")
+        return cls(
+            int(calls), _RATE_UNITS[unit.strip() or "s"], int(daily or 0) or None
+        )
+
+
+def _take(state: Dict[str, Any], limit: RateLimit, now: float) -> float:
+    """bucket 상태에서 토큰 하나를 가져옵니다. 성공하면 0, 아니면 다시 시도할 때까지의 시간(초)"""
+    if state["blocked_until"] > now:
+        return state["blocked_until"] - now
+
+    today = datetime.fromtimestamp(now).strftime("%Y-%m-%d")
+    if state["day"] != today:
+        state["day"], state["used"] = today, 0
+    if limit.daily is not None and state["used"] >= limit.daily:
+        tomorrow = datetime.fromtimestamp(now).date() + timedelta(days=1)
+        return datetime.combine(tomorrow, datetime.min.time()).timestamp() - now
+
+    tokens = min(limit.calls, state["tokens"] + (now - state["updated"]) * limit.rate)
+    state["updated"] = now
+    if tokens < 1:
+        state["tokens"] = tokens
+        return (1 - tokens) / limit.rate
+    state["tokens"] = tokens - 1
+    state["used"] += 1
+    return 0.0
+
+
+def _new_state(limit: RateLimit, now: float) -> Dict[str, Any]:
+    return {
+        "tokens": float(limit.calls),
+        "updated": now,
+        "day": "",
+        "used": 0,
+        "blocked_until": 0.0,
+    }
+
+
+class RateLimitBackend(ABC):
+    """provider별 token bucket 상태 저장소
+
+    blocking이 True인 backend(디스크 I/O, 잠금 대기)는 비동기 호출에서 별도 스레드로 실행됩니다.
+    """
+
+    blocking: bool = False
+
+    @abstractmethod
+    def take(self, provider: str, limit: RateLimit, now: float) -> float: ...
+
+    @abstractmethod
+    def backoff(self, provider: str, limit: RateLimit, until: float): ...
+
+    @abstractmethod
+    def usage(self, provider: str) -> Dict[str, Any]: ...
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """프로세스 안에서만 공유되는 bucket"""
+
+    def __init__(self):
+        self._states: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, provider: str, limit: RateLimit, now: float) -> Dict[str, Any]:
+        return self._states.setdefault(provider, _new_state(limit, now))
+
+    def take(self, provider: str, limit: RateLimit, now: float) -> float:
+        with self._lock:
+            return _take(self._state(provider, limit, now), limit, now)
+
+    def backoff(self, provider: str, limit: RateLimit, until: float):
+        with self._lock:
+            state = self._state(provider, limit, time.time())
+            state["blocked_until"] = max(state["blocked_until"], until)
+
+    def usage(self, provider: str) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._states.get(provider, {}))
+
+
+class SQLiteRateLimitBackend(RateLimitBackend):
+    """SQLite 파일 기반 bucket. 여러 워커 프로세스가 같은 한도를 공유합니다.
+
+    연결은 스레드별로 하나씩 만들어 재사용합니다.
+    """
+
+    blocking = True
+
+    def __init__(self, path: str = "rate_limits.sqlite3"):
+        self.path = path
+        self._local = threading.local()
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS buckets (
+                    provider TEXT PRIMARY KEY,
+                    tokens REAL NOT NULL,
+                    updated REAL NOT NULL,
+                    day TEXT NOT NULL,
+                    used INTEGER NOT NULL,
+                    blocked_until REAL NOT NULL
+                )
+                """
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def _update(self, provider: str, limit: RateLimit, now: float, change) -> Any:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = self._select(conn, provider)
+            state = dict(zip(_BUCKET_COLUMNS, row)) if row else _new_state(limit, now)
+            result = change(state)
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets VALUES (?, ?, ?, ?, ?, ?)",
+                (provider, *(state[column] for column in _BUCKET_COLUMNS)),
+            )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return result
+
+    def take(self, provider: str, limit: RateLimit, now: float) -> float:
+        return self._update(
+            provider, limit, now, lambda state: _take(state, limit, now)
+        )
+
+    def backoff(self, provider: str, limit: RateLimit, until: float):
+        def block(state: Dict[str, Any]):
+            state["blocked_until"] = max(state["blocked_until"], until)
+
+        self._update(provider, limit, time.time(), block)
+
+    def usage(self, provider: str) -> Dict[str, Any]:
+        row = self._select(self._connection(), provider)
+        return dict(zip(_BUCKET_COLUMNS, row)) if row else {}
+
+    @staticmethod
+    def _select(conn: sqlite3.Connection, provider: str) -> Optional[Tuple]:
+        return conn.execute(
+            f"SELECT {', '.join(_BUCKET_COLUMNS)} FROM buckets WHERE provider = ?",
+            (provider,),
+        ).fetchone()
+
+
+_current_priority: ContextVar[int] = ContextVar(
+    "market_agent_rate_priority", default=PRIORITY_NORMAL
+)
+
+
+@contextmanager
+def priority_scope(priority: int) -> Iterator[None]:
+    """블록 안에서 발생하는 외부 호출의 대기 우선순위를 지정합니다.
+
+    Example:
+    with priority_scope(PRIORITY_LOW):
+        graph.execute(state)  # 백그라운드 작업은 대화형 요청에 양보
+    """
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+class RateLimiter:
+    """provider별 token bucket으로 호출 속도를 제한합니다.
+
+    토큰이 없으면 실패하지 않고 기다리며, 기다리는 호출은 우선순위(값이 작은 것 먼저),
+    같은 우선순위 안에서는 도착 순서대로 토큰을 받습니다. 우선순위 대기열은 프로세스마다
+    따로 있고, bucket 상태는 backend를 통해 프로세스 간에 공유됩니다.
+    max_wait 안에 토큰을 받을 수 없으면(일일 한도 소진 등) RateLimitExceededError를 발생시킵니다.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, RateLimit]] = None,
+        backend: Optional[RateLimitBackend] = None,
+        max_wait: float = 60.0,
+    ):
+        self._limits = dict(limits or {})
+        self.backend = backend or MemoryRateLimitBackend()
+        self.max_wait = max_wait
+        self._waiters: Dict[str, List[Tuple[int, int]]] = {}
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "RateLimiter":
+        """환경변수로부터 생성합니다.
+
+        - <PROVIDER>_RATE_LIMIT, <PROVIDER>_DAILY_LIMIT: provider별 호출 속도와 일일 한도
+        - RATE_LIMIT_BACKEND: memory 또는 sqlite (기본값: API_WORKERS가 1보다 크면 sqlite)
+        - RATE_LIMIT_PATH: sqlite backend 파일 경로
+        - RATE_LIMIT_MAX_WAIT: 토큰을 기다리는 최대 시간(초)
+        """
+        limits = {}
+        for provider, (rate, daily) in DEFAULT_RATE_LIMITS.items():
+            limit = RateLimit.parse(
+                os.getenv(f"{provider.upper()}_RATE_LIMIT", rate),
+                os.getenv(f"{provider.upper()}_DAILY_LIMIT", daily),
+            )
+            if limit is not None:
+                limits[provider] = limit
+
+        default_backend = (
+            "sqlite" if int(os.getenv("API_WORKERS", "1")) > 1 else "memory"
+        )
+        if os.getenv("RATE_LIMIT_BACKEND", default_backend) == "sqlite":
+            backend = SQLiteRateLimitBackend(
+                os.getenv("RATE_LIMIT_PATH", "rate_limits.sqlite3")
+            )
+        else:
+            backend = MemoryRateLimitBackend()
+        return cls(
+            limits, backend, max_wait=float(os.getenv("RATE_LIMIT_MAX_WAIT", "60"))
+        )
+
+    def get_limit(self, provider: str) -> Optional[RateLimit]:
+        return self._limits.get(provider)
+
+    @property
+    def providers(self) -> List[str]:
+        return list(self._limits)
+
+    def waiting(self, provider: str) -> int:
+        return len(self._waiters.get(provider, []))
+
+    def _enqueue(self, provider: str, priority: Optional[int]) -> Tuple[int, int]:
+        if priority is None:
+            priority = _current_priority.get()
+        ticket = (priority, next(self._counter))
+        with self._lock:
+            heapq.heappush(self._waiters.setdefault(provider, []), ticket)
+        return ticket
+
+    def _dequeue(self, provider: str, ticket: Tuple[int, int]):
+        with self._lock:
+            waiters = self._waiters[provider]
+            waiters.remove(ticket)
+            heapq.heapify(waiters)
+
+    def _is_next(self, provider: str, ticket: Tuple[int, int]) -> bool:
+        with self._lock:
+            return self._waiters[provider][0] == ticket
+
+    def _next_wait(self, provider: str, wait: float, deadline: float) -> float:
+        """토큰을 받지 못한 경우 다시 확인할 때까지 기다릴 시간(초)"""
+        if time.monotonic() + wait > deadline:
+            raise RateLimitExceededError(
+                f"Rate limit for '{provider}' would not allow a call within {self.max_wait}s"
+            )
+        return min(wait, _MAX_TOKEN_WAIT)
+
+    def acquire(self, provider: str, priority: Optional[int] = None):
+        """동기 호출용. 토큰을 받을 때까지 현재 스레드를 대기시킵니다."""
+        limit = self._limits.get(provider)
+        if limit is None:
+            return
+        ticket = self._enqueue(provider, priority)
+        deadline = time.monotonic() + self.max_wait
+        try:
+            while True:
+                if self._is_next(provider, ticket):
+                    wait = self.backend.take(provider, limit, time.time())
+                    if wait == 0:
+                        return
+                else:
+                    # 우선순위가 높거나 먼저 온 호출이 기다리는 중
+                    wait = _ASYNC_POLL_INTERVAL
+                time.sleep(self._next_wait(provider, wait, deadline))
+        finally:
+            self._dequeue(provider, ticket)
+
+    async def aacquire(self, provider: str, priority: Optional[int] = None):
+        """비동기 호출용. 이벤트 루프를 막지 않고 토큰을 기다립니다."""
+        limit = self._limits.get(provider)
+        if limit is None:
+            return
+        ticket = self._enqueue(provider, priority)
+        deadline = time.monotonic() + self.max_wait
+        try:
+            while True:
+                if self._is_next(provider, ticket):
+                    wait = await self._atake(provider, limit)
+                    if wait == 0:
+                        return
+                else:
+                    wait = _ASYNC_POLL_INTERVAL
+                await asyncio.sleep(self._next_wait(provider, wait, deadline))
+        finally:
+            self._dequeue(provider, ticket)
+
+    async def _atake(self, provider: str, limit: RateLimit) -> float:
+        if self.backend.blocking:
+            # 파일 잠금을 기다릴 수 있는 backend는 이벤트 루프 밖에서 실행
+            return await asyncio.to_thread(
+                self.backend.take, provider, limit, time.time()
+            )
+        return self.backend.take(provider, limit, time.time())
+
+    def backoff(self, provider: str, seconds: float):
+        """provider가 한도 초과를 알려온 경우 seconds 동안 모든 프로세스의 호출을 멈춥니다."""
+        limit = self._limits.get(provider)
+        if limit is not None:
+            self.backend.backoff(provider, limit, time.time() + seconds)
+
+    def stats(self, provider: str) -> Dict[str, Any]:
+        limit = self._limits.get(provider)
+        if limit is None:
+            return {}
+        usage = self.backend.usage(provider)
+        return {
+            "rate": f"{limit.calls}/{limit.per:g}s",
+            "daily_limit": limit.daily,
+            "used_today": usage.get("used", 0),
+            "waiting": self.waiting(provider),
+        }
+
+
+class _SlotWaiter:
+    """슬롯을 기다리는 스레드 또는 코루틴"""
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.loop = loop
+        self.event = threading.Event()
+        self.future: Optional[asyncio.Future] = loop.create_future() if loop else None
+
+    def grant(self) -> bool:
+        """슬롯을 넘겨줍니다. 이벤트 루프가 이미 닫혀 받을 수 없으면 False"""
+        if self.loop is None:
+            self.event.set()
+            return True
+        try:
+            self.loop.call_soon_threadsafe(self._resolve)
+        except RuntimeError:
+            return False
+        return True
+
+    def _resolve(self):
+        if not self.future.done():
+            self.future.set_result(None)
+
+
+class FairSlots:
+    """스레드와 코루틴이 함께 사용하는 동시 실행 슬롯
+
+    슬롯이 반납되면 가장 먼저 기다린 호출에게 바로 넘겨주므로(FIFO),
+    나중에 온 호출이 먼저 슬롯을 가져가 오래 기다린 호출이 굶지 않습니다.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._used = 0
+        self._waiters: Deque[_SlotWaiter] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    def _enqueue(self, waiter: _SlotWaiter) -> bool:
+        """바로 슬롯을 받으면 True, 아니면 대기열에 넣고 False"""
+        with self._lock:
+            if not self._waiters and self._used < self.limit:
+                self._used += 1
+                return True
+            self._waiters.append(waiter)
+            return False
+
+    def acquire(self):
+        waiter = _SlotWaiter()
+        if not self._enqueue(waiter):
+            waiter.event.wait()
+
+    async def aacquire(self):
+        waiter = _SlotWaiter(asyncio.get_running_loop())
+        if self._enqueue(waiter):
+            return
+        try:
+            await waiter.future
+        except BaseException:
+            with self._lock:
+                granted = waiter not in self._waiters
+                if not granted:
+                    self._waiters.remove(waiter)
+            # 취소되기 직전에 넘겨받은 슬롯은 다음 대기자에게 넘김
+            if granted:
+                self.release()
+            raise
+
+    def release(self):
+        with self._lock:
+            while self._waiters:
+                if self._waiters.popleft().grant():
+                    return
+            self._used -= 1
+
+
+class ProviderLimiter:
+    """외부 provider(OpenAI, Naver, Alpha Vantage 등)별 동시 호출 수와 호출 속도를 제한합니다.
+
+    호출 속도 제한(RateLimiter)의 토큰을 먼저 받은 뒤 동시 호출 슬롯을 기다립니다.
+    동기 코드(스레드)와 비동기 코드가 같은 슬롯과 토큰을 공유하며, 슬롯은 먼저 기다린 호출부터 받습니다.
+    limit이 설정되지 않은 provider는 제한 없이 통과합니다.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, int]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        self._limits = dict(limits or {})
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self._slots: Dict[str, FairSlots] = {}
+        self._in_flight: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "ProviderLimiter":
+        limits = {
+            provider: int(os.getenv(f"{provider.upper()}_MAX_CONCURRENCY", default))
+            for provider, default in DEFAULT_PROVIDER_LIMITS.items()
+        }
+        return cls(limits, RateLimiter.from_env())
+
+    def get_limit(self, provider: str) -> Optional[int]:
+        return self._limits.get(provider)
+
+    def in_flight(self, provider: str) -> int:
+        return self._in_flight.get(provider, 0)
+
+    def _get_slots(self, provider: str) -> Optional[FairSlots]:
+        limit = self._limits.get(provider)
+        if not limit or limit <= 0:
+            return None
+        with self._lock:
+            if provider not in self._slots:
+                self._slots[provider] = FairSlots(limit)
+            return self._slots[provider]
+
+    def _track(self, provider: str, delta: int):
+        with self._lock:
+            self._in_flight[provider] = self._in_flight.get(provider, 0) + delta
+
+    @contextmanager
+    def limit(self, provider: str) -> Iterator[None]:
+        """동기 호출용. 토큰과 슬롯이 생길 때까지 현재 스레드를 대기시킵니다."""
+        self.rate_limiter.acquire(provider)
+        slots = self._get_slots(provider)
+        if slots is None:
+            yield
+            return
+
+        slots.acquire()
+        self._track(provider, 1)
+        try:
+            yield
+        finally:
+            self._track(provider, -1)
+            slots.release()
+
+    @asynccontextmanager
+    async def alimit(self, provider: str) -> AsyncIterator[None]:
+        """비동기 호출용. 이벤트 루프나 스레드풀을 막지 않고 토큰과 슬롯을 기다립니다."""
+        await self.rate_limiter.aacquire(provider)
+        slots = self._get_slots(provider)
+        if slots is None:
+            yield
+            return
+
+        await slots.aacquire()
+        self._track(provider, 1)
+        try:
+            yield
+        finally:
+            self._track(provider, -1)
+            slots.release()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        providers = set(self._limits) | set(self.rate_limiter.providers)
+        return {
+            provider: {
+                "max_concurrency": self._limits.get(provider),
+                "in_flight": self.in_flight(provider),
+                **self.rate_limiter.stats(provider),
+            }
+            for provider in sorted(providers)
+        }
+
+
+provider_limiter = ProviderLimiter.from_env()
@@ -0,0 +1,133 @@
+import asyncio
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.utils.resilience import http_timeout
+
+
+class HTTPClientManager:
+    """프로세스 전체에서 공유하는 HTTP 클라이언트(커넥션 풀)를 관리합니다.
+
+    호출마다 세션을 새로 만들면 DNS 조회, TCP/TLS 연결을 매번 다시 맺으므로
+    호스트별 keep-alive 커넥션 풀을 재사용합니다.
+    - 비동기 호출: 이벤트 루프별 `aiohttp.ClientSession` 하나
+    - 동기 호출(스레드): `requests.Session` 하나 (urllib3 커넥션 풀은 스레드 안전)
+
+    Example:
+    async with http_clients.asession().get(
+        url, timeout=http_clients.atimeout("naver")
+    ) as response:
+        ...
+    response = http_clients.session().get(url, timeout=http_clients.timeout("naver"))
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        keepalive_timeout: float = 30.0,
+        connect_timeout: float = 5.0,
+        dns_cache_ttl: int = 300,
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.connect_timeout = connect_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self._session: Optional[requests.Session] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "HTTPClientManager":
+        """환경변수로부터 생성합니다.
+
+        - HTTP_POOL_LIMIT: 전체 동시 연결 수
+        - HTTP_POOL_LIMIT_PER_HOST: 호스트별 동시 연결(동기 풀에서는 유지하는 연결) 수
+        - HTTP_KEEPALIVE_TIMEOUT: 사용하지 않는 연결을 유지하는 시간(초, aiohttp)
+        - HTTP_CONNECT_TIMEOUT: 연결 수립 timeout(초). 전체 timeout은 `<UPSTREAM>_HTTP_TIMEOUT`
+        """
+        return cls(
+            limit=int(os.getenv("HTTP_POOL_LIMIT", "100")),
+            limit_per_host=int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "10")),
+            keepalive_timeout=float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "30")),
+            connect_timeout=float(os.getenv("HTTP_CONNECT_TIMEOUT", "5")),
+        )
+
+    def timeout(self, upstream: str) -> Tuple[float, float]:
+        """requests용 (연결, 읽기) timeout"""
+        return (self.connect_timeout, http_timeout(upstream))
+
+    def atimeout(self, upstream: str) -> aiohttp.ClientTimeout:
+        """aiohttp용 timeout"""
+        return aiohttp.ClientTimeout(
+            total=http_timeout(upstream), sock_connect=self.connect_timeout
+        )
+
+    def session(self) -> requests.Session:
+        """동기 호출에 사용할 공유 `requests.Session`"""
+        with self._lock:
+            if self._session is None:
+                adapter = HTTPAdapter(
+                    pool_connections=self.limit,
+                    pool_maxsize=self.limit_per_host,
+                )
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._session = session
+            return self._session
+
+    def asession(self) -> aiohttp.ClientSession:
+        """현재 이벤트 루프에서 사용할 공유 `aiohttp.ClientSession`
+
+        aiohttp 세션은 생성된 이벤트 루프에서만 사용할 수 있으므로 루프별로 하나씩 만듭니다.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._discard_closed_loops()
+            session = self._sessions.get(loop)
+            if session is None or session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    keepalive_timeout=self.keepalive_timeout,
+                    ttl_dns_cache=self.dns_cache_ttl,
+                )
+                session = aiohttp.ClientSession(
+                    connector=connector,
+                    timeout=aiohttp.ClientTimeout(sock_connect=self.connect_timeout),
+                )
+                self._sessions[loop] = session
+            return session
+
+    def _discard_closed_loops(self):
+        """이미 닫힌 이벤트 루프(asyncio.run 등)의 세션을 정리합니다."""
+        for loop in [loop for loop in self._sessions if loop.is_closed()]:
+            # 루프가 닫혀 연결을 정상 종료할 수 없으므로 세션에서 떼어내기만 함
+            self._sessions.pop(loop).detach()
+
+    async def aclose(self):
+        """모든 커넥션 풀을 닫습니다. 서버 종료 시 호출합니다."""
+        with self._lock:
+            sessions, self._sessions = self._sessions, {}
+            sync_session, self._session = self._session, None
+        if sync_session is not None:
+            sync_session.close()
+        current = asyncio.get_running_loop()
+        for loop, session in sessions.items():
+            if loop is current:
+                await session.close()
+            elif not loop.is_closed() and loop.is_running():
+                future = asyncio.run_coroutine_threadsafe(session.close(), loop)
+                await asyncio.wrap_future(future)
+            else:
+                session.detach()
+
+
+http_clients = HTTPClientManager.from_env()
@@ -0,0 +1,94 @@
+import os
+import threading
+from typing import Callable, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger("market_agent.leader")
+
+
+class LeaderLock:
+    """파일 잠금 기반 리더 선출
+
+    같은 잠금 파일을 사용하는 여러 워커 프로세스 중 하나만 리더가 됩니다.
+    리더 프로세스가 종료되면 OS가 잠금을 해제하며, 대기 중인 다른 워커가
+    retry_interval 간격으로 재시도하여 리더를 이어받습니다.
+    """
+
+    def __init__(self, path: str, retry_interval: float = 30.0):
+        self.path = path
+        self.retry_interval = retry_interval
+        self._file = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._file is not None
+
+    def try_acquire(self) -> bool:
+        if self.is_leader:
+            return True
+
+        file = open(self.path, "a+")
+        try:
+            if fcntl is not None:
+                fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            file.close()
+            return False
+
+        file.seek(0)
+        file.truncate()
+        file.write(str(os.getpid()))
+        file.flush()
+        self._file = file
+        return True
+
+    def release(self):
+        if self._file is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            else:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self._file.close()
+            self._file = None
+
+    def run_when_elected(self, on_elected: Callable[[], None]):
+        """리더가 되면 on_elected를 한 번 실행합니다.
+
+        즉시 리더가 되지 못하면 백그라운드 스레드에서 주기적으로 재시도합니다.
+        """
+        if self.try_acquire():
+            logger.info(f"Process {os.getpid()} elected as leader ({self.path})")
+            on_elected()
+            return
+
+        def retry():
+            while not self._stop.wait(self.retry_interval):
+                if self.try_acquire():
+                    logger.info(
+                        f"Process {os.getpid()} took over leadership ({self.path})"
+                    )
+                    on_elected()
+                    return
+
+        self._thread = threading.Thread(target=retry, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self.release()
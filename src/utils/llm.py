@@ -0,0 +1,192 @@
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, AsyncIterator, ClassVar, Hashable, Iterator, Optional, Tuple
+
+import openai
+from langchain_core.language_models import BaseChatModel
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+from langchain_openai import ChatOpenAI
+
+from src.utils.budget import charge_tokens, check_budget
+from src.utils.cassette import cassette
+from src.utils.concurrency import provider_limiter
+from src.utils.metrics import HTTP_REQUEST_SECONDS, timed
+from src.utils.tracing import tracer
+
+
+class LimitedChatOpenAI(ChatOpenAI):
+    """provider 동시 호출 제한(`openai`)을 적용한 ChatOpenAI.
+
+    bind, bind_tools, with_structured_output 등으로 파생된 호출도 모두
+    아래 메서드를 거치므로 같은 제한을 받습니다.
+    실행 예산이 소진된 경우 호출하지 않고 BudgetExceededError를 발생시키며,
+    사용한 토큰 수를 실행 예산에 반영합니다.
+    """
+
+    provider: ClassVar[str] = "openai"
+
+    def _generate(self, *args: Any, **kwargs: Any) -> ChatResult:
+        check_budget()
+        with provider_limiter.limit(self.provider), self._timed() as span:
+            result = super()._generate(*args, **kwargs)
+            span.set_attribute("tokens", _total_tokens(result))
+        charge_tokens(_total_tokens(result))
+        return result
+
+    async def _agenerate(self, *args: Any, **kwargs: Any) -> ChatResult:
+        check_budget()
+        async with provider_limiter.alimit(self.provider):
+            with self._timed() as span:
+                result = await super()._agenerate(*args, **kwargs)
+                span.set_attribute("tokens", _total_tokens(result))
+        charge_tokens(_total_tokens(result))
+        return result
+
+    def _stream(self, *args: Any, **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+        check_budget()
+        with provider_limiter.limit(self.provider), self._timed():
+            for chunk in super()._stream(*args, **kwargs):
+                charge_tokens(_chunk_tokens(chunk))
+                yield chunk
+
+    async def _astream(
+        self, *args: Any, **kwargs: Any
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        check_budget()
+        async with provider_limiter.alimit(self.provider):
+            with self._timed():
+                async for chunk in super()._astream(*args, **kwargs):
+                    charge_tokens(_chunk_tokens(chunk))
+                    yield chunk
+
+    @contextmanager
+    def _timed(self) -> Iterator:
+        # LLM 호출 아래에는 하위 span이 없으므로 현재 span으로 설정하지 않음
+        with (
+            tracer.span(
+                f"llm {self.provider}",
+                kind="llm",
+                activate=False,
+                model=self.model_name,
+            ) as span,
+            timed(HTTP_REQUEST_SECONDS, upstream=self.provider),
+        ):
+            yield span
+
+
+def _total_tokens(result: ChatResult) -> Optional[int]:
+    usage = (result.llm_output or {}).get("token_usage") or {}
+    return usage.get("total_tokens")
+
+
+def _chunk_tokens(chunk: ChatGenerationChunk) -> Optional[int]:
+    # stream_usage가 켜진 경우 마지막 청크에만 사용량이 포함됨
+    usage = getattr(chunk.message, "usage_metadata", None)
+    return usage["total_tokens"] if usage else None
+
+
+LLMKey = Tuple[str, Optional[float], Optional[int]]
+
+
+def llm_config_key(llm: Any) -> Hashable:
+    """LLM 클라이언트의 설정 키. 같은 설정의 클라이언트는 같은 키를 갖습니다.
+
+    model 설정이 없는 객체(테스트용 LLM 등)는 객체마다 다른 키를 사용합니다.
+    """
+    model = getattr(llm, "model_name", None)
+    if not isinstance(model, str):
+        return (type(llm).__name__, id(llm))
+    return (
+        type(llm).__name__,
+        model,
+        getattr(llm, "temperature", None),
+        getattr(llm, "max_tokens", None),
+    )
+
+
+class LLMRegistry:
+    """(model, temperature, max_tokens)별로 LLM 클라이언트를 하나씩 재사용합니다.
+
+    모든 클라이언트는 하나의 HTTP 커넥션 풀(동기/비동기)을 공유하므로
+    요청마다 클라이언트를 새로 만들 때처럼 연결을 다시 맺지 않습니다.
+    요청 파라미터로 키가 늘어날 수 있으므로 max_clients개까지만 LRU로 유지합니다.
+    """
+
+    def __init__(self, default_model: str = "gpt-4o-mini", max_clients: int = 32):
+        self.default_model = default_model
+        self.max_clients = max_clients
+        self._clients: "OrderedDict[LLMKey, BaseChatModel]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._http_client: Optional[openai.DefaultHttpxClient] = None
+        self._http_async_client: Optional[openai.DefaultAsyncHttpxClient] = None
+
+    @classmethod
+    def from_env(cls) -> "LLMRegistry":
+        return cls(
+            default_model=os.getenv("LLM_DEFAULT_MODEL", "gpt-4o-mini"),
+            max_clients=int(os.getenv("LLM_REGISTRY_MAX_CLIENTS", "32")),
+        )
+
+    def get(
+        self,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> BaseChatModel:
+        key = (model or self.default_model, temperature, max_tokens)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._create(*key)
+                self._clients[key] = client
+                if len(self._clients) > self.max_clients:
+                    self._clients.popitem(last=False)
+            else:
+                self._clients.move_to_end(key)
+            return client
+
+    def _create(
+        self, model: str, temperature: Optional[float], max_tokens: Optional[int]
+    ) -> BaseChatModel:
+        if self._http_client is None:
+            sync_options, async_options = {}, {}
+            if cassette.enabled:
+                # 녹화/재생 모드에서는 OpenAI 요청을 카세트를 거쳐 보냄
+                limits = openai.DEFAULT_CONNECTION_LIMITS
+                sync_options["transport"] = cassette.transport("openai", limits=limits)
+                async_options["transport"] = cassette.async_transport(
+                    "openai", limits=limits
+                )
+            self._http_client = openai.DefaultHttpxClient(**sync_options)
+            self._http_async_client = openai.DefaultAsyncHttpxClient(**async_options)
+
+        kwargs = {}
+        if temperature is not None:
+            kwargs["temperature"] = temperature
+        if max_tokens is not None:
+            kwargs["max_tokens"] = max_tokens
+        return LimitedChatOpenAI(
+            model=model,
+            http_client=self._http_client,
+            http_async_client=self._http_async_client,
+            **kwargs,
+        )
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    async def aclose(self):
+        """공유 커넥션 풀을 닫습니다. 서버 종료 시 호출합니다."""
+        with self._lock:
+            self._clients.clear()
+            http_client, self._http_client = self._http_client, None
+            http_async_client, self._http_async_client = self._http_async_client, None
+        if http_client is not None:
+            http_client.close()
+        if http_async_client is not None:
+            await http_async_client.aclose()
+
+
+llm_registry = LLMRegistry.from_env()
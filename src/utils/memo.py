@@ -0,0 +1,235 @@
+import asyncio
+import inspect
+import json
+import os
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Tuple
+
+from langchain_core.tools import BaseTool
+
+from src.utils.metrics import record_tool_memo
+
+# 도구 호출 인자 중 결과에 영향을 주지 않는 값
+IGNORED_ARGS = ("run_manager", "callbacks", "config")
+IGNORED_FIELDS = ("name", "description", "verbose", "return_direct")
+
+
+class ToolMemo:
+    """그래프 실행 한 번 동안의 도구 호출 결과 저장소
+
+    supervisor가 같은 worker를 다시 호출하거나 여러 worker가 같은 도구를 같은 인자로 호출하면
+    저장된 결과를 반환합니다. 같은 키를 동시에 계산하는 경우 먼저 시작한 호출의 결과를 기다립니다.
+    예외가 발생했거나 cacheable이 거부한 결과(일시적인 실패)는 저장하지 않으므로 다시 호출하면
+    도구를 다시 실행합니다.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._results: Dict[Hashable, Any] = {}
+        self._locks: Dict[Hashable, threading.Lock] = {}
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+        self._lock = threading.Lock()
+
+    def get_or_call(
+        self,
+        tool: str,
+        key: Hashable,
+        func,
+        cacheable: Optional[Callable[[Any], bool]] = None,
+    ):
+        if key in self._results:
+            return self._hit(tool, key)
+        with self._lock:
+            key_lock = self._locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if key in self._results:
+                return self._hit(tool, key)
+            result = func()
+            self._store(tool, key, result, cacheable)
+            return result
+
+    async def aget_or_call(
+        self,
+        tool: str,
+        key: Hashable,
+        func,
+        cacheable: Optional[Callable[[Any], bool]] = None,
+    ):
+        if key in self._results:
+            return self._hit(tool, key)
+        pending = self._pending.get(key)
+        if pending is not None:
+            # 같은 키를 계산 중인 호출의 결과를 함께 사용 (실패하면 이 호출도 같은 예외로 실패)
+            result = await asyncio.shield(pending)
+            self.hits += 1
+            record_tool_memo(tool, hit=True)
+            return result
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 기다리는 호출이 없을 때 "exception was never retrieved" 경고 방지
+            future.exception()
+            raise
+        finally:
+            self._pending.pop(key, None)
+        self._store(tool, key, result, cacheable)
+        future.set_result(result)
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+    def _hit(self, tool: str, key: Hashable):
+        self.hits += 1
+        record_tool_memo(tool, hit=True)
+        return self._results[key]
+
+    def _store(
+        self,
+        tool: str,
+        key: Hashable,
+        result: Any,
+        cacheable: Optional[Callable[[Any], bool]],
+    ):
+        self.misses += 1
+        record_tool_memo(tool, hit=False)
+        if cacheable is None or cacheable(result):
+            self._results[key] = result
+
+
+def is_cacheable(result: Any) -> bool:
+    """실행 안에서 재사용해도 되는 결과인지 확인합니다.
+
+    None(티커 추출 실패 등)과 `error` 또는 `*_error` 키가 있는 dict(API 오류 응답)는
+    일시적인 실패일 수 있으므로 저장하지 않습니다.
+    """
+    if result is None:
+        return False
+    if isinstance(result, dict):
+        return not any(key == "error" or str(key).endswith("_error") for key in result)
+    return True
+
+
+_current_memo: ContextVar[Optional[ToolMemo]] = ContextVar(
+    "market_agent_tool_memo", default=None
+)
+
+
+def current_memo() -> Optional[ToolMemo]:
+    return _current_memo.get()
+
+
+@contextmanager
+def memo_scope(memo: Optional[ToolMemo]) -> Iterator[None]:
+    """블록 안에서 실행되는 도구 호출 결과를 memo에 저장하고 재사용합니다."""
+    token = _current_memo.set(memo)
+    try:
+        yield
+    finally:
+        _current_memo.reset(token)
+
+
+def new_run_memo() -> Optional[ToolMemo]:
+    """실행마다 사용할 도구 호출 저장소를 생성합니다.
+
+    - TOOL_MEMO_ENABLED: false이면 같은 실행 안에서도 도구를 매번 호출
+    """
+    if os.getenv("TOOL_MEMO_ENABLED", "true").lower() in ("0", "false", "no"):
+        return None
+    return ToolMemo()
+
+
+def normalize_args(args: Tuple, kwargs: Dict[str, Any]) -> str:
+    """공백과 대소문자만 다른 인자는 같은 호출로 취급하도록 인자를 정규화합니다."""
+
+    def normalize(value: Any) -> Any:
+        if isinstance(value, str):
+            return " ".join(value.split()).casefold()
+        if isinstance(value, dict):
+            return {str(k): normalize(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [normalize(v) for v in value]
+        return value
+
+    arguments = {k: v for k, v in kwargs.items() if k not in IGNORED_ARGS}
+    return json.dumps(
+        [normalize(list(args)), normalize(arguments)],
+        ensure_ascii=False,
+        sort_keys=True,
+        default=str,
+    )
+
+
+def memoize_tool(step: str = "run", cacheable: Callable[[Any], bool] = is_cacheable):
+    """도구 메서드의 결과를 현재 실행(run) 범위에서 재사용합니다.
+
+    키는 (도구 이름과 설정, step, 정규화된 인자)이며, 같은 step을 사용하는 `_run`과 `_arun`은
+    결과를 공유합니다. 실행 범위 밖(노드 직접 호출 등)에서는 항상 원래 메서드를 호출합니다.
+    예외는 저장하지 않으므로 도구는 오류를 문자열로 바꾸기 전, 예외가 발생하는 호출에
+    적용합니다. 반환값 중 cacheable이 거부한 결과도 저장하지 않습니다.
+
+    Example:
+    @memoize_tool()
+    def _search(self, query: str) -> List[Dict]: ...
+    """
+
+    def decorator(func):
+        def key(self, args, kwargs) -> Tuple[str, Hashable]:
+            if not isinstance(self, BaseTool):
+                # API wrapper 등은 토큰 같은 내부 상태가 바뀌므로 인자만 사용
+                tool = self.__class__.__name__
+                return tool, (tool, step, normalize_args(args, kwargs))
+
+            tool = self.name
+            # 같은 도구라도 설정(RSS 주소, 검색 종류 등)이 다르면 다른 호출
+            settings = {
+                field: value
+                for field, value in vars(self).items()
+                if isinstance(value, (str, int, float, bool))
+                and field not in IGNORED_FIELDS
+            }
+            return tool, (
+                tool,
+                step,
+                normalize_args((), settings),
+                normalize_args(args, kwargs),
+            )
+
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                memo = _current_memo.get()
+                if memo is None:
+                    return await func(self, *args, **kwargs)
+                tool, memo_key = key(self, args, kwargs)
+                return await memo.aget_or_call(
+                    tool, memo_key, lambda: func(self, *args, **kwargs), cacheable
+                )
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            memo = _current_memo.get()
+            if memo is None:
+                return func(self, *args, **kwargs)
+            tool, memo_key = key(self, args, kwargs)
+            return memo.get_or_call(
+                tool, memo_key, lambda: func(self, *args, **kwargs), cacheable
+            )
+
+        return wrapper
+
+    return decorator
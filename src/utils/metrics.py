@@ -0,0 +1,230 @@
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.tracers.context import register_configure_hook
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+from src.utils.budget import charge_api_call
+from src.utils.tracing import tracer
+
+# LLM 호출과 그래프 실행은 수십 초 이상 걸릴 수 있으므로 기본 버킷보다 넓게 설정
+LATENCY_BUCKETS = (
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    20.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+)
+
+GRAPH_RUN_SECONDS = Histogram(
+    "market_agent_graph_run_seconds",
+    "Supervisor graph run latency",
+    ["mode", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+NODE_RUN_SECONDS = Histogram(
+    "market_agent_node_run_seconds",
+    "Graph node _run/_arun latency",
+    ["node", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+TOOL_CALL_SECONDS = Histogram(
+    "market_agent_tool_call_seconds",
+    "Agent tool call latency",
+    ["tool", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_REQUEST_SECONDS = Histogram(
+    "market_agent_http_request_seconds",
+    "Outbound request latency by upstream",
+    ["upstream", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+SUPERVISOR_HOPS = Histogram(
+    "market_agent_supervisor_hops",
+    "Number of supervisor routing hops per graph run",
+    buckets=(0, 1, 2, 3, 4, 5, 6, 8, 10, 15, 20, 30),
+)
+PROMPT_TOKENS = Histogram(
+    "market_agent_prompt_history_tokens",
+    "Conversation history tokens passed to a node after compaction",
+    ["node"],
+    buckets=(250, 500, 1000, 2000, 4000, 8000, 16000, 32000, 64000),
+)
+PRE_ROUTER_DECISIONS = Counter(
+    "market_agent_pre_router_decisions",
+    "First-hop routing decisions by source (rule, embedding, llm)",
+    ["source"],
+)
+CACHE_REQUESTS = Counter(
+    "market_agent_cache_requests",
+    "Response cache lookups",
+    ["endpoint", "result"],
+)
+TOOL_MEMO_REQUESTS = Counter(
+    "market_agent_tool_memo_requests",
+    "Run-scoped tool call memo lookups",
+    ["tool", "result"],
+)
+CIRCUIT_TRANSITIONS = Counter(
+    "market_agent_circuit_transitions",
+    "Circuit breaker state changes by upstream host",
+    ["host", "state"],
+)
+
+
+@contextmanager
+def timed(histogram: Histogram, **labels: str) -> Iterator[None]:
+    """블록 실행 시간을 histogram에 기록합니다. 예외가 발생하면 status=error로 기록합니다."""
+    start_time = time.perf_counter()
+    status = "ok"
+    try:
+        yield
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        histogram.labels(status=status, **labels).observe(
+            time.perf_counter() - start_time
+        )
+
+
+@contextmanager
+def track_http(upstream: str) -> Iterator[None]:
+    """외부 API 호출 시간을 기록하고 span으로 추적합니다.
+
+    실행 예산(RunBudget)의 외부 API 호출 횟수에도 반영되며,
+    한도를 넘으면 호출 전에 BudgetExceededError가 발생합니다.
+
+    Example:
+    with track_http("naver"):
+        response = requests.get(url)
+    """
+    charge_api_call()
+    with (
+        tracer.span(f"http {upstream}", kind="http", upstream=upstream),
+        timed(HTTP_REQUEST_SECONDS, upstream=upstream),
+    ):
+        yield
+
+
+def observe_hops(hops: int):
+    SUPERVISOR_HOPS.observe(hops)
+
+
+def observe_prompt_tokens(node: str, tokens: int):
+    PROMPT_TOKENS.labels(node=node).observe(tokens)
+
+
+def record_pre_route(source: str):
+    PRE_ROUTER_DECISIONS.labels(source=source).inc()
+
+
+def record_cache_lookup(endpoint: str, hit: bool):
+    CACHE_REQUESTS.labels(endpoint=endpoint, result="hit" if hit else "miss").inc()
+
+
+def record_tool_memo(tool: str, hit: bool):
+    TOOL_MEMO_REQUESTS.labels(tool=tool, result="hit" if hit else "miss").inc()
+
+
+def record_circuit_transition(host: str, state: str):
+    CIRCUIT_TRANSITIONS.labels(host=host, state=state).inc()
+
+
+def render() -> Tuple[bytes, str]:
+    """Prometheus 텍스트 형식의 메트릭과 Content-Type을 반환합니다.
+
+    멀티 워커로 실행할 때는 PROMETHEUS_MULTIPROC_DIR을 설정하면
+    모든 워커 프로세스의 메트릭을 합산하여 반환합니다.
+    """
+    registry = REGISTRY
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+class MetricsCallbackHandler(BaseCallbackHandler):
+    """도구 호출과 retriever(Milvus) 조회 시간을 기록하는 콜백 핸들러"""
+
+    run_inline = True
+
+    def __init__(self):
+        self._runs: Dict[UUID, Tuple[Histogram, Dict[str, str], float]] = {}
+
+    def on_tool_start(
+        self,
+        serialized: Dict[str, Any],
+        input_str: str,
+        *,
+        run_id: UUID,
+        **kwargs: Any,
+    ):
+        name = (serialized or {}).get("name") or kwargs.get("name") or "unknown"
+        self._start(run_id, TOOL_CALL_SECONDS, tool=name)
+
+    def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any):
+        self._end(run_id, "ok")
+
+    def on_tool_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any):
+        self._end(run_id, "error")
+
+    def on_retriever_start(
+        self,
+        serialized: Dict[str, Any],
+        query: str,
+        *,
+        run_id: UUID,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ):
+        vendor = (metadata or {}).get("ls_vector_store_provider", "retriever")
+        self._start(run_id, HTTP_REQUEST_SECONDS, upstream=vendor.lower())
+
+    def on_retriever_end(self, documents: Any, *, run_id: UUID, **kwargs: Any):
+        self._end(run_id, "ok")
+
+    def on_retriever_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any):
+        self._end(run_id, "error")
+
+    def _start(self, run_id: UUID, histogram: Histogram, **labels: str):
+        self._runs[run_id] = (histogram, labels, time.perf_counter())
+
+    def _end(self, run_id: UUID, status: str):
+        run = self._runs.pop(run_id, None)
+        if run is None:
+            return
+        histogram, labels, start_time = run
+        histogram.labels(status=status, **labels).observe(
+            time.perf_counter() - start_time
+        )
+
+
+# 기본값을 가진 ContextVar로 등록하여 스레드나 호출 경로와 관계없이
+# 모든 콜백 매니저에 핸들러가 추가되도록 함
+_metrics_handler_var: ContextVar[Optional[MetricsCallbackHandler]] = ContextVar(
+    "market_agent_metrics_handler", default=MetricsCallbackHandler()
+)
+register_configure_hook(_metrics_handler_var, inheritable=True)
@@ -0,0 +1,225 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+from urllib.parse import urlparse
+
+from src.utils.budget import BudgetExceededError
+from src.utils.concurrency import RateLimitExceededError
+from src.utils.metrics import record_circuit_transition
+
+# 외부 호출 기본 timeout(초). 환경변수 `<UPSTREAM>_HTTP_TIMEOUT`, `HTTP_TIMEOUT`으로 변경 가능
+DEFAULT_HTTP_TIMEOUT = 10.0
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def http_timeout(upstream: str) -> float:
+    """upstream(naver, alpha_vantage, rss 등)별 외부 호출 timeout(초)"""
+    return float(
+        os.getenv(
+            f"{upstream.upper()}_HTTP_TIMEOUT",
+            os.getenv("HTTP_TIMEOUT", str(DEFAULT_HTTP_TIMEOUT)),
+        )
+    )
+
+
+def upstream_host(url: str) -> str:
+    """URL의 호스트(포트 포함). 차단기는 호스트 단위로 관리합니다."""
+    return (urlparse(url).netloc or url).lower()
+
+
+class CircuitOpenError(Exception):
+    """차단기가 열려 외부 호출을 보내지 않은 경우"""
+
+    def __init__(self, host: str, retry_after: float):
+        self.host = host
+        self.retry_after = retry_after
+        super().__init__(
+            f"Source '{host}' is unavailable (retry in {retry_after:.0f}s)"
+        )
+
+
+class CircuitBreaker:
+    """외부 호스트 하나에 대한 차단기
+
+    연속 실패가 failure_threshold에 도달하면 열리고(open), cooldown이 지나면
+    시험 호출 하나만 허용하는 half-open 상태가 됩니다. 시험 호출이 성공하면 닫히고(closed)
+    실패하면 다시 cooldown 동안 열립니다.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = 5,
+        cooldown: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._clock = clock
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == OPEN and self._clock() - self._opened_at >= self.cooldown:
+            self._transition(HALF_OPEN)
+        return self._state
+
+    def _transition(self, state: str):
+        self._state = state
+        record_circuit_transition(self.host, state)
+
+    def retry_after(self) -> float:
+        return max(0.0, self.cooldown - (self._clock() - self._opened_at))
+
+    def before_call(self):
+        """호출 가능 여부를 확인합니다. 열려 있거나 시험 호출 중이면 CircuitOpenError"""
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+            self.rejected += 1
+            raise CircuitOpenError(self.host, self.retry_after())
+
+    def record_success(self):
+        with self._lock:
+            self._probing = False
+            self._failures = 0
+            if self._state != CLOSED:
+                self._transition(CLOSED)
+
+    def record_failure(self):
+        with self._lock:
+            self._probing = False
+            self._failures += 1
+            if self._state == HALF_OPEN or (
+                self._state == CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._opened_at = self._clock()
+                self._transition(OPEN)
+
+    def release_probe(self):
+        """결과 없이 끝난 호출(취소 등)의 시험 호출 슬롯을 반납합니다."""
+        with self._lock:
+            self._probing = False
+
+    def reset(self):
+        self.record_success()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            state = self._current_state()
+            return {
+                "state": state,
+                "failures": self._failures,
+                "rejected": self.rejected,
+                "retry_after": round(self.retry_after(), 1) if state == OPEN else 0,
+            }
+
+
+class CircuitBreakerRegistry:
+    """호스트별 차단기를 관리합니다.
+
+    호출 제한(provider_limiter)은 차단기 밖에서 먼저 획득합니다.
+
+    Example:
+    with provider_limiter.limit("naver"), breakers.guard(url), track_http("naver"):
+        response = urllib.request.urlopen(request, timeout=http_timeout("naver"))
+    """
+
+    def __init__(self, failure_threshold: int = 5, cooldown: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "CircuitBreakerRegistry":
+        """환경변수로부터 생성합니다.
+
+        - CIRCUIT_FAILURE_THRESHOLD: 차단기가 열리는 연속 실패 횟수
+        - CIRCUIT_COOLDOWN: 열린 차단기가 시험 호출을 허용하기까지의 시간(초)
+        """
+        return cls(
+            failure_threshold=int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5")),
+            cooldown=float(os.getenv("CIRCUIT_COOLDOWN", "30")),
+        )
+
+    def get(self, url: str) -> CircuitBreaker:
+        host = upstream_host(url)
+        with self._lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker(
+                    host, self.failure_threshold, self.cooldown
+                )
+            return self._breakers[host]
+
+    def is_open(self, url: str) -> bool:
+        """호출이 바로 거절될 상태인지 확인합니다. (half-open은 시험 호출을 허용하므로 False)"""
+        host = upstream_host(url)
+        breaker = self._breakers.get(host)
+        return breaker is not None and breaker.state == OPEN
+
+    @contextmanager
+    def guard(self, url: str) -> Iterator[None]:
+        """블록 안의 외부 호출 결과를 차단기에 기록합니다.
+
+        차단기가 열려 있으면 호출하지 않고 CircuitOpenError를 발생시킵니다.
+        실행 예산 초과(BudgetExceededError)와 호출 한도 초과(RateLimitExceededError)는
+        호스트 장애가 아니므로 실패로 세지 않습니다.
+        """
+        breaker = self.get(url)
+        breaker.before_call()
+        try:
+            yield
+        except (BudgetExceededError, RateLimitExceededError):
+            breaker.release_probe()
+            raise
+        except Exception:
+            breaker.record_failure()
+            raise
+        except BaseException:
+            breaker.release_probe()
+            raise
+        else:
+            breaker.record_success()
+
+    def reset(self, host: str) -> bool:
+        breaker = self._breakers.get(upstream_host(host))
+        if breaker is None:
+            return False
+        breaker.reset()
+        return True
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {host: breaker.stats() for host, breaker in breakers.items()}
+
+
+breakers = CircuitBreakerRegistry.from_env()
+
+
+def unavailable_upstream(urls) -> Optional[CircuitBreaker]:
+    """urls의 호스트가 모두 차단된 경우 그중 하나의 차단기를 반환합니다."""
+    urls = list(urls)
+    if not urls or not all(breakers.is_open(url) for url in urls):
+        return None
+    return breakers.get(urls[0])
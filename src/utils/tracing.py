@@ -0,0 +1,497 @@
+import asyncio
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+import requests
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.tracers.context import register_configure_hook
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger("market_agent.tracing")
+
+# OTLP SpanKind (INTERNAL=1, SERVER=2, CLIENT=3)
+OTLP_SPAN_KINDS = {"run": 2, "http": 3, "llm": 3}
+
+
+class Span:
+    """그래프 실행, 노드, 도구, 외부 호출 한 번의 구간
+
+    시간은 time.monotonic_ns로 측정하고, 내보낼 때만 시작 시각(wall clock)을 함께 사용합니다.
+    """
+
+    __slots__ = (
+        "name",
+        "kind",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "attributes",
+        "status",
+        "error",
+        "start_unix_ns",
+        "_start_ns",
+        "_end_ns",
+    )
+
+    sampled = True
+
+    def __init__(
+        self,
+        name: str,
+        kind: str,
+        trace_id: str,
+        parent_id: Optional[str],
+        attributes: Dict[str, Any],
+    ):
+        self.name = name
+        self.kind = kind
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.status = "ok"
+        self.error: Optional[str] = None
+        self.start_unix_ns = time.time_ns()
+        self._start_ns = time.monotonic_ns()
+        self._end_ns: Optional[int] = None
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def record_error(self, error: BaseException):
+        self.status = "error"
+        self.error = repr(error)
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        if self._end_ns is None:
+            return None
+        return (self._end_ns - self._start_ns) / 1e6
+
+    def end(self):
+        self._end_ns = time.monotonic_ns()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_unix_ns": self.start_unix_ns,
+            "duration_ms": self.duration_ms,
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+class _NoopSpan:
+    """샘플링되지 않았거나 추적이 꺼진 경우의 span. 하위 span도 기록하지 않습니다."""
+
+    sampled = False
+    trace_id = None
+    span_id = None
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def record_error(self, error: BaseException):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+_current_span: ContextVar[Optional[Span]] = ContextVar(
+    "market_agent_current_span", default=None
+)
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+class SpanExporter:
+    """종료된 span을 받아 저장하거나 전송합니다. span이 끝날 때마다 호출되므로 빠르게 반환해야 합니다."""
+
+    def export(self, span: Span):
+        raise NotImplementedError
+
+    def shutdown(self):
+        pass
+
+
+class InMemoryExporter(SpanExporter):
+    """최근 span을 고정 크기 ring buffer에 보관합니다. (/api/traces 조회용)"""
+
+    def __init__(self, max_spans: int = 2048):
+        self._spans: Deque[Span] = deque(maxlen=max_spans)
+
+    def export(self, span: Span):
+        self._spans.append(span)
+
+    def spans(self, trace_id: Optional[str] = None) -> List[Span]:
+        spans = list(self._spans)
+        if trace_id is not None:
+            spans = [span for span in spans if span.trace_id == trace_id]
+        return spans
+
+    def clear(self):
+        self._spans.clear()
+
+
+class JsonLinesExporter(SpanExporter):
+    """span을 한 줄에 하나씩 JSON으로 파일에 추가합니다."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        line = json.dumps(span.to_dict(), ensure_ascii=False, default=str)
+        with self._lock:
+            if self._file is None:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8", buffering=1)
+            self._file.write(line + "\n")
+
+    def shutdown(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class OTLPHttpExporter(SpanExporter):
+    """OTLP/HTTP(JSON) 수집기(OpenTelemetry Collector, Jaeger, Tempo 등)로 span을 전송합니다.
+
+    span은 메모리에 모았다가 별도 스레드에서 batch_size개 또는 interval초마다 전송합니다.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        service_name: str = "market-analysis-agent",
+        batch_size: int = 256,
+        interval: float = 2.0,
+        max_queue: int = 8192,
+        timeout: float = 5.0,
+    ):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.batch_size = batch_size
+        self.interval = interval
+        self.timeout = timeout
+        self.dropped = 0
+        self._queue: Deque[Span] = deque(maxlen=max_queue)
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        if len(self._queue) == self._queue.maxlen:
+            self.dropped += 1
+        self._queue.append(span)
+        if self._thread is None:
+            self._start()
+        if len(self._queue) >= self.batch_size:
+            self._wakeup.set()
+
+    def shutdown(self):
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.timeout)
+        self.flush()
+
+    def flush(self):
+        while self._queue:
+            batch = []
+            while self._queue and len(batch) < self.batch_size:
+                batch.append(self._queue.popleft())
+            try:
+                response = requests.post(
+                    self.endpoint, json=self.payload(batch), timeout=self.timeout
+                )
+                response.raise_for_status()
+            except Exception as e:
+                logger.warning(f"Failed to export {len(batch)} spans: {e}")
+                return
+
+    def payload(self, spans: List[Span]) -> Dict[str, Any]:
+        """OTLP ExportTraceServiceRequest의 JSON 표현"""
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": _otlp_attributes(
+                            {"service.name": self.service_name}
+                        )
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "market_agent"},
+                            "spans": [_otlp_span(span) for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._loop, name="otlp-exporter", daemon=True
+                )
+                self._thread.start()
+
+    def _loop(self):
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            self.flush()
+
+
+class Tracer:
+    """span을 만들고 종료된 span을 exporter로 넘깁니다.
+
+    샘플링은 실행(trace) 단위로 결정되며, 샘플링되지 않은 실행의 하위 span은 만들지 않습니다.
+    exporter가 없으면 모든 호출이 곧바로 반환됩니다.
+    """
+
+    def __init__(
+        self, exporters: Optional[List[SpanExporter]] = None, sample_rate: float = 1.0
+    ):
+        self.exporters = list(exporters or [])
+        self.sample_rate = sample_rate
+
+    @classmethod
+    def from_env(cls) -> "Tracer":
+        """환경변수로부터 tracer를 생성합니다.
+
+        - TRACE_EXPORTER: memory, jsonl, otlp 중 쉼표로 구분한 목록 (none이면 사용 안 함)
+        - TRACE_SAMPLE_RATE: 기록할 실행의 비율 (0~1)
+        - TRACE_BUFFER_SIZE: memory exporter가 보관하는 최근 span 수
+        - TRACE_JSONL_PATH: jsonl exporter의 파일 경로
+        - TRACE_OTLP_ENDPOINT: OTLP/HTTP 수집기 주소
+        - TRACE_SERVICE_NAME: OTLP로 전송할 서비스 이름
+        """
+        exporters: List[SpanExporter] = []
+        for name in os.getenv("TRACE_EXPORTER", "memory").split(","):
+            name = name.strip().lower()
+            if name == "memory":
+                exporters.append(
+                    InMemoryExporter(int(os.getenv("TRACE_BUFFER_SIZE", "2048")))
+                )
+            elif name == "jsonl":
+                exporters.append(
+                    JsonLinesExporter(os.getenv("TRACE_JSONL_PATH", "traces.jsonl"))
+                )
+            elif name == "otlp":
+                exporters.append(
+                    OTLPHttpExporter(
+                        os.getenv(
+                            "TRACE_OTLP_ENDPOINT", "http://localhost:4318/v1/traces"
+                        ),
+                        service_name=os.getenv(
+                            "TRACE_SERVICE_NAME", "market-analysis-agent"
+                        ),
+                    )
+                )
+            elif name not in ("", "none", "off"):
+                raise ValueError(f"Unknown TRACE_EXPORTER: {name}")
+        return cls(exporters, float(os.getenv("TRACE_SAMPLE_RATE", "1.0")))
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.exporters)
+
+    def start_span(self, name: str, kind: str = "internal", **attributes: Any):
+        """현재 span의 하위 span을 시작합니다. 현재 span으로 설정하지는 않습니다."""
+        parent = _current_span.get()
+        if not self.exporters or parent is NOOP_SPAN:
+            return NOOP_SPAN
+        if parent is None:
+            if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+                return NOOP_SPAN
+            return Span(name, kind, f"{random.getrandbits(128):032x}", None, attributes)
+        return Span(name, kind, parent.trace_id, parent.span_id, attributes)
+
+    def end_span(self, span):
+        if not span.sampled:
+            return
+        span.end()
+        for exporter in self.exporters:
+            try:
+                exporter.export(span)
+            except Exception as e:
+                logger.warning(f"Span export failed ({type(exporter).__name__}): {e}")
+
+    def activate(self, span) -> Optional[Token]:
+        if not self.exporters:
+            return None
+        return _current_span.set(span)
+
+    def deactivate(self, token: Optional[Token]):
+        if token is None:
+            return
+        try:
+            _current_span.reset(token)
+        except ValueError:
+            # 다른 context에서 종료된 경우 (해당 context는 이미 버려짐)
+            pass
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        kind: str = "internal",
+        activate: bool = True,
+        **attributes: Any,
+    ) -> Iterator:
+        """블록 실행을 span으로 기록합니다. 블록 안에서 시작하는 span은 이 span의 하위가 됩니다.
+
+        하위 span이 없는 구간(스트리밍 LLM 호출 등)은 activate=False로 현재 span을 바꾸지 않습니다.
+
+        Example:
+        with tracer.span("http naver", kind="http", upstream="naver"):
+            response = requests.get(url)
+        """
+        if not self.exporters:
+            yield NOOP_SPAN
+            return
+        span = self.start_span(name, kind, **attributes)
+        token = self.activate(span) if activate else None
+        try:
+            yield span
+        except BaseException as e:
+            span.record_error(e)
+            raise
+        finally:
+            self.deactivate(token)
+            self.end_span(span)
+
+    def recent(
+        self, trace_id: Optional[str] = None, limit: int = 200
+    ) -> List[Dict[str, Any]]:
+        """memory exporter에 보관된 최근 span을 시작 시각 순으로 반환합니다."""
+        for exporter in self.exporters:
+            if isinstance(exporter, InMemoryExporter):
+                spans = sorted(
+                    exporter.spans(trace_id), key=lambda span: span.start_unix_ns
+                )
+                return [span.to_dict() for span in spans[-limit:]]
+        return []
+
+    def shutdown(self):
+        for exporter in self.exporters:
+            exporter.shutdown()
+
+    async def ashutdown(self):
+        """서버 종료 훅에서 사용합니다. 남은 span을 전송하고 파일을 닫습니다."""
+        await asyncio.to_thread(self.shutdown)
+
+
+class TracingCallbackHandler(BaseCallbackHandler):
+    """도구 호출을 span으로 기록하는 콜백 핸들러
+
+    도구 실행 중 시작되는 외부 API 호출 span이 도구 span의 하위가 되도록
+    도구가 끝날 때까지 현재 span으로 설정합니다.
+    """
+
+    run_inline = True
+
+    def __init__(self, tracer: Tracer):
+        self.tracer = tracer
+        self._runs: Dict[UUID, Tuple[Any, Optional[Token]]] = {}
+
+    def on_tool_start(
+        self,
+        serialized: Dict[str, Any],
+        input_str: str,
+        *,
+        run_id: UUID,
+        **kwargs: Any,
+    ):
+        if not self.tracer.enabled:
+            return
+        name = (serialized or {}).get("name") or kwargs.get("name") or "unknown"
+        span = self.tracer.start_span(f"tool {name}", kind="tool", tool=name)
+        self._runs[run_id] = (span, self.tracer.activate(span))
+
+    def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any):
+        self._end(run_id)
+
+    def on_tool_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any):
+        self._end(run_id, error)
+
+    def _end(self, run_id: UUID, error: Optional[BaseException] = None):
+        run = self._runs.pop(run_id, None)
+        if run is None:
+            return
+        span, token = run
+        if error is not None:
+            span.record_error(error)
+        self.tracer.deactivate(token)
+        self.tracer.end_span(span)
+
+
+def _otlp_span(span: Span) -> Dict[str, Any]:
+    end_unix_ns = span.start_unix_ns + (span._end_ns - span._start_ns)
+    otlp = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": OTLP_SPAN_KINDS.get(span.kind, 1),
+        "startTimeUnixNano": str(span.start_unix_ns),
+        "endTimeUnixNano": str(end_unix_ns),
+        "attributes": _otlp_attributes(
+            {"market_agent.kind": span.kind, **span.attributes}
+        ),
+        "status": {"code": 2, "message": span.error}
+        if span.status == "error"
+        else {"code": 1},
+    }
+    if span.parent_id:
+        otlp["parentSpanId"] = span.parent_id
+    return otlp
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    values = []
+    for key, value in attributes.items():
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            typed = {"boolValue": value}
+        elif isinstance(value, int):
+            typed = {"intValue": str(value)}
+        elif isinstance(value, float):
+            typed = {"doubleValue": value}
+        else:
+            typed = {"stringValue": str(value)}
+        values.append({"key": key, "value": typed})
+    return values
+
+
+tracer = Tracer.from_env()
+
+# 메트릭 핸들러와 같이 모든 콜백 매니저에 도구 추적 핸들러를 추가
+_tracing_handler_var: ContextVar[Optional[TracingCallbackHandler]] = ContextVar(
+    "market_agent_tracing_handler", default=TracingCallbackHandler(tracer)
+)
+register_configure_hook(_tracing_handler_var, inheritable=True)
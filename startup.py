@@ -1,10 +1,21 @@
 import os
 
 from dependency_injector import containers, providers
-from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from langchain_openai import OpenAIEmbeddings
 from langchain_milvus import Milvus
 
 from src.graph.builder import SupervisorGraphBuilder
+from src.graph.checkpointer import create_checkpointer
+from src.graph.compaction import MessageCompactor
+from src.graph.pre_router import FastPathRouter
+from src.services.job_runner import JobRunner
+from src.services.job_store import JobStore
+from src.services.node_executor import NodeExecutorPool
+from src.services.response_cache import ResponseCache
+from src.services.single_flight import SingleFlight
+from src.utils.budget import RunBudget
+from src.utils.http_client import http_clients as default_http_clients
+from src.utils.llm import llm_registry as default_llm_registry
 from src.utils.logger import setup_logger
 
 
@@ -12,12 +23,54 @@ class Container(containers.DeclarativeContainer):
     config = providers.Configuration()
     logger = providers.Singleton(setup_logger, "market_agent")
 
-    supervisor_graph = providers.Singleton(SupervisorGraphBuilder)
+    # supervisor LLM 호출 전에 명확한 요청을 바로 worker로 보내는 사전 라우터
+    pre_router = providers.Singleton(FastPathRouter.from_env)
 
-    llm = providers.Singleton(ChatOpenAI, model="gpt-4o-mini", temperature=0)
+    # 대화 스레드(thread_id)와 중단된 실행 재개를 위한 그래프 checkpoint 저장소
+    checkpointer = providers.Singleton(create_checkpointer)
+
+    # hop마다 노드에 전달하는 대화 기록의 토큰 수를 제한
+    message_compactor = providers.Singleton(MessageCompactor.from_env)
+
+    supervisor_graph = providers.Singleton(
+        SupervisorGraphBuilder,
+        pre_router=pre_router,
+        checkpointer=checkpointer,
+        compactor=message_compactor,
+    )
+
+    # (model, temperature, max_tokens)별 LLM 클라이언트 레지스트리 (커넥션 풀 공유)
+    llm_registry = providers.Object(default_llm_registry)
+
+    # 외부 API(Naver, Google, RSS, Alpha Vantage, 한투) 호출이 공유하는 HTTP 커넥션 풀
+    http_clients = providers.Object(default_http_clients)
+
+    # 요청별 실행 예산의 전역 상한 (RUN_*)
+    run_budget = providers.Singleton(RunBudget.from_env)
 
     embeddings = providers.Singleton(OpenAIEmbeddings, model="text-embedding-3-small")
 
+    response_cache = providers.Singleton(ResponseCache.from_env)
+
+    single_flight = providers.Singleton(SingleFlight)
+
+    node_executors = providers.Singleton(NodeExecutorPool)
+
+    job_store = providers.Singleton(
+        JobStore,
+        path=os.getenv("JOB_STORE_PATH", "jobs.sqlite3"),
+        lease_seconds=float(os.getenv("JOB_LEASE_SECONDS", "60")),
+    )
+
+    job_runner = providers.Singleton(
+        JobRunner,
+        graph=supervisor_graph,
+        llms=llm_registry,
+        store=job_store,
+        budget=run_budget,
+        workers=int(os.getenv("JOB_WORKERS", "2")),
+    )
+
     vector_store_recap = providers.Singleton(
         Milvus,
         embedding_function=embeddings,
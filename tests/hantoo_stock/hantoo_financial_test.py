@@ -65,8 +65,8 @@ class TestHantooFinancialNode(unittest.TestCase):
         )
 
     @patch("src.graph.nodes.hantoo_financial.create_react_agent")
-    @patch("src.graph.nodes.hantoo_financial.ChatOpenAI")
-    def test_invoke(self, mock_chat_openai, mock_create_agent):
+    @patch("src.graph.nodes.base.llm_registry")
+    def test_invoke(self, mock_llm_registry, mock_create_agent):
         """API 엔드포인트 호출 테스트 - 에이전트 모킹"""
         # 결과 설정
         result_content = "Financial Statement Analysis for Stock Code 005930\n\nThe company shows strong financials..."
@@ -85,6 +85,11 @@ class TestHantooFinancialNode(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertIn("Financial Statement Analysis", result.answer)
         self.assertEqual(result.answer, result_content)
+        # 공유 LLM 레지스트리의 클라이언트를 사용하는지 확인
+        mock_llm_registry.get.assert_called_with(self.node.DEFAULT_LLM_MODEL)
+        self.assertIs(
+            mock_create_agent.call_args.args[0], mock_llm_registry.get.return_value
+        )
 
 
 if __name__ == "__main__":
@@ -35,7 +35,7 @@ class TestHantooStockAPI(unittest.TestCase):
         self.assertTrue(len(token) > 10)  # 토큰이 유효한 길이인지 확인
 
     @patch("src.tools.hantoo_stock.hantoo_stock.HantooStockAPIWrapper.get_access_token")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_stock_info(self, mock_get, mock_get_token):
         """주식 기본 정보 조회 테스트"""
         # 목 응답 설정
@@ -61,7 +61,7 @@ class TestHantooStockAPI(unittest.TestCase):
         self.assertEqual(result["output"]["pdno"], "005930")
 
     @patch("src.tools.hantoo_stock.hantoo_stock.HantooStockAPIWrapper.get_access_token")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_balance_sheet(self, mock_get, mock_get_token):
         """대차대조표 조회 테스트"""
         # 목 응답 설정
@@ -93,7 +93,7 @@ class TestHantooStockAPI(unittest.TestCase):
         self.assertEqual(result["output"][0]["total_cptl"], "2500000")
 
     @patch("src.tools.hantoo_stock.hantoo_stock.HantooStockAPIWrapper.get_access_token")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_income_statement(self, mock_get, mock_get_token):
         """손익계산서 조회 테스트"""
         # 목 응답 설정
@@ -124,7 +124,7 @@ class TestHantooStockAPI(unittest.TestCase):
         self.assertEqual(result["output"][0]["thtr_ntin"], "150000")
 
     @patch("src.tools.hantoo_stock.hantoo_stock.HantooStockAPIWrapper.get_access_token")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_analyze_financial_statements(self, mock_get, mock_get_token):
         """재무제표 분석 테스트"""
         # 목 토큰 설정
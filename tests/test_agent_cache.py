@@ -0,0 +1,115 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from langchain_core.messages import AIMessage
+
+from src.graph.nodes.base import AgentCache, Node
+from src.graph.nodes.naver_news_searcher import NaverNewsSearcherNode
+from src.models.do import RawResponse
+
+
+def _llm(model="gpt-4o-mini", temperature=0.0, max_tokens=None):
+    return SimpleNamespace(
+        model_name=model, temperature=temperature, max_tokens=max_tokens
+    )
+
+
+def test_builds_once_per_config():
+    """같은 설정에는 한 번만 에이전트를 만들고, 다른 설정에는 새로 만드는지 테스트"""
+    cache = AgentCache()
+    build = MagicMock(side_effect=lambda llm: object())
+
+    agent = cache.get(_llm(), build)
+
+    # 설정이 같으면 다른 클라이언트 인스턴스여도 같은 에이전트를 사용
+    assert cache.get(_llm(), build) is agent
+    assert cache.get(_llm(temperature=0.7), build) is not agent
+    assert cache.get(_llm(model="gpt-4o"), build) is not agent
+    assert build.call_count == 3
+
+
+def test_evicts_least_recently_used():
+    """크기 제한을 넘으면 가장 오래 사용하지 않은 에이전트부터 제거하는지 테스트"""
+    cache = AgentCache(max_size=2)
+    build = MagicMock(side_effect=lambda llm: object())
+
+    first = cache.get(_llm("a"), build)
+    cache.get(_llm("b"), build)
+    assert cache.get(_llm("a"), build) is first
+    cache.get(_llm("c"), build)
+
+    assert len(cache) == 2
+    assert cache.get(_llm("a"), build) is first
+    cache.get(_llm("b"), build)
+    assert build.call_count == 4
+
+
+def test_concurrent_requests_build_once():
+    """여러 스레드가 동시에 요청해도 에이전트를 한 번만 만드는지 테스트"""
+    cache = AgentCache()
+    calls = []
+
+    def build(llm):
+        calls.append(llm)
+        time.sleep(0.05)
+        return object()
+
+    agents = []
+    threads = [
+        threading.Thread(target=lambda: agents.append(cache.get(_llm(), build)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(agent is agents[0] for agent in agents)
+
+
+@patch("src.graph.nodes.naver_news_searcher.create_react_agent")
+def test_node_uses_requested_llm(mock_create_agent):
+    """노드가 요청 state의 LLM으로 만든 에이전트를 사용하는지 테스트"""
+    mock_create_agent.side_effect = lambda llm, tools, prompt: MagicMock(llm=llm)
+    node = NaverNewsSearcherNode()
+
+    mini, large = _llm(), _llm(model="gpt-4o")
+
+    assert node._get_agent({"llm": mini}).llm is mini
+    assert node._get_agent({"llm": large}).llm is large
+    assert node._get_agent({"llm": _llm()}).llm is mini
+    assert mock_create_agent.call_count == 2
+
+
+class SyncOnlyNode(Node):
+    def _run(self, state: dict):
+        return None
+
+    def _invoke(self, query: str) -> RawResponse:
+        return RawResponse(answer=f"{query}:{threading.get_ident()}")
+
+
+@patch("src.graph.nodes.naver_news_searcher.create_react_agent")
+def test_ainvoke_awaits_agent_or_offloads_sync_nodes(mock_create_agent):
+    """비동기 노드는 에이전트를 await하고, 동기 전용 노드는 스레드에서 실행되는지 테스트"""
+    agent = MagicMock()
+    agent.ainvoke = AsyncMock(
+        return_value={"messages": [AIMessage(content="뉴스 요약")]}
+    )
+    mock_create_agent.return_value = agent
+    node = NaverNewsSearcherNode()
+
+    assert node.supports_async
+    assert asyncio.run(node.ainvoke("삼성전자 뉴스")).answer == "뉴스 요약"
+    agent.ainvoke.assert_awaited_once()
+    agent.invoke.assert_not_called()
+
+    sync_node = SyncOnlyNode()
+    assert not sync_node.supports_async
+    answer = asyncio.run(sync_node.ainvoke("질문")).answer
+    assert answer.startswith("질문:")
+    assert answer != f"질문:{threading.get_ident()}"
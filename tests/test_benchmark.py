@@ -0,0 +1,39 @@
+import os
+
+from benchmarks.run_graph import benchmark, parse_args, percentile
+from src.utils.concurrency import provider_limiter
+
+
+def test_percentile():
+    """선형 보간 백분위수 계산 테스트"""
+    values = [10.0, 20.0, 30.0, 40.0]
+
+    assert percentile(values, 50) == 25.0
+    assert percentile(values, 100) == 40.0
+    assert percentile([], 95) == 0.0
+
+
+def test_graph_benchmark_runs_offline():
+    """스크립트 LLM과 스텁 서버만으로 전체 노드 그래프가 오류 없이 실행되는지 테스트"""
+    args = parse_args(
+        ["--concurrency", "1", "4", "--queries", "8", "--llm-latency", "0"]
+        + ["--stub-latency", "0", "--output", ""]
+    )
+
+    rate_limiter = provider_limiter.rate_limiter
+    naver_url = os.environ.get("NAVER_API_URL")
+
+    report = benchmark(args)
+
+    # 스텁 서버용 설정이 이후 테스트로 새지 않음
+    assert provider_limiter.rate_limiter is rate_limiter
+    assert os.environ.get("NAVER_API_URL") == naver_url
+
+    assert [level["concurrency"] for level in report["levels"]] == [1, 4]
+    for level in report["levels"]:
+        assert level["errors"] == 0, level["error_samples"]
+        assert level["hops"]["mean"] >= 1
+        assert level["latency_ms"]["p50"] <= level["latency_ms"]["p99"]
+    assert {"naver", "alpha_vantage", "hantoo", "rss"} <= set(
+        report["upstream_requests"]
+    )
@@ -0,0 +1,69 @@
+import pytest
+
+from src.utils.budget import (
+    BudgetExceededError,
+    BudgetTracker,
+    RunBudget,
+    budget_scope,
+    charge_api_call,
+    charge_tokens,
+    check_budget,
+)
+from src.utils.metrics import track_http
+
+
+def test_merge_keeps_tighter_limits():
+    """요청별 예산이 전역 예산보다 느슨해질 수 없는지 테스트"""
+    default = RunBudget(deadline_seconds=60, max_hops=8)
+    override = RunBudget(deadline_seconds=600, max_hops=3, max_tokens=1000)
+
+    merged = default.merge(override)
+
+    assert merged == RunBudget(deadline_seconds=60, max_hops=3, max_tokens=1000)
+    assert default.merge(None) is default
+
+
+def test_from_env(monkeypatch):
+    """환경변수로 전역 예산을 설정하고, 빈 값은 제한 없음으로 처리하는지 테스트"""
+    monkeypatch.setenv("RUN_DEADLINE_SECONDS", "30")
+    monkeypatch.setenv("RUN_MAX_HOPS", "5")
+    monkeypatch.setenv("RUN_MAX_TOKENS", "")
+    monkeypatch.delenv("RUN_MAX_API_CALLS", raising=False)
+
+    assert RunBudget.from_env() == RunBudget(deadline_seconds=30, max_hops=5)
+
+
+def test_tracker_reports_exhausted_budget():
+    """토큰과 hop 예산 소진을 판단하는지 테스트"""
+    tracker = BudgetTracker(RunBudget(max_hops=2, max_tokens=100))
+
+    assert tracker.exhausted(hops=1) is None
+    assert tracker.exhausted(hops=2) == "max_hops"
+
+    tracker.charge_tokens(100)
+    assert tracker.exhausted() == "max_tokens"
+    with pytest.raises(BudgetExceededError) as exc_info:
+        tracker.check()
+    assert exc_info.value.reason == "max_tokens"
+
+
+def test_api_calls_are_charged_within_scope():
+    """예산 범위 안의 외부 API 호출만 집계되고, 한도를 넘는 호출은 거절되는지 테스트"""
+    tracker = BudgetTracker(RunBudget(max_api_calls=1))
+
+    with track_http("outside"):
+        pass
+    with budget_scope(tracker):
+        with track_http("naver"):
+            charge_tokens(42)
+        # 한도까지 사용한 것은 소진으로 보지 않음
+        check_budget()
+        with pytest.raises(BudgetExceededError):
+            charge_api_call()
+        with pytest.raises(BudgetExceededError):
+            check_budget()
+
+    assert tracker.usage()["api_calls"] == 1
+    assert tracker.usage()["tokens"] == 42
+    # 범위 밖에서는 예산을 적용하지 않음
+    check_budget()
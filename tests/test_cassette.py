@@ -0,0 +1,115 @@
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from src.utils.cassette import (
+    Cassette,
+    CassetteMissError,
+    CassetteTransport,
+)
+from src.utils.llm import LimitedChatOpenAI
+
+
+def _unreachable():
+    raise AssertionError("replay must not call the upstream")
+
+
+def test_record_then_replay(tmp_path):
+    """녹화한 응답을 네트워크 호출 없이 같은 순서로 재생하는지 테스트"""
+    path = str(tmp_path / "cassette.json")
+    recorder = Cassette(path, mode="record")
+    responses = iter(["first", "second"])
+
+    assert recorder.fetch("naver", {"url": "u"}, lambda: next(responses)) == "first"
+    assert recorder.fetch("naver", {"url": "u"}, lambda: next(responses)) == "second"
+    recorder.fetch(
+        "hantoo",
+        {"url": "token"},
+        lambda: {"data": {"access_token": "secret"}},
+        redact=("access_token",),
+    )
+
+    player = Cassette(path, mode="replay", latency=0)
+    assert player.fetch("naver", {"url": "u"}, _unreachable) == "first"
+    assert player.fetch("naver", {"url": "u"}, _unreachable) == "second"
+    # 끝까지 재생하면 처음부터 다시 반환
+    assert player.fetch("naver", {"url": "u"}, _unreachable) == "first"
+    assert player.fetch("hantoo", {"url": "token"}, _unreachable) == {
+        "data": {"access_token": "REDACTED"}
+    }
+    assert "secret" not in (tmp_path / "cassette.json").read_text()
+
+    with pytest.raises(CassetteMissError):
+        player.fetch("naver", {"url": "other"}, _unreachable)
+
+
+def test_replay_simulates_latency(tmp_path):
+    """녹화된 응답 시간 또는 지정한 시간만큼 기다린 뒤 응답하는지 테스트"""
+    path = str(tmp_path / "cassette.json")
+    recorder = Cassette(path, mode="record")
+
+    async def slow():
+        await asyncio.sleep(0.1)
+        return "ok"
+
+    asyncio.run(recorder.afetch("rss", {"url": "u"}, slow))
+
+    for player, expected in (
+        (Cassette(path, mode="replay"), 0.1),
+        (Cassette(path, mode="replay", latency_scale=0.5), 0.05),
+        (Cassette(path, mode="replay", latency=0.2), 0.2),
+    ):
+        start_time = time.perf_counter()
+        assert asyncio.run(player.afetch("rss", {"url": "u"}, _unreachable)) == "ok"
+        assert time.perf_counter() - start_time == pytest.approx(expected, abs=0.04)
+
+
+def test_rejects_other_cassette_version(tmp_path):
+    """형식 버전이 다른 카세트는 불러오지 않는지 테스트"""
+    path = tmp_path / "cassette.json"
+    path.write_text(json.dumps({"version": 0, "interactions": []}))
+
+    with pytest.raises(ValueError):
+        Cassette(str(path), mode="replay")
+
+
+def test_replays_llm_calls_offline(tmp_path):
+    """OpenAI 요청을 transport 단에서 녹화하고 네트워크 없이 재생하는지 테스트"""
+    path = str(tmp_path / "cassette.json")
+    completion = {
+        "id": "chatcmpl-1",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-4o-mini",
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": "recorded answer"},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {"prompt_tokens": 5, "completion_tokens": 2, "total_tokens": 7},
+    }
+
+    def llm(cassette, handler):
+        transport = CassetteTransport(cassette, "openai", httpx.MockTransport(handler))
+        return LimitedChatOpenAI(
+            model="gpt-4o-mini",
+            api_key="test-key",
+            http_client=httpx.Client(transport=transport),
+        )
+
+    recorder = Cassette(path, mode="record")
+    answer = llm(recorder, lambda request: httpx.Response(200, json=completion))
+    assert answer.invoke("hello").content == "recorded answer"
+
+    def offline(request):
+        raise httpx.ConnectError("offline")
+
+    player = Cassette(path, mode="replay", latency=0)
+    assert llm(player, offline).invoke("hello").content == "recorded answer"
+    # 인증 헤더는 카세트에 저장하지 않음
+    assert "test-key" not in (tmp_path / "cassette.json").read_text()
@@ -0,0 +1,58 @@
+from langchain_core.messages import HumanMessage
+
+from src.graph.compaction import MessageCompactor, TokenCounter
+
+
+class CharCounter(TokenCounter):
+    """문자 하나를 토큰 하나로 계산하는 테스트용 계산기"""
+
+    def count(self, text: str) -> int:
+        return len(text)
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        return text[:max_tokens]
+
+
+def _history():
+    return [
+        HumanMessage(content="question"),
+        HumanMessage(content="a" * 100, name="first"),
+        HumanMessage(content="b" * 100, name="second"),
+        HumanMessage(content="c" * 100, name="third"),
+    ]
+
+
+def test_keeps_history_under_threshold():
+    """토큰 한도 이하이면 대화 기록을 그대로 반환하는지 테스트"""
+    compactor = MessageCompactor(max_tokens=1000, counter=CharCounter())
+    messages = _history()
+
+    assert compactor.compact(messages) == messages
+
+
+def test_truncates_oldest_worker_messages_first():
+    """오래된 worker 결과부터 줄이고 최근 결과와 사용자 메시지는 유지하는지 테스트"""
+    compactor = MessageCompactor(
+        max_tokens=250, keep_recent=1, excerpt_tokens=10, counter=CharCounter()
+    )
+    messages = _history()
+
+    compacted = compactor.compact(messages)
+
+    assert compacted[0].content == "question"
+    assert compacted[1].content.startswith("a" * 10 + "\n")
+    assert compacted[1].name == "first"
+    # 한도 이하가 되면 더 줄이지 않음
+    assert compacted[2].content == "b" * 100
+    assert compacted[3].content == "c" * 100
+    # 원본 메시지는 바뀌지 않음
+    assert messages[1].content == "a" * 100
+
+
+def test_estimates_tokens_without_encoding():
+    """tiktoken 인코딩을 불러올 수 없으면 바이트 수로 추정하는지 테스트"""
+    counter = TokenCounter()
+    counter._encoding, counter._loaded = None, True
+
+    assert counter.count("a" * 40) == 10
+    assert counter.truncate("a" * 40, 5) == "a" * 20
@@ -0,0 +1,246 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.utils.concurrency import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    MemoryRateLimitBackend,
+    ProviderLimiter,
+    RateLimit,
+    RateLimiter,
+    RateLimitExceededError,
+    SQLiteRateLimitBackend,
+    priority_scope,
+)
+
+
+@pytest.fixture
+def limiter():
+    """provider별 제한이 설정된 ProviderLimiter를 생성하는 fixture"""
+    return ProviderLimiter({"naver": 2})
+
+
+def test_limit_caps_threads(limiter):
+    """동기 호출이 설정된 동시 실행 수를 넘지 않는지 테스트"""
+    peak = 0
+    lock = threading.Lock()
+
+    def call():
+        nonlocal peak
+        with limiter.limit("naver"):
+            with lock:
+                peak = max(peak, limiter.in_flight("naver"))
+            time.sleep(0.05)
+
+    threads = [threading.Thread(target=call) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak == 2
+    assert limiter.in_flight("naver") == 0
+
+
+def test_alimit_caps_tasks(limiter):
+    """비동기 호출이 설정된 동시 실행 수를 넘지 않는지 테스트"""
+    peak = 0
+
+    async def call():
+        nonlocal peak
+        async with limiter.alimit("naver"):
+            peak = max(peak, limiter.in_flight("naver"))
+            await asyncio.sleep(0.05)
+
+    async def main():
+        await asyncio.gather(*(call() for _ in range(6)))
+
+    asyncio.run(main())
+    assert peak == 2
+    assert limiter.in_flight("naver") == 0
+
+
+def test_slots_are_granted_in_arrival_order():
+    """슬롯을 먼저 기다린 호출(스레드, 코루틴)이 먼저 받고, 나중에 온 호출이 끼어들지 않는지 테스트"""
+    limiter = ProviderLimiter({"naver": 1})
+    order = []
+
+    def thread_call(name):
+        with limiter.limit("naver"):
+            order.append(name)
+
+    async def task_call(name):
+        async with limiter.alimit("naver"):
+            order.append(name)
+            await asyncio.sleep(0.01)
+
+    async def main():
+        async with limiter.alimit("naver"):
+            tasks = []
+            for i in range(3):
+                tasks.append(asyncio.create_task(task_call(f"task-{i}")))
+                await asyncio.sleep(0.01)
+            thread = threading.Thread(target=thread_call, args=("thread",))
+            thread.start()
+            await asyncio.sleep(0.05)
+            tasks.append(asyncio.create_task(task_call("task-3")))
+            await asyncio.sleep(0.01)
+        await asyncio.gather(*tasks)
+        # 늦게 온 호출은 이미 기다리던 호출이 모두 끝난 뒤에 실행됨
+        async with limiter.alimit("naver"):
+            order.append("late")
+        thread.join()
+
+    asyncio.run(main())
+    assert order == ["task-0", "task-1", "task-2", "thread", "task-3", "late"]
+    assert limiter.in_flight("naver") == 0
+
+
+def test_cancelled_waiter_does_not_hold_slot():
+    """슬롯을 기다리다 취소된 호출이 슬롯을 잃어버리지 않는지 테스트"""
+    limiter = ProviderLimiter({"naver": 1})
+
+    async def call():
+        async with limiter.alimit("naver"):
+            pass
+
+    async def main():
+        async with limiter.alimit("naver"):
+            waiter = asyncio.create_task(call())
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+        async with limiter.alimit("naver"):
+            return limiter.in_flight("naver")
+
+    assert asyncio.run(asyncio.wait_for(main(), 1)) == 1
+    assert limiter.in_flight("naver") == 0
+
+
+def test_unconfigured_provider_is_unlimited(limiter):
+    """제한이 없는 provider는 대기 없이 통과하는지 테스트"""
+    assert limiter.get_limit("openai") is None
+    with limiter.limit("openai"):
+        with limiter.limit("openai"):
+            pass
+
+
+def test_token_bucket_refills_and_enforces_daily_limit():
+    """토큰이 호출 속도에 맞춰 채워지고, 일일 한도를 넘으면 자정까지 기다려야 하는지 테스트"""
+    backend = MemoryRateLimitBackend()
+    limit = RateLimit(5, 60, daily=6)
+    now = 1_700_000_000.0
+
+    # burst 5번은 바로, 그다음은 12초(60초/5번)마다 하나씩
+    assert [backend.take("alpha_vantage", limit, now) for _ in range(5)] == [0] * 5
+    assert backend.take("alpha_vantage", limit, now) == pytest.approx(12)
+    assert backend.take("alpha_vantage", limit, now + 12) == 0
+    assert backend.take("alpha_vantage", limit, now + 60) > 3600
+
+    backend.backoff("naver", limit, now + 30)
+    assert backend.take("naver", limit, now) == pytest.approx(30)
+
+
+def test_waiters_are_served_by_priority():
+    """토큰을 기다리는 호출은 실패하지 않고 우선순위가 높은 호출부터 처리되는지 테스트"""
+    limiter = RateLimiter({"naver": RateLimit(1, 0.2)}, max_wait=5)
+    limiter.acquire("naver")
+    order = []
+
+    def call(name: str, priority: int):
+        with priority_scope(priority):
+            limiter.acquire("naver")
+        order.append(name)
+
+    low = threading.Thread(target=call, args=("low", PRIORITY_LOW))
+    high = threading.Thread(target=call, args=("high", PRIORITY_HIGH))
+    low.start()
+    time.sleep(0.05)
+    high.start()
+    for thread in (low, high):
+        thread.join()
+
+    assert order == ["high", "low"]
+    assert limiter.waiting("naver") == 0
+
+
+def test_async_waiters_share_bucket():
+    """비동기 호출도 같은 bucket에서 토큰을 기다리는지 테스트"""
+    limiter = RateLimiter({"naver": RateLimit(2, 0.1)})
+
+    async def main():
+        start = time.perf_counter()
+        await asyncio.gather(*(limiter.aacquire("naver") for _ in range(4)))
+        return time.perf_counter() - start
+
+    # burst 2번 이후 0.05초마다 하나씩
+    assert asyncio.run(main()) >= 0.09
+
+
+def test_sqlite_backend_shares_limits_across_processes(tmp_path):
+    """같은 sqlite 파일을 사용하는 limiter(워커 프로세스)끼리 한도를 공유하는지 테스트"""
+    path = str(tmp_path / "rate_limits.sqlite3")
+    limits = {"alpha_vantage": RateLimit(5, 60, daily=25)}
+    first = RateLimiter(limits, SQLiteRateLimitBackend(path), max_wait=0.1)
+    second = RateLimiter(limits, SQLiteRateLimitBackend(path), max_wait=0.1)
+
+    for _ in range(3):
+        first.acquire("alpha_vantage")
+    second.acquire("alpha_vantage")
+    second.acquire("alpha_vantage")
+    # 다음 토큰까지 12초가 필요하므로 max_wait 안에 받을 수 없음
+    with pytest.raises(RateLimitExceededError):
+        second.acquire("alpha_vantage")
+
+    assert first.stats("alpha_vantage")["used_today"] == 5
+    assert second.waiting("alpha_vantage") == 0
+
+
+def test_sqlite_backend_runs_off_event_loop(tmp_path):
+    """SQLite backend의 잠금 대기가 이벤트 루프의 다른 작업을 막지 않는지 테스트"""
+    limiter = RateLimiter(
+        {"alpha_vantage": RateLimit(5, 60)},
+        SQLiteRateLimitBackend(str(tmp_path / "rate_limits.sqlite3")),
+    )
+    take = limiter.backend.take
+
+    def slow_take(*args):
+        time.sleep(0.2)  # 다른 프로세스가 쓰기 잠금을 잡고 있는 상황
+        return take(*args)
+
+    limiter.backend.take = slow_take
+    ticks = []
+
+    async def ticker():
+        for _ in range(5):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.02)
+
+    async def main():
+        ticking = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        await limiter.aacquire("alpha_vantage")
+        await ticking
+
+    asyncio.run(main())
+
+    assert max(b - a for a, b in zip(ticks, ticks[1:])) < 0.15
+    assert limiter.stats("alpha_vantage")["used_today"] == 1
+
+
+def test_provider_limiter_applies_rate_limit():
+    """ProviderLimiter가 동시 호출 슬롯 전에 호출 속도 제한을 적용하는지 테스트"""
+    limiter = ProviderLimiter(
+        {"naver": 2}, RateLimiter({"naver": RateLimit(1, 60)}, max_wait=0.05)
+    )
+
+    with limiter.limit("naver"):
+        pass
+    with pytest.raises(RateLimitExceededError):
+        with limiter.limit("naver"):
+            pass
+
+    assert limiter.stats()["naver"]["in_flight"] == 0
+    assert limiter.stats()["naver"]["used_today"] == 1
@@ -0,0 +1,108 @@
+import asyncio
+import threading
+
+import pytest
+from aiohttp import web
+
+from src.tools.naver_searcher.naver_search import NaverSearchAPIWrapper
+from src.utils.http_client import HTTPClientManager
+
+
+class PeerServer:
+    """요청을 보낸 클라이언트 포트(= TCP 연결)를 기록하는 로컬 서버"""
+
+    def __init__(self):
+        self.peers = []
+        self.base_url = ""
+        self._loop = asyncio.new_event_loop()
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.peers.append(request.transport.get_extra_info("peername")[1])
+        return web.json_response({"items": [{"title": "<b>삼성전자</b>"}]})
+
+    async def _start(self):
+        app = web.Application()
+        app.router.add_get("/{path:.*}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, "127.0.0.1", 0).start()
+        self.base_url = f"http://127.0.0.1:{self._runner.addresses[0][1]}"
+
+    def start(self):
+        self._loop.run_until_complete(self._start())
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+@pytest.fixture
+def server():
+    server = PeerServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def clients(monkeypatch):
+    clients = HTTPClientManager(limit_per_host=2)
+    monkeypatch.setattr("src.tools.naver_searcher.naver_search.http_clients", clients)
+    return clients
+
+
+def test_sync_calls_reuse_connection(server, clients):
+    """동기 호출이 매번 새로 연결하지 않고 keep-alive 연결을 재사용하는지 테스트"""
+    naver = NaverSearchAPIWrapper(
+        naver_client_id="id", naver_client_secret="secret", base_url=server.base_url
+    )
+
+    for _ in range(3):
+        assert naver.results("삼성전자")[0]["title"] == "삼성전자"
+
+    assert len(server.peers) == 3
+    assert len(set(server.peers)) == 1
+    assert clients.session() is clients.session()
+
+
+def test_async_calls_share_session_per_loop(server, clients):
+    """비동기 호출이 이벤트 루프별 세션 하나의 커넥션 풀을 공유하는지 테스트"""
+    naver = NaverSearchAPIWrapper(
+        naver_client_id="id", naver_client_secret="secret", base_url=server.base_url
+    )
+
+    async def main():
+        session = clients.asession()
+        for _ in range(3):
+            await naver.raw_results_async("삼성전자")
+        # 동시 요청은 호스트별 연결 수(limit_per_host)까지만 사용
+        await asyncio.gather(*(naver.raw_results_async("삼성전자") for _ in range(6)))
+        assert clients.asession() is session
+        await clients.aclose()
+        return session
+
+    session = asyncio.run(main())
+
+    assert session.closed
+    assert len(server.peers) == 9
+    assert len(set(server.peers)) <= 2
+
+
+def test_sessions_of_closed_loops_are_discarded(clients):
+    """닫힌 이벤트 루프의 세션은 다음 호출에서 정리되고 새 루프에는 새 세션을 만드는지 테스트"""
+
+    async def get_session():
+        return clients.asession()
+
+    first = asyncio.run(get_session())
+    second = asyncio.run(get_session())
+
+    assert first is not second
+    assert first.closed
+    assert list(clients._sessions.values()) == [second]
+    asyncio.run(clients.aclose())
+    assert second.closed
@@ -0,0 +1,144 @@
+import asyncio
+import sqlite3
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.services.job_runner import JobRunner
+from src.services.job_store import JobStatus, JobStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    """임시 경로의 JobStore 인스턴스를 생성하는 fixture"""
+    return JobStore(path=str(tmp_path / "jobs.sqlite3"))
+
+
+def test_job_lifecycle(store):
+    """작업 등록부터 완료까지 상태와 메시지가 저장되는지 테스트"""
+    job_id = store.create({"query": "AAPL 재무 분석"})
+    assert store.get(job_id)["status"] == JobStatus.QUEUED
+
+    assert store.claim(job_id) is True
+    assert store.claim(job_id) is False  # 이미 선점된 작업
+
+    store.append_messages(job_id, [{"node": "a", "name": "a", "content": "1"}])
+    store.append_messages(job_id, [{"node": "b", "name": "b", "content": "2"}])
+    store.complete(job_id, "2")
+
+    job = store.get(job_id)
+    assert job["status"] == JobStatus.SUCCEEDED
+    assert [m["content"] for m in job["messages"]] == ["1", "2"]
+    assert job["answer"] == "2"
+    assert job["request"] == {"query": "AAPL 재무 분석"}
+
+
+def test_results_survive_reopen(store):
+    """저장소를 다시 열어도 결과를 조회할 수 있는지 테스트"""
+    job_id = store.create({"query": "q"})
+    store.claim(job_id)
+    store.fail(job_id, "boom")
+
+    reopened = JobStore(path=store.path)
+    job = reopened.get(job_id)
+    assert job["status"] == JobStatus.FAILED
+    assert job["error"] == "boom"
+
+
+def test_recover_requeues_interrupted_jobs(store):
+    """lease가 만료된(실행하던 프로세스가 종료된) 작업만 다시 대기열로 되돌리는지 테스트"""
+    queued = store.create({"query": "queued"})
+    interrupted = store.create({"query": "interrupted"})
+    # 종료된 이전 프로세스의 저장소
+    previous = JobStore(path=store.path, lease_seconds=0.05)
+    assert previous.claim(interrupted)
+
+    # lease가 남아 있으면 실행 중인 것으로 보고 건드리지 않음
+    assert store.recover() == [queued]
+    time.sleep(0.06)
+    assert store.recover() == [queued, interrupted]
+    assert store.get(interrupted)["status"] == JobStatus.QUEUED
+    assert store.get("missing") is None
+
+
+def test_heartbeat_keeps_lease(store):
+    """실행 중인 워커가 lease를 연장하면 다른 프로세스가 작업을 가져가지 않는지 테스트"""
+    job_id = store.create({"query": "long"})
+    worker = JobStore(path=store.path, lease_seconds=0.1)
+    assert worker.claim(job_id)
+
+    for _ in range(3):
+        time.sleep(0.05)
+        assert worker.heartbeat(job_id)
+        assert store.requeue_expired() == []
+
+    time.sleep(0.15)
+    assert store.requeue_expired() == [job_id]
+    # lease를 잃은 워커는 더 이상 연장할 수 없음
+    assert worker.heartbeat(job_id) is False
+    assert store.claim(job_id)
+
+
+def test_stale_owner_cannot_write_results(store):
+    """lease를 잃은 이전 실행은 다른 워커가 다시 실행하는 작업의 결과를 덮어쓰지 못하는지 테스트"""
+    job_id = store.create({"query": "q"})
+    stale = JobStore(path=store.path, lease_seconds=0.01)
+    assert stale.claim(job_id)
+    time.sleep(0.02)
+    assert store.requeue_expired() == [job_id]
+    assert store.claim(job_id)
+
+    assert stale.append_messages(job_id, [{"node": "a", "content": "old"}]) is False
+    assert stale.complete(job_id, "old") is False
+    assert stale.fail(job_id, "old") is False
+    assert store.complete(job_id, "new") is True
+
+    job = store.get(job_id)
+    assert job["answer"] == "new"
+    assert job["messages"] == []
+
+
+class HangingGraph:
+    """첫 메시지 이후 끝나지 않는 그래프"""
+
+    async def astream(self, state, stream_mode, budget, thread_id):
+        yield "updates", {"worker": {"messages": []}}
+        await asyncio.sleep(10)
+
+
+def test_runner_cancels_run_when_lease_is_lost(store, monkeypatch):
+    """heartbeat가 lease를 잃은 것을 확인하면 실행 중인 작업을 취소하는지 테스트"""
+    store.lease_seconds = 0.03
+    monkeypatch.setattr(store, "heartbeat", lambda job_id: False)
+    llms = SimpleNamespace(get=lambda *args: None)
+    runner = JobRunner(HangingGraph(), llms=llms, store=store)
+    job_id = store.create({"query": "q"})
+    assert store.claim(job_id)
+
+    async def main():
+        await asyncio.wait_for(runner._run_with_lease(job_id), 1)
+
+    asyncio.run(main())
+    assert store.get(job_id)["status"] == JobStatus.RUNNING
+    assert store.get(job_id)["answer"] is None
+
+
+def test_migrates_pid_based_store(tmp_path):
+    """owner_pid로 소유자를 기록하던 이전 파일에 lease 컬럼을 추가하고 작업을 복구하는지 테스트"""
+    path = str(tmp_path / "jobs.sqlite3")
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE jobs (id TEXT PRIMARY KEY, request TEXT NOT NULL, "
+        "status TEXT NOT NULL, messages TEXT NOT NULL DEFAULT '[]', answer TEXT, "
+        "error TEXT, owner_pid INTEGER, created_at TEXT NOT NULL, "
+        "updated_at TEXT NOT NULL)"
+    )
+    conn.execute(
+        "INSERT INTO jobs (id, request, status, owner_pid, created_at, updated_at) "
+        "VALUES ('old', '{\"query\": \"q\"}', 'running', 1, 'a', 'a')"
+    )
+    conn.commit()
+    conn.close()
+
+    assert JobStore(path=path).recover() == ["old"]
@@ -0,0 +1,41 @@
+import threading
+
+import pytest
+
+from src.utils.leader import LeaderLock
+
+
+@pytest.fixture
+def lock_path(tmp_path):
+    """리더 선출용 임시 잠금 파일 경로 fixture"""
+    return str(tmp_path / "scheduler.lock")
+
+
+def test_only_one_leader(lock_path):
+    """같은 잠금 파일에서 하나의 인스턴스만 리더가 되는지 테스트"""
+    first = LeaderLock(lock_path)
+    second = LeaderLock(lock_path)
+
+    assert first.try_acquire() is True
+    assert second.try_acquire() is False
+    assert first.is_leader and not second.is_leader
+
+    first.release()
+    assert second.try_acquire() is True
+    second.release()
+
+
+def test_run_when_elected_takes_over(lock_path):
+    """리더가 잠금을 해제하면 대기 중인 인스턴스가 리더를 이어받는지 테스트"""
+    leader = LeaderLock(lock_path)
+    follower = LeaderLock(lock_path, retry_interval=0.01)
+    leader_started, follower_started = threading.Event(), threading.Event()
+
+    leader.run_when_elected(leader_started.set)
+    follower.run_when_elected(follower_started.set)
+    assert leader_started.is_set()
+    assert not follower_started.is_set()
+
+    leader.stop()
+    assert follower_started.wait(timeout=2)
+    follower.stop()
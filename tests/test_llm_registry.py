@@ -0,0 +1,47 @@
+import asyncio
+
+from src.utils.llm import LimitedChatOpenAI, LLMRegistry
+
+
+def test_reuses_client_per_config():
+    """같은 설정에는 같은 클라이언트를, 다른 설정에는 다른 클라이언트를 반환하는지 테스트"""
+    registry = LLMRegistry(default_model="gpt-4o-mini")
+
+    client = registry.get(temperature=0.2)
+
+    assert isinstance(client, LimitedChatOpenAI)
+    assert client is registry.get("gpt-4o-mini", 0.2)
+    assert client.model_name == "gpt-4o-mini"
+    assert client.temperature == 0.2
+
+    other = registry.get("gpt-4o", 0.2, max_tokens=256)
+    assert other is not client
+    assert other.max_tokens == 256
+    asyncio.run(registry.aclose())
+
+
+def test_clients_share_connection_pool():
+    """모든 클라이언트가 하나의 HTTP 커넥션 풀을 공유하는지 테스트"""
+    registry = LLMRegistry()
+
+    first = registry.get("gpt-4o-mini", 0)
+    second = registry.get("gpt-4o", 0.7)
+
+    assert first.http_client is second.http_client
+    assert first.http_async_client is second.http_async_client
+    asyncio.run(registry.aclose())
+    assert len(registry) == 0
+
+
+def test_evicts_least_recently_used():
+    """max_clients를 넘으면 가장 오래 사용되지 않은 클라이언트를 제거하는지 테스트"""
+    registry = LLMRegistry(max_clients=2)
+
+    first = registry.get(temperature=0.0)
+    registry.get(temperature=0.1)
+    registry.get(temperature=0.0)
+    registry.get(temperature=0.2)
+
+    assert len(registry) == 2
+    assert registry.get(temperature=0.0) is first
+    asyncio.run(registry.aclose())
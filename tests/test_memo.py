@@ -0,0 +1,161 @@
+import asyncio
+from typing import Optional
+
+from langchain_core.messages import HumanMessage
+from langchain_core.tools import BaseTool
+from langgraph.types import Command
+from pydantic import PrivateAttr
+
+from benchmarks.fake_llm import ScriptedChatModel
+from src.graph.builder import SupervisorGraphBuilder
+from src.graph.nodes.base import Node
+from src.models.do import RawResponse
+from src.models.graph_state import SupervisorState
+from src.tools.naver_searcher.naver_search import NaverSearchAPIWrapper
+from src.tools.naver_searcher.tool import NaverNewsSearch
+from src.utils.memo import ToolMemo, memo_scope, memoize_tool
+
+
+class CountingTool(BaseTool):
+    name: str = "counting_tool"
+    description: str = "counts calls"
+    url: str = "https://example.com/feed"
+    # 호출 횟수는 도구 설정이 아니므로 private 속성으로 관리
+    _calls: int = PrivateAttr(default=0)
+
+    @property
+    def calls(self) -> int:
+        return self._calls
+
+    @memoize_tool()
+    def _run(self, query: str, run_manager=None) -> str:
+        self._calls += 1
+        return f"{self.url}:{query.strip()}"
+
+    @memoize_tool()
+    async def _arun(self, query: str, run_manager=None) -> str:
+        await asyncio.sleep(0.01)
+        return self._run.__wrapped__(self, query)
+
+
+def test_reuses_results_within_scope():
+    """실행 범위 안에서 정규화된 인자가 같은 호출은 결과를 재사용하는지 테스트"""
+    tool = CountingTool()
+    memo = ToolMemo()
+
+    with memo_scope(memo):
+        first = tool.invoke({"query": "AAPL 재무 분석"})
+        assert tool.invoke({"query": "  aapl   재무 분석 "}) == first
+        tool.invoke({"query": "MSFT 재무 분석"})
+        # 설정이 다른 도구(다른 RSS 주소 등)는 별도로 호출
+        CountingTool(url="https://example.com/other").invoke(
+            {"query": "AAPL 재무 분석"}
+        )
+
+    assert tool.calls == 2
+    assert memo.stats() == {"hits": 1, "misses": 3}
+
+    # 실행 범위 밖에서는 항상 호출
+    tool.invoke({"query": "AAPL 재무 분석"})
+    assert tool.calls == 3
+
+
+def test_concurrent_async_calls_share_one_invocation():
+    """같은 인자로 동시에 호출하면 먼저 시작한 호출의 결과를 함께 사용하는지 테스트"""
+    tool = CountingTool()
+
+    async def run():
+        with memo_scope(ToolMemo()):
+            return await asyncio.gather(
+                *(tool.ainvoke({"query": "금리 전망"}) for _ in range(5))
+            )
+
+    results = asyncio.run(run())
+
+    assert len(set(results)) == 1
+    assert tool.calls == 1
+
+
+def test_failed_calls_are_retried(monkeypatch):
+    """실패한 도구 호출(예외, None, 오류 dict)은 저장하지 않고 다시 호출하는지 테스트"""
+    upstream = [TimeoutError("stalled"), [{"title": "삼성전자 실적"}]]
+
+    def results(self, query, **kwargs):
+        response = upstream.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr(NaverSearchAPIWrapper, "results", results)
+    tool = NaverNewsSearch(
+        api_wrapper=NaverSearchAPIWrapper(
+            naver_client_id="id", naver_client_secret="secret"
+        )
+    )
+    memo = ToolMemo()
+
+    with memo_scope(memo):
+        assert "TimeoutError" in tool.invoke({"query": "삼성전자"})
+        assert tool.invoke({"query": "삼성전자"}) == [{"title": "삼성전자 실적"}]
+        # 성공한 결과는 재사용
+        assert tool.invoke({"query": "삼성전자"}) == [{"title": "삼성전자 실적"}]
+
+    assert upstream == []
+    assert memo.stats() == {"hits": 1, "misses": 1}
+
+    class Extractor:
+        def __init__(self, responses):
+            self.responses = responses
+
+        @memoize_tool("ticker")
+        def extract(self, query: str):
+            return self.responses.pop(0)
+
+    extractor = Extractor([None, {"error": "rate limited"}, "AAPL"])
+    with memo_scope(ToolMemo()):
+        results = [extractor.extract("애플 재무") for _ in range(4)]
+    assert results == [None, {"error": "rate limited"}, "AAPL", "AAPL"]
+
+
+class RepeatingNode(Node):
+    """supervisor가 두 번 호출하는 worker"""
+
+    def __init__(self, tool: CountingTool):
+        super().__init__()
+        self.tool = tool
+
+    def _run(self, state: dict) -> Command:
+        result = self.tool.invoke({"query": "삼성전자 재무"})
+        return Command(
+            update={"messages": [HumanMessage(content=result, name="repeating")]},
+            goto="supervisor",
+        )
+
+    def _invoke(self, query: str) -> Optional[RawResponse]:
+        return None
+
+
+def test_repeated_worker_in_one_run_reuses_tool_results(monkeypatch):
+    """한 실행에서 같은 worker를 다시 호출하면 도구를 다시 호출하지 않고, 실행마다 초기화되는지 테스트"""
+    monkeypatch.setenv("TOOL_MEMO_ENABLED", "true")
+    query = "재무 분석을 더 자세히 해줘"
+    llm = ScriptedChatModel(
+        plans={query: [["repeatingnode"], ["repeatingnode"]]}, latency=0
+    )
+    tool = CountingTool()
+    builder = SupervisorGraphBuilder()
+    builder.add_node(RepeatingNode(tool))
+    builder.build()
+
+    def run():
+        result = builder.execute(SupervisorState(llm=llm, messages=[("user", query)]))
+        assert result["hops"] == 2
+
+    run()
+    assert tool.calls == 1
+    run()
+    assert tool.calls == 2
+
+    monkeypatch.setenv("TOOL_MEMO_ENABLED", "false")
+    run()
+    assert tool.calls == 4
@@ -0,0 +1,71 @@
+import pytest
+from langchain_core.tools import tool
+from prometheus_client import REGISTRY
+
+from src.utils.metrics import (
+    CACHE_REQUESTS,
+    HTTP_REQUEST_SECONDS,
+    record_cache_lookup,
+    render,
+    track_http,
+)
+
+
+def _count(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(f"{name}_count", labels) or 0.0
+
+
+def test_track_http_records_status():
+    """외부 호출 시간이 성공/실패 상태별로 기록되는지 테스트"""
+    before_ok = _count("market_agent_http_request_seconds", upstream="t", status="ok")
+    before_error = _count(
+        "market_agent_http_request_seconds", upstream="t", status="error"
+    )
+
+    with track_http("t"):
+        pass
+    with pytest.raises(ValueError):
+        with track_http("t"):
+            raise ValueError("boom")
+
+    assert HTTP_REQUEST_SECONDS is not None
+    assert (
+        _count("market_agent_http_request_seconds", upstream="t", status="ok")
+        == before_ok + 1
+    )
+    assert (
+        _count("market_agent_http_request_seconds", upstream="t", status="error")
+        == before_error + 1
+    )
+
+
+def test_tool_calls_are_recorded_without_explicit_callbacks():
+    """콜백을 명시하지 않은 도구 호출도 기록되는지 테스트"""
+
+    @tool
+    def metrics_probe(query: str) -> str:
+        """테스트용 도구"""
+        return query
+
+    before = _count("market_agent_tool_call_seconds", tool="metrics_probe", status="ok")
+    metrics_probe.invoke({"query": "hi"})
+
+    assert (
+        _count("market_agent_tool_call_seconds", tool="metrics_probe", status="ok")
+        == before + 1
+    )
+
+
+def test_render_exposes_cache_lookups():
+    """캐시 조회 결과가 /metrics 출력에 포함되는지 테스트"""
+    record_cache_lookup("metrics_test", hit=True)
+    record_cache_lookup("metrics_test", hit=False)
+
+    body, content_type = render()
+
+    assert CACHE_REQUESTS is not None
+    assert content_type.startswith("text/plain")
+    assert (
+        b'market_agent_cache_requests_total{endpoint="metrics_test",result="hit"} 1.0'
+        in body
+    )
@@ -0,0 +1,146 @@
+import asyncio
+import threading
+
+import pytest
+from aiohttp import web
+
+from src.tools.naver_searcher.naver_search import (
+    NaverSearchAPIWrapper,
+    deep_search_pages,
+)
+from src.tools.naver_searcher.tool import NaverNewsSearch
+from src.utils.http_client import HTTPClientManager
+
+
+class NewsServer:
+    """전체 결과가 total개인 Naver 뉴스 검색 스텁
+
+    페이지마다 이전 페이지의 마지막 기사를 한 번 더 포함해 중복 결과를 만듭니다.
+    """
+
+    def __init__(self, total: int, latency: float = 0.05):
+        self.total = total
+        self.latency = latency
+        self.starts = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.base_url = ""
+        self._loop = asyncio.new_event_loop()
+
+    async def _news(self, request: web.Request) -> web.Response:
+        start = int(request.query["start"])
+        display = int(request.query["display"])
+        self.starts.append(start)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.latency)
+        self.in_flight -= 1
+
+        end = min(start + display, self.total + 1)
+        numbers = ([start - 1] if start > 1 else []) + list(range(start, end))
+        items = [
+            {
+                "title": f"<b>삼성전자</b> 기사 {i}",
+                "link": f"https://n.news.naver.com/article/{i}",
+                "description": f"기사 {i}",
+            }
+            for i in numbers
+        ]
+        return web.json_response({"total": self.total, "items": items})
+
+    async def _start(self):
+        app = web.Application()
+        app.router.add_get("/news.json", self._news)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, "127.0.0.1", 0).start()
+        self.base_url = f"http://127.0.0.1:{self._runner.addresses[0][1]}"
+
+    def start(self):
+        self._loop.run_until_complete(self._start())
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+@pytest.fixture
+def server():
+    server = NewsServer(total=250)
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def naver(server, monkeypatch):
+    clients = HTTPClientManager()
+    monkeypatch.setattr("src.tools.naver_searcher.naver_search.http_clients", clients)
+    yield NaverSearchAPIWrapper(
+        naver_client_id="id", naver_client_secret="secret", base_url=server.base_url
+    )
+    asyncio.run(clients.aclose())
+
+
+def _article_numbers(results):
+    return [int(result["link"].rsplit("/", 1)[1]) for result in results]
+
+
+def test_deep_search_pages():
+    """목표 결과 수에 맞춰 페이지를 나누고 Naver의 start 상한(1000)을 넘지 않는지 테스트"""
+    assert deep_search_pages(10) == [(1, 10)]
+    assert deep_search_pages(250) == [(1, 100), (101, 100), (201, 50)]
+    pages = deep_search_pages(5000)
+    assert len(pages) == 10
+    assert pages[-1] == (901, 100)
+
+
+def test_deep_results_fetch_pages_concurrently(server, naver):
+    """첫 페이지의 total까지만 나머지 페이지를 동시에 요청하고, link 기준으로 중복을 제거하는지 테스트"""
+    results = naver.deep_results("삼성전자", max_results=1000)
+
+    assert _article_numbers(results) == list(range(1, 251))
+    assert results[0]["title"] == "삼성전자 기사 1"
+    assert server.starts[0] == 1
+    assert sorted(server.starts) == [1, 101, 201]
+    assert server.max_in_flight == 2
+
+
+def test_deep_results_async_keep_page_order(server, naver):
+    """비동기 deep search도 페이지 순서대로 합치는지 테스트"""
+    results = asyncio.run(naver.deep_results_async("삼성전자", max_results=150))
+
+    assert _article_numbers(results) == list(range(1, 151))
+    assert sorted(server.starts) == [1, 101]
+
+
+def test_deep_results_stream_yields_pages_as_they_arrive(server, naver):
+    """스트리밍 deep search가 도착한 페이지부터 중복 없이 전달하는지 테스트"""
+
+    async def collect():
+        return [
+            page
+            async for page in naver.deep_results_stream("삼성전자", max_results=300)
+        ]
+
+    pages = asyncio.run(collect())
+
+    assert len(pages) == 3
+    assert _article_numbers(pages[0]) == list(range(1, 101))
+    numbers = [number for page in pages for number in _article_numbers(page)]
+    assert sorted(numbers) == list(range(1, 251))
+
+
+def test_news_tool_deep_search_option(server, naver):
+    """NaverNewsSearch의 max_results가 display보다 크면 deep search를 사용하는지 테스트"""
+    tool = NaverNewsSearch(sort="date", max_results=120, api_wrapper=naver)
+
+    results = tool.invoke({"query": "삼성전자"})
+
+    assert len(results) == 120
+    assert sorted(server.starts) == [1, 101]
+    assert len(NaverNewsSearch(api_wrapper=naver).invoke({"query": "삼성전자"})) == 10
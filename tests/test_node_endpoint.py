@@ -0,0 +1,87 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.route import create_node_endpoint
+from src.graph.nodes.base import Node
+from src.models.do import RawResponse
+from src.services.node_executor import NodeExecutor
+from src.services.response_cache import MemoryCacheBackend, ResponseCache
+from src.services.single_flight import SingleFlight
+
+
+class FakeLLMRegistry:
+    """설정별 LLM 대신 설정값을 담은 객체를 반환하는 레지스트리"""
+
+    def get(self, model=None, temperature=None, max_tokens=None):
+        return SimpleNamespace(
+            model_name=model, temperature=temperature, max_tokens=max_tokens
+        )
+
+
+class EchoNode(Node):
+    """직접 호출에 사용된 LLM 설정을 답변으로 돌려주는 노드"""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def _run(self, state: dict):
+        return None
+
+    def _invoke(self, query: str) -> RawResponse:
+        self.calls += 1
+        llm = self.default_llm
+        return RawResponse(
+            answer=f"{query}|{llm.model_name}|{llm.temperature}|{llm.max_tokens}"
+        )
+
+
+@pytest.fixture
+def node():
+    return EchoNode()
+
+
+@pytest.fixture
+def client(node):
+    executor = NodeExecutor("echo", max_workers=1, max_queue=4, queue_timeout=None)
+    app = FastAPI()
+    app.add_api_route(
+        "/api/echo",
+        methods=["POST"],
+        endpoint=create_node_endpoint(
+            node,
+            "echo",
+            ResponseCache(MemoryCacheBackend()),
+            SingleFlight(),
+            executor,
+            FakeLLMRegistry(),
+        ),
+    )
+    yield TestClient(app)
+    executor.shutdown()
+
+
+def test_uses_requested_llm_config(client, node):
+    """요청의 model/temperature/max_tokens로 노드를 실행하고 설정별로 캐시하는지 테스트"""
+    body = {"query": "시장", "model": "gpt-4o", "temperature": 0.7, "max_tokens": 50}
+
+    assert client.post("/api/echo", json=body).json()["answer"] == (
+        "시장|gpt-4o|0.7|50"
+    )
+    assert client.post("/api/echo", json=body).headers["X-Cache"] == "HIT"
+
+    response = client.post("/api/echo", json={**body, "temperature": 0.0})
+    assert response.headers["X-Cache"] == "MISS"
+    assert response.json()["answer"] == "시장|gpt-4o|0.0|50"
+    assert node.calls == 2
+
+
+def test_rejects_graph_only_options(client, node):
+    """그래프 실행에만 적용되는 budget, thread_id를 지정하면 422를 반환하는지 테스트"""
+    for extra in ({"thread_id": "t-1"}, {"budget": {"max_hops": 1}}):
+        response = client.post("/api/echo", json={"query": "시장", **extra})
+        assert response.status_code == 422
+    assert node.calls == 0
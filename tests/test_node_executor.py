@@ -0,0 +1,106 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.services.node_executor import (
+    NodeExecutor,
+    NodeExecutorPool,
+    NodeQueueTimeoutError,
+    NodeSaturatedError,
+)
+
+
+def test_rejects_when_saturated():
+    """실행 슬롯과 대기열이 모두 차면 즉시 거절하는지 테스트"""
+    executor = NodeExecutor("slow", max_workers=1, max_queue=1, queue_timeout=None)
+    release = threading.Event()
+
+    def work(value):
+        release.wait(5)
+        return value
+
+    async def main():
+        running = asyncio.ensure_future(executor.run(work, "a"))
+        queued = asyncio.ensure_future(executor.run(work, "b"))
+        await asyncio.sleep(0.05)
+        with pytest.raises(NodeSaturatedError):
+            await executor.run(work, "c")
+        release.set()
+        return await asyncio.gather(running, queued)
+
+    assert asyncio.run(main()) == ["a", "b"]
+    assert executor.stats()["rejected"] == 1
+    assert executor.pending == 0
+    executor.shutdown()
+
+
+def test_queue_timeout_cancels_waiting_work():
+    """대기열에서 시간 내에 시작하지 못한 작업이 취소되는지 테스트"""
+    executor = NodeExecutor("slow", max_workers=1, max_queue=4, queue_timeout=0.05)
+    release = threading.Event()
+    started = []
+
+    def work(value):
+        started.append(value)
+        release.wait(5)
+        return value
+
+    async def main():
+        running = asyncio.ensure_future(executor.run(work, "a"))
+        await asyncio.sleep(0.01)
+        with pytest.raises(NodeQueueTimeoutError):
+            await executor.run(work, "b")
+        release.set()
+        return await running
+
+    # 실행 중인 작업은 queue_timeout이 지나도 끝까지 완료됨
+    assert asyncio.run(main()) == "a"
+    assert started == ["a"]
+    assert executor.stats()["timed_out"] == 1
+    assert executor.pending == 0
+    executor.shutdown()
+
+
+def test_async_nodes_share_limits_without_threads():
+    """비동기 노드도 동시 실행 수, 대기열, 대기 시간 제한이 적용되는지 테스트"""
+    executor = NodeExecutor("async", max_workers=1, max_queue=1, queue_timeout=0.05)
+    threads = set()
+
+    async def work(value, delay):
+        threads.add(threading.get_ident())
+        await asyncio.sleep(delay)
+        return value
+
+    async def main():
+        running = asyncio.ensure_future(executor.arun(work, "a", 0.2))
+        await asyncio.sleep(0.01)
+        queued = asyncio.ensure_future(executor.arun(work, "b", 0))
+        await asyncio.sleep(0.01)
+        with pytest.raises(NodeSaturatedError):
+            await executor.arun(work, "c", 0)
+        with pytest.raises(NodeQueueTimeoutError):
+            await queued
+        return await running
+
+    assert asyncio.run(main()) == "a"
+    # 이벤트 루프 스레드에서만 실행됨
+    assert threads == {threading.get_ident()}
+    assert executor.stats()["rejected"] == 1
+    assert executor.stats()["timed_out"] == 1
+    assert executor.pending == 0
+    executor.shutdown()
+
+
+def test_pool_reads_per_node_settings(monkeypatch):
+    """노드별 환경변수 설정이 공통 설정보다 우선하는지 테스트"""
+    monkeypatch.setenv("NODE_MAX_CONCURRENCY", "4")
+    monkeypatch.setenv("NODE_WEEKLYREPORTER_MAX_CONCURRENCY", "1")
+    monkeypatch.setenv("NODE_QUEUE_TIMEOUT", "0")
+    pool = NodeExecutorPool()
+
+    assert pool.get("weeklyreporter").max_workers == 1
+    assert pool.get("navernewssearcher").max_workers == 4
+    assert pool.get("navernewssearcher").queue_timeout is None
+    assert pool.get("weeklyreporter") is pool.get("weeklyreporter")
+    asyncio.run(pool.shutdown())
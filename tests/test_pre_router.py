@@ -0,0 +1,111 @@
+import pytest
+
+from src.graph.pre_router import (
+    EmbeddingRouter,
+    FastPathRouter,
+    HashingEmbeddings,
+    RuleRouter,
+)
+
+MEMBERS = [
+    "navernewssearchernode",
+    "chosunrssfeedernode",
+    "wsjeconomyrssfeedernode",
+    "wsjmarketrssfeedernode",
+    "usfinancialanalyzernode",
+    "weeklyreporternode",
+]
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("이번 주 주간 리캡 요약해줘", ["weeklyreporternode"]),
+        ("What is in the weekly market recap?", ["weeklyreporternode"]),
+        ("AAPL 재무 분석해줘", ["usfinancialanalyzernode"]),
+        ("Analyze $MSFT", ["usfinancialanalyzernode"]),
+        ("삼성전자 관련 최신 뉴스 알려줘", ["navernewssearchernode"]),
+        # 특정 출처 규칙이 맞으면 일반 뉴스 규칙은 적용하지 않음
+        (
+            "조선일보랑 WSJ 경제 뉴스 요약해줘",
+            ["chosunrssfeedernode", "wsjeconomyrssfeedernode"],
+        ),
+        ("WSJ 경제 뉴스", ["wsjeconomyrssfeedernode"]),
+        (
+            "Latest economy news from the Wall Street Journal",
+            ["wsjeconomyrssfeedernode"],
+        ),
+        ("월스트리트저널의 증시 소식", ["wsjmarketrssfeedernode"]),
+        # 출처만 있고 주제가 없으면 일반 뉴스 검색(네이버)으로 보내지 않음
+        ("WSJ 최신 뉴스", None),
+        ("조선일보 헤드라인 기사", ["chosunrssfeedernode"]),
+        # 다른 출처에 붙은 주제로 WSJ 규칙을 적용하지 않음
+        (
+            "Chosun economy headlines and WSJ markets",
+            ["chosunrssfeedernode", "wsjmarketrssfeedernode"],
+        ),
+        ("GDP 성장률 전망은?", None),
+        ("AAPL의 재무 상태는?", ["usfinancialanalyzernode"]),
+        # 티커가 아닌 대문자 단어(일반 약어)는 재무 키워드와 함께 있어도 라우팅하지 않음
+        ("Should I worry about Korea's financial stability?", None),
+        ("What is the US GDP outlook and financial conditions?", None),
+        ("ETF 수익성 비교", None),
+        ("$US 재무 상황", None),
+    ],
+)
+def test_rule_router(query, expected):
+    """키워드/정규식 규칙 라우팅 테스트"""
+    decision = RuleRouter().route(query, MEMBERS)
+    assert (decision.workers if decision else None) == expected
+
+
+def test_rule_router_ignores_unregistered_workers():
+    """그래프에 등록되지 않은 worker로는 라우팅하지 않는지 테스트"""
+    assert RuleRouter().route("주간 리캡", ["navernewssearchernode"]) is None
+
+
+def test_embedding_router_requires_confidence():
+    """유사도와 1, 2위 차이가 충분할 때만 결정하는지 테스트"""
+    router = EmbeddingRouter(HashingEmbeddings(), threshold=0.3, min_margin=0.1)
+    router.fit(
+        {
+            "usfinancialanalyzernode": "US stock financial statements profitability",
+            "weeklyreporternode": "weekly market recap JPMorgan",
+        }
+    )
+
+    decision = router.route("Analyze Microsoft profitability", list(router._vectors))
+    assert decision.workers == ["usfinancialanalyzernode"]
+    assert decision.source == "embedding"
+    assert router.route("오늘 환율 어때?", list(router._vectors)) is None
+
+
+@pytest.mark.parametrize(
+    "query, final",
+    [
+        ("AAPL 재무 분석해줘", True),
+        ("AAPL 재무 분석하고 보고서 작성해줘", False),
+        ("Compare AAPL and MSFT financials and write a report", False),
+        ("삼성전자 뉴스 찾은 다음에 요약해줘", False),
+    ],
+)
+def test_multi_step_queries_are_not_final(query, final):
+    """여러 단계가 필요한 요청은 첫 worker만 사전 라우팅하고 이후는 LLM에 맡기는지 테스트"""
+    decision = FastPathRouter([RuleRouter()]).route(query, MEMBERS)
+
+    assert decision.workers[0] in ("usfinancialanalyzernode", "navernewssearchernode")
+    assert decision.final is final
+
+
+def test_fast_path_router_reports_short_circuit_rate():
+    """short-circuit 비율이 결정 출처별로 집계되는지 테스트"""
+    router = FastPathRouter([RuleRouter()])
+
+    router.route("주간 리캡", MEMBERS)
+    router.route("AAPL 재무", MEMBERS)
+    router.route("금리 전망은?", MEMBERS)
+
+    stats = router.stats()
+    assert stats["requests"] == 3
+    assert stats["decisions"] == {"rule": 2, "llm": 1}
+    assert stats["short_circuit_rate"] == pytest.approx(2 / 3)
@@ -0,0 +1,280 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel
+
+from src.graph.nodes.base import Node
+from src.models.do import RawResponse
+from src.tools.us_stock.alpha_vantage_client import AlphaVantageAPIWrapper
+from src.tools.rss_feeder.rss_feeder import RSSFeederAPIWrapper
+from src.utils.budget import (
+    BudgetExceededError,
+    BudgetTracker,
+    RunBudget,
+    budget_scope,
+)
+from src.utils.concurrency import (
+    ProviderLimiter,
+    RateLimit,
+    RateLimiter,
+    RateLimitExceededError,
+)
+from src.utils.resilience import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitOpenError,
+    http_timeout,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_breaker_opens_and_recovers_after_cooldown():
+    """연속 실패 시 열리고, cooldown 후 시험 호출 하나의 결과에 따라 닫히거나 다시 열리는지 테스트"""
+    clock = FakeClock()
+    breaker = CircuitBreaker(
+        "feeds.a.dj.com", failure_threshold=2, cooldown=30, clock=clock
+    )
+
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    clock.now = 30
+    assert breaker.state == "half_open"
+    breaker.before_call()
+    # 시험 호출이 끝나기 전의 다른 호출은 거절
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    clock.now = 60
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.stats() == {
+        "state": "closed",
+        "failures": 0,
+        "rejected": 2,
+        "retry_after": 0,
+    }
+
+
+def test_guard_records_per_host_and_ignores_budget_errors():
+    """호스트 단위로 실패를 기록하고, 실행 예산 초과는 실패로 세지 않는지 테스트"""
+    registry = CircuitBreakerRegistry(failure_threshold=1, cooldown=60)
+
+    with pytest.raises(BudgetExceededError):
+        with registry.guard("https://www.alphavantage.co/query"):
+            raise BudgetExceededError("api_calls")
+    assert not registry.is_open("https://www.alphavantage.co/query")
+
+    with pytest.raises(TimeoutError):
+        with registry.guard("https://feeds.a.dj.com/rss/RSSMarketsMain.xml"):
+            raise TimeoutError("stalled")
+    # 같은 호스트의 다른 피드도 차단, 다른 호스트는 영향 없음
+    assert registry.is_open("https://feeds.a.dj.com/rss/RSSWorldNews.xml")
+    with pytest.raises(CircuitOpenError):
+        with registry.guard("https://feeds.a.dj.com/rss/RSSWorldNews.xml"):
+            pass
+    with registry.guard("https://www.alphavantage.co/query"):
+        pass
+
+    assert registry.stats()["feeds.a.dj.com"]["state"] == "open"
+    assert registry.reset("feeds.a.dj.com")
+    assert not registry.is_open("https://feeds.a.dj.com/rss/RSSMarketsMain.xml")
+
+
+def test_rss_feeder_does_not_wrap_breaker_and_budget_errors(monkeypatch):
+    """RSS 조회가 차단기 열림과 예산 초과를 일반 Exception으로 감싸지 않는지 테스트"""
+    url = "https://feeds.a.dj.com/rss/RSSMarketsMain.xml"
+    registry = CircuitBreakerRegistry(failure_threshold=1, cooldown=60)
+    monkeypatch.setattr("src.tools.rss_feeder.rss_feeder.breakers", registry)
+    rss = RSSFeederAPIWrapper()
+
+    with budget_scope(BudgetTracker(RunBudget(max_api_calls=0))):
+        with pytest.raises(BudgetExceededError):
+            rss.raw_results(url)
+        with pytest.raises(BudgetExceededError):
+            asyncio.run(rss.raw_results_async(url))
+
+    registry.get(url).before_call()
+    registry.get(url).record_failure()
+    with pytest.raises(CircuitOpenError):
+        rss.raw_results(url)
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(rss.raw_results_async(url))
+
+
+def test_rate_limited_calls_do_not_open_breaker(monkeypatch):
+    """호출 한도 초과(로컬 제한)는 호스트 장애로 세지 않는지 테스트"""
+    registry = CircuitBreakerRegistry(failure_threshold=1, cooldown=60)
+    rate_limiter = RateLimiter(
+        {"alpha_vantage": RateLimit(5, 60, daily=1)}, max_wait=0.01
+    )
+    rate_limiter.acquire("alpha_vantage")
+    monkeypatch.setattr("src.tools.us_stock.alpha_vantage_client.breakers", registry)
+    monkeypatch.setattr(
+        "src.tools.us_stock.alpha_vantage_client.provider_limiter",
+        ProviderLimiter({}, rate_limiter),
+    )
+    api = AlphaVantageAPIWrapper(api_key="dummy_key")
+
+    for _ in range(5):
+        assert "error" in api.make_request("OVERVIEW", "AAPL")
+
+    assert registry.get(api.base_url).stats()["failures"] == 0
+
+    # 차단기 안에서 발생하더라도 실패로 세지 않음
+    with pytest.raises(RateLimitExceededError):
+        with registry.guard(api.base_url):
+            raise RateLimitExceededError("alpha_vantage daily limit")
+    assert not registry.is_open(api.base_url)
+
+
+def test_server_errors_open_breaker(monkeypatch):
+    """5xx 응답이 오류 값으로 반환되지 않고 차단기에 실패로 기록되는지 테스트"""
+    registry = CircuitBreakerRegistry(failure_threshold=2, cooldown=60)
+    session = SimpleNamespace(
+        get=lambda *args, **kwargs: SimpleNamespace(
+            status_code=503, text="Service Unavailable"
+        )
+    )
+    monkeypatch.setattr("src.tools.us_stock.alpha_vantage_client.breakers", registry)
+    monkeypatch.setattr(
+        "src.tools.us_stock.alpha_vantage_client.provider_limiter",
+        ProviderLimiter({}, RateLimiter()),
+    )
+    monkeypatch.setattr(
+        "src.tools.us_stock.alpha_vantage_client.http_clients",
+        SimpleNamespace(session=lambda: session, timeout=lambda upstream: 1),
+    )
+    api = AlphaVantageAPIWrapper(api_key="dummy_key")
+
+    for _ in range(2):
+        assert "503" in api.make_request("OVERVIEW", "AAPL")["error"]
+
+    assert registry.is_open(api.base_url)
+
+
+def test_http_timeout_settings(monkeypatch):
+    """upstream별 timeout이 공통 설정보다 우선하는지 테스트"""
+    monkeypatch.setenv("HTTP_TIMEOUT", "5")
+    monkeypatch.setenv("RSS_HTTP_TIMEOUT", "2.5")
+
+    assert http_timeout("rss") == 2.5
+    assert http_timeout("naver") == 5
+
+
+class FeedTool(BaseModel):
+    url: str = "https://feeds.a.dj.com/rss/RSSMarketsMain.xml"
+
+
+class FeedNode(Node):
+    def __init__(self, delay: float = 0):
+        super().__init__()
+        self.tools = [FeedTool()]
+        self.delay = delay
+        self.calls = 0
+
+    def _run(self, state: dict):
+        self.calls += 1
+        time.sleep(self.delay)
+        return "ran"
+
+    async def _arun(self, state: dict):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return "ran"
+
+    def _invoke(self, query: str) -> Optional[RawResponse]:
+        time.sleep(self.delay)
+        return RawResponse(answer="ran")
+
+
+def test_node_skips_when_upstream_is_open(monkeypatch):
+    """의존하는 호스트의 차단기가 열려 있으면 노드를 실행하지 않고 supervisor에 알리는지 테스트"""
+    registry = CircuitBreakerRegistry(failure_threshold=1, cooldown=60)
+    monkeypatch.setattr("src.utils.resilience.breakers", registry)
+    node = FeedNode()
+    assert node.upstreams == ["https://feeds.a.dj.com/rss/RSSMarketsMain.xml"]
+
+    with pytest.raises(ConnectionError):
+        with registry.guard(node.upstreams[0]):
+            raise ConnectionError("reset by peer")
+
+    command = node({"messages": []})
+    async_command = asyncio.run(node.acall({"messages": []}))
+
+    assert node.calls == 0
+    assert command.goto == async_command.goto == "supervisor"
+    message = command.update["messages"][0]
+    assert message.name == "feed"
+    assert "feeds.a.dj.com" in message.content
+    assert "feeds.a.dj.com" in node.invoke("시장 뉴스").answer
+
+
+def test_node_timeout_returns_to_supervisor(monkeypatch):
+    """노드가 제한 시간 안에 끝나지 않으면 기다리지 않고 supervisor로 돌아가는지 테스트"""
+    monkeypatch.setenv("NODE_FEED_TIMEOUT", "0.05")
+    node = FeedNode(delay=0.5)
+    assert node.timeout == 0.05
+
+    start = time.perf_counter()
+    command = node({"messages": []})
+    async_command = asyncio.run(node.acall({"messages": []}))
+
+    assert time.perf_counter() - start < 0.4
+    assert "did not finish within 0.05s" in command.update["messages"][0].content
+    assert async_command.goto == "supervisor"
+
+    node.delay = 0
+    assert node({"messages": []}) == "ran"
+
+
+def test_timed_out_sync_calls_use_bounded_threads(monkeypatch):
+    """제한 시간이 지난 동기 호출이 노드별 스레드 수를 넘어 쌓이지 않는지 테스트"""
+    monkeypatch.setenv("NODE_FEED_TIMEOUT", "0.05")
+    monkeypatch.setenv("NODE_FEED_CALL_THREADS", "2")
+    node = FeedNode(delay=0.3)
+    existing = set(threading.enumerate())
+
+    for _ in range(4):
+        assert node({"messages": []}).goto == "supervisor"
+
+    assert len(set(threading.enumerate()) - existing) == 2
+    # 스레드를 기다리다 제한 시간이 지난 호출은 실행되지 않음
+    assert node.calls == 2
+
+
+def test_direct_invoke_timeout(monkeypatch):
+    """직접 호출(invoke, ainvoke)에도 노드 제한 시간이 적용되는지 테스트"""
+    monkeypatch.setenv("NODE_FEED_TIMEOUT", "0.05")
+    node = FeedNode(delay=0.3)
+
+    async def ainvoke():
+        start = time.perf_counter()
+        answer = (await node.ainvoke("시장 뉴스")).answer
+        return answer, time.perf_counter() - start
+
+    start = time.perf_counter()
+    answer = node.invoke("시장 뉴스").answer
+    assert time.perf_counter() - start < 0.2
+    assert "did not finish within 0.05s" in answer
+
+    answer, elapsed = asyncio.run(ainvoke())
+    assert elapsed < 0.2
+    assert "did not finish within 0.05s" in answer
@@ -0,0 +1,101 @@
+import asyncio
+import time
+
+import pytest
+
+from src.services.response_cache import (
+    DiskCacheBackend,
+    MemoryCacheBackend,
+    ResponseCache,
+    parse_cache_control,
+)
+
+
+@pytest.fixture(params=["memory", "disk"])
+def cache(request, tmp_path):
+    """메모리/디스크 백엔드 각각의 ResponseCache를 생성하는 fixture"""
+    if request.param == "memory":
+        backend = MemoryCacheBackend()
+    else:
+        backend = DiskCacheBackend(str(tmp_path / "cache.sqlite3"))
+    return ResponseCache(backend, default_ttl=60, ttls={"weeklyreporter": 0})
+
+
+def test_key_normalizes_query():
+    """공백/대소문자가 달라도 같은 쿼리는 같은 키를 갖는지 테스트"""
+    assert ResponseCache.make_key("query", "  AAPL   Financial ") == (
+        ResponseCache.make_key("query", "aapl financial")
+    )
+    assert ResponseCache.make_key("query", "q", "gpt-4o-mini", 0.2) != (
+        ResponseCache.make_key("query", "q", "gpt-4o", 0.2)
+    )
+
+
+def test_get_and_set(cache):
+    """저장한 응답을 조회하고 hit/miss를 집계하는지 테스트"""
+    key = cache.make_key("query", "오늘 경제 뉴스 요약")
+    assert cache.get("query", key) is None
+
+    cache.set("query", key, {"answer": "요약"})
+    assert cache.get("query", key) == {"answer": "요약"}
+    assert cache.stats() == {"hits": 1, "misses": 1}
+
+
+def test_async_get_and_set(cache):
+    """비동기 라우트용 aget/aset이 동기 get/set과 같은 항목을 다루는지 테스트"""
+    key = cache.make_key("query", "오늘 경제 뉴스 요약")
+
+    async def main():
+        assert await cache.aget("query", key) is None
+        await cache.aset("query", key, {"answer": "요약"})
+        return await cache.aget("query", key)
+
+    assert asyncio.run(main()) == {"answer": "요약"}
+    assert cache.get("query", key) == {"answer": "요약"}
+    assert cache.stats() == {"hits": 2, "misses": 1}
+
+
+def test_zero_ttl_disables_endpoint(cache):
+    """TTL이 0인 엔드포인트는 캐시하지 않는지 테스트"""
+    key = cache.make_key("weeklyreporter", "recap")
+    cache.set("weeklyreporter", key, {"answer": "recap"})
+    assert cache.get("weeklyreporter", key) is None
+
+
+def test_entries_expire(cache):
+    """TTL이 지난 항목은 조회되지 않는지 테스트"""
+    cache.backend.set("key", {"answer": "old"}, ttl=0.01)
+    time.sleep(0.02)
+    assert cache.backend.get("key") is None
+
+
+def test_memory_backend_evicts_least_recently_used():
+    """용량을 넘으면 가장 오래 사용되지 않은 항목부터 제거하는지 테스트"""
+    backend = MemoryCacheBackend(max_bytes=30)
+    backend.set("a", "x" * 10, ttl=60)
+    backend.set("b", "x" * 10, ttl=60)
+    backend.get("a")
+    backend.set("c", "x" * 10, ttl=60)
+
+    assert backend.get("b") is None
+    assert backend.get("a") is not None
+    assert backend.size <= 30
+
+
+def test_memory_backend_counts_utf8_bytes():
+    """용량 상한을 문자 수가 아니라 UTF-8 바이트 수로 계산하는지 테스트"""
+    backend = MemoryCacheBackend(max_bytes=40)
+    backend.set("a", "가" * 10, ttl=60)
+
+    # 키 1바이트 + 따옴표 2바이트 + 한글 10자 * 3바이트
+    assert backend.size == 33
+    backend.set("b", "가" * 10, ttl=60)
+    assert backend.get("a") is None
+    assert backend.size <= 40
+
+
+def test_parse_cache_control():
+    """Cache-Control 헤더에 따른 조회/저장 여부 테스트"""
+    assert parse_cache_control(None) == (True, True)
+    assert parse_cache_control("no-cache") == (False, True)
+    assert parse_cache_control("max-age=0, no-store") == (False, False)
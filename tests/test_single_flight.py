@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from src.services.single_flight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    """동시에 들어온 같은 키의 요청이 한 번만 실행되는지 테스트"""
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "answer"
+
+    async def main():
+        return await asyncio.gather(
+            *(single_flight.do("key", compute) for _ in range(5)),
+            single_flight.do("other", compute),
+        )
+
+    results = asyncio.run(main())
+
+    assert results == ["answer"] * 6
+    assert calls == 2
+    assert single_flight.stats() == {"executions": 2, "coalesced": 4, "in_flight": 0}
+
+
+def test_errors_are_shared():
+    """실행 중 발생한 예외가 병합된 모든 요청에 전달되는지 테스트"""
+    single_flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def main():
+        return await asyncio.gather(
+            single_flight.do("key", fail),
+            single_flight.do("key", fail),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(main())
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_cancelled_waiter_does_not_cancel_execution():
+    """대기 중인 요청 하나가 취소되어도 공유 실행은 계속되는지 테스트"""
+    single_flight = SingleFlight()
+
+    async def compute():
+        await asyncio.sleep(0.05)
+        return "answer"
+
+    async def main():
+        first = asyncio.ensure_future(single_flight.do("key", compute))
+        second = asyncio.ensure_future(single_flight.do("key", compute))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(main()) == "answer"
@@ -0,0 +1,337 @@
+import asyncio
+import os
+import re
+import tempfile
+import time
+import unittest
+
+from langchain_core.messages import HumanMessage
+from langgraph.graph import END
+from langgraph.types import Command
+
+from src.graph.builder import SupervisorGraphBuilder
+from src.graph.checkpointer import ThreadedSqliteSaver
+from src.graph.compaction import MessageCompactor
+from src.graph.nodes.base import Node
+from src.graph.nodes.supervisor import SupervisorNode
+from src.graph.pre_router import FastPathRouter, RouteRule, RuleRouter
+from src.models.graph_state import SupervisorState
+from src.utils.budget import RunBudget
+from tests.test_compaction import CharCounter
+
+
+class ScriptedLLM:
+    """미리 정해진 순서대로 라우팅 결과를 반환하는 테스트용 LLM"""
+
+    def __init__(self, routes):
+        self.routes = list(routes)
+        self.prompts = []
+
+    def with_structured_output(self, _):
+        return self
+
+    def invoke(self, messages):
+        self.prompts.append(messages)
+        return {"next": self.routes.pop(0)}
+
+    async def ainvoke(self, messages):
+        return self.invoke(messages)
+
+
+class SlowSourceNode(Node):
+    def _run(self, state):
+        time.sleep(0.3)
+        return self._result()
+
+    async def _arun(self, state):
+        await asyncio.sleep(0.3)
+        return self._result()
+
+    def _result(self):
+        name = self.__class__.__name__.lower()
+        return Command(
+            update={"messages": [HumanMessage(content=name, name=name)]},
+            goto="supervisor",
+        )
+
+    def _invoke(self, query: str): ...
+
+
+class FirstSourceNode(SlowSourceNode): ...
+
+
+class SecondSourceNode(SlowSourceNode): ...
+
+
+class VerboseSourceNode(SlowSourceNode):
+    def _result(self):
+        return Command(
+            update={"messages": [HumanMessage(content="v" * 200, name="verbose")]},
+            goto="supervisor",
+        )
+
+
+class FlakySourceNode(SlowSourceNode):
+    """처음 한 번은 실패하는 worker"""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    async def _arun(self, state):
+        self.calls += 1
+        if self.calls == 1:
+            # 함께 실행된 worker가 먼저 완료된 뒤 실패
+            await asyncio.sleep(0.4)
+            raise RuntimeError("interrupted")
+        return await super()._arun(state)
+
+
+class CountingSourceNode(SlowSourceNode):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    async def _arun(self, state):
+        self.calls += 1
+        return await super()._arun(state)
+
+
+class TestSupervisorRoute(unittest.TestCase):
+    """SupervisorNode 라우팅 테스트"""
+
+    def setUp(self):
+        self.node = SupervisorNode(max_parallel=2)
+        self.state = {"members": ["a", "b", "c"], "hops": 1}
+
+    def test_single_worker(self):
+        command = self.node._route(self.state, {"next": ["a"]})
+        self.assertEqual(command.goto, "a")
+        self.assertEqual(command.update, {"next": "a", "hops": 2})
+
+    def test_parallel_workers_are_capped(self):
+        command = self.node._route(self.state, {"next": ["a", "b", "a", "c"]})
+        self.assertEqual(command.goto, ["a", "b"])
+
+    def test_finish_and_unknown_workers(self):
+        for selected in (["FINISH"], "FINISH", ["unknown"], []):
+            command = self.node._route(self.state, {"next": selected})
+            self.assertEqual(command.goto, END, f"next: {selected}")
+            self.assertEqual(command.update["hops"], 1)
+
+    def test_sequential_mode_prompt(self):
+        self.node.members = ["a"]
+        self.assertIn("in parallel", self.node.system_prompt)
+        self.assertNotIn("in parallel", SupervisorNode(max_parallel=1).system_prompt)
+
+
+class TestParallelDispatch(unittest.TestCase):
+    """여러 worker가 동시에 실행되고 결과가 합쳐지는지 테스트"""
+
+    def setUp(self):
+        self.builder = SupervisorGraphBuilder()
+        self.builder.add_node(FirstSourceNode())
+        self.builder.add_node(SecondSourceNode())
+        self.builder.build()
+
+    def _state(self):
+        llm = ScriptedLLM([["firstsourcenode", "secondsourcenode"], ["FINISH"]])
+        return SupervisorState(llm=llm, messages=[("user", "news")])
+
+    def _assert_merged(self, result, elapsed):
+        contents = sorted(message.content for message in result["messages"][1:])
+        self.assertEqual(contents, ["firstsourcenode", "secondsourcenode"])
+        self.assertEqual(result["hops"], 1)
+        # 순차 실행(0.6초 이상)보다 빨라야 함
+        self.assertLess(elapsed, 0.55)
+
+    def test_aexecute(self):
+        start_time = time.perf_counter()
+        result = asyncio.run(self.builder.aexecute(self._state()))
+        self._assert_merged(result, time.perf_counter() - start_time)
+
+    def test_execute(self):
+        start_time = time.perf_counter()
+        result = self.builder.execute(self._state())
+        self._assert_merged(result, time.perf_counter() - start_time)
+
+
+class TestFastPath(unittest.TestCase):
+    """사전 라우터가 결정한 요청은 supervisor LLM을 호출하지 않는지 테스트"""
+
+    def setUp(self):
+        rules = [RouteRule("firstsourcenode", re.compile("first"))]
+        self.pre_router = FastPathRouter([RuleRouter(rules)])
+        self.builder = SupervisorGraphBuilder(pre_router=self.pre_router)
+        self.builder.add_node(FirstSourceNode())
+        self.builder.add_node(SecondSourceNode())
+        self.builder.build()
+
+    def test_short_circuit_skips_llm(self):
+        # 라우팅 결과가 없는 LLM을 호출하면 IndexError가 발생함
+        state = SupervisorState(llm=ScriptedLLM([]), messages=[("user", "first")])
+        result = asyncio.run(self.builder.aexecute(state))
+
+        self.assertEqual(result["messages"][-1].content, "firstsourcenode")
+        self.assertEqual(result["routed_by"], "rule")
+        self.assertEqual(result["hops"], 1)
+
+    def test_falls_back_to_llm(self):
+        llm = ScriptedLLM([["secondsourcenode"], ["FINISH"]])
+        state = SupervisorState(llm=llm, messages=[("user", "other")])
+        result = self.builder.execute(state)
+
+        self.assertEqual(result["messages"][-1].content, "secondsourcenode")
+        self.assertIsNone(result["routed_by"])
+        self.assertEqual(self.pre_router.stats()["decisions"], {"llm": 1})
+
+    def test_multi_step_query_returns_to_llm(self):
+        # 첫 worker는 사전 라우팅하고, 보고서 작성 단계와 종료는 LLM이 결정
+        llm = ScriptedLLM([["secondsourcenode"], ["FINISH"]])
+        state = SupervisorState(
+            llm=llm, messages=[("user", "first 분석하고 보고서 작성해줘")]
+        )
+        result = self.builder.execute(state)
+
+        contents = [message.content for message in result["messages"]]
+        self.assertEqual(contents[-2:], ["firstsourcenode", "secondsourcenode"])
+        self.assertIsNone(result["routed_by"])
+        self.assertEqual(len(llm.prompts), 2)
+        self.assertEqual(self.pre_router.stats()["decisions"], {"rule": 1})
+
+
+class TestRunBudget(unittest.TestCase):
+    """예산이 소진되면 부분 결과와 함께 그래프가 종료되는지 테스트"""
+
+    def setUp(self):
+        self.builder = SupervisorGraphBuilder()
+        self.builder.add_node(FirstSourceNode())
+        self.builder.add_node(SecondSourceNode())
+        self.builder.build()
+
+    def _state(self):
+        # FINISH 없이 두 worker 사이를 계속 오가는 supervisor
+        llm = ScriptedLLM(["firstsourcenode", "secondsourcenode"] * 10)
+        return SupervisorState(llm=llm, messages=[("user", "news")])
+
+    def test_max_hops(self):
+        result = self.builder.execute(self._state(), RunBudget(max_hops=2))
+
+        self.assertEqual(result["stopped_reason"], "max_hops")
+        self.assertEqual(result["hops"], 2)
+        self.assertEqual(result["messages"][-1].content, "secondsourcenode")
+
+    def test_deadline(self):
+        start_time = time.perf_counter()
+        result = asyncio.run(
+            self.builder.aexecute(self._state(), RunBudget(deadline_seconds=0.5))
+        )
+
+        self.assertEqual(result["stopped_reason"], "deadline")
+        # 진행 중이던 worker를 기다리지 않고 종료
+        self.assertLess(time.perf_counter() - start_time, 0.65)
+        self.assertEqual(result["messages"][-1].content, "firstsourcenode")
+
+    def test_stream_reports_budget_event(self):
+        async def collect():
+            return [
+                event
+                async for event in self.builder.astream(
+                    self._state(), ("updates",), RunBudget(max_hops=1)
+                )
+            ]
+
+        mode, chunk = asyncio.run(collect())[-1]
+        self.assertEqual(mode, "budget")
+        self.assertEqual(chunk["reason"], "max_hops")
+
+
+class TestConversationThread(unittest.TestCase):
+    """thread_id로 이전 대화에 이어서 실행하고, 중단된 실행을 재개하는지 테스트"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.checkpointer = ThreadedSqliteSaver.from_path(
+            os.path.join(self.tmpdir.name, "checkpoints.sqlite3")
+        )
+
+    def tearDown(self):
+        asyncio.run(self.checkpointer.aclose())
+        self.tmpdir.cleanup()
+
+    def _builder(self, *nodes):
+        builder = SupervisorGraphBuilder(checkpointer=self.checkpointer)
+        for node in nodes:
+            builder.add_node(node)
+        return builder.build()
+
+    def test_follow_up_keeps_history(self):
+        builder = self._builder(FirstSourceNode(), SecondSourceNode())
+
+        first = SupervisorState(
+            llm=ScriptedLLM(["firstsourcenode", "FINISH"]), messages=[("user", "a")]
+        )
+        builder.execute(first, thread_id="t1")
+        second = SupervisorState(
+            llm=ScriptedLLM(["secondsourcenode", "FINISH"]), messages=[("user", "b")]
+        )
+        result = asyncio.run(builder.aexecute(second, thread_id="t1"))
+
+        contents = [message.content for message in result["messages"]]
+        self.assertEqual(contents, ["a", "firstsourcenode", "b", "secondsourcenode"])
+        # hop 수는 턴마다 새로 계산
+        self.assertEqual(result["hops"], 1)
+        self.assertNotIn("llm", result)
+
+        other = SupervisorState(llm=ScriptedLLM(["FINISH"]), messages=[("user", "c")])
+        result = builder.execute(other, thread_id="t2")
+        self.assertEqual(len(result["messages"]), 1)
+
+    def test_resume_interrupted_run(self):
+        counting, flaky = CountingSourceNode(), FlakySourceNode()
+        builder = self._builder(counting, flaky)
+        parallel = ["countingsourcenode", "flakysourcenode"]
+
+        state = SupervisorState(
+            llm=ScriptedLLM([parallel]), messages=[("user", "news")]
+        )
+        with self.assertRaises(RuntimeError):
+            asyncio.run(builder.aexecute(state, thread_id="t1"))
+
+        # supervisor는 다시 라우팅하지 않고, 성공한 worker도 다시 실행하지 않음
+        state = SupervisorState(
+            llm=ScriptedLLM(["FINISH"]), messages=[("user", "news")]
+        )
+        result = asyncio.run(builder.aexecute(state, thread_id="t1"))
+
+        self.assertEqual(counting.calls, 1)
+        self.assertEqual(flaky.calls, 2)
+        contents = sorted(message.content for message in result["messages"][1:])
+        self.assertEqual(contents, ["countingsourcenode", "flakysourcenode"])
+
+
+class TestCompaction(unittest.TestCase):
+    """supervisor에는 압축된 대화 기록을 전달하고, state에는 전체 내용을 유지하는지 테스트"""
+
+    def test_compacts_history_for_supervisor(self):
+        compactor = MessageCompactor(
+            max_tokens=100, keep_recent=1, excerpt_tokens=10, counter=CharCounter()
+        )
+        builder = SupervisorGraphBuilder(compactor=compactor)
+        builder.add_node(VerboseSourceNode())
+        builder.add_node(FirstSourceNode())
+        builder.build()
+
+        llm = ScriptedLLM(["verbosesourcenode", "firstsourcenode", "FINISH"])
+        result = builder.execute(SupervisorState(llm=llm, messages=[("user", "q")]))
+
+        self.assertEqual(result["messages"][1].content, "v" * 200)
+        # 마지막 supervisor 호출: system, user, verbose(압축), first
+        last_prompt = llm.prompts[-1]
+        self.assertTrue(last_prompt[2].content.startswith("v" * 10 + "\n"))
+        self.assertLess(len(last_prompt[2].content), 200)
+        self.assertEqual(last_prompt[3].content, "firstsourcenode")
+
+
+if __name__ == "__main__":
+    unittest.main()
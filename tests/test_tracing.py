@@ -0,0 +1,142 @@
+import json
+from typing import Optional
+
+import pytest
+from langchain_core.messages import HumanMessage
+from langchain_core.tools import BaseTool
+from langgraph.types import Command
+
+from benchmarks.fake_llm import ScriptedChatModel
+from src.graph.builder import SupervisorGraphBuilder
+from src.graph.nodes.base import Node
+from src.models.do import RawResponse
+from src.models.graph_state import SupervisorState
+from src.utils.metrics import track_http
+from src.utils.tracing import (
+    InMemoryExporter,
+    JsonLinesExporter,
+    OTLPHttpExporter,
+    Tracer,
+    tracer,
+)
+
+
+def test_nested_spans_record_parent_and_errors():
+    """하위 span이 상위 span의 trace/parent id를 갖고, 예외는 error로 기록되는지 테스트"""
+    exporter = InMemoryExporter(max_spans=10)
+    local = Tracer([exporter])
+
+    with local.span("graph run", kind="run") as run:
+        with local.span("node a", kind="node", node="a"):
+            pass
+        with pytest.raises(RuntimeError):
+            with local.span("http naver", kind="http"):
+                raise RuntimeError("boom")
+
+    node, http, root = exporter.spans()
+    assert root is run and root.parent_id is None
+    assert node.parent_id == http.parent_id == run.span_id
+    assert {node.trace_id, http.trace_id} == {run.trace_id}
+    assert http.status == "error" and "boom" in http.error
+    assert root.duration_ms >= node.duration_ms >= 0
+    assert local.recent(run.trace_id)[0]["name"] == "graph run"
+
+
+def test_sampling_skips_whole_trace():
+    """샘플링되지 않은 실행은 하위 span까지 기록하지 않는지 테스트"""
+    exporter = InMemoryExporter()
+    local = Tracer([exporter], sample_rate=0.0)
+
+    with local.span("graph run") as run:
+        with local.span("node a") as node:
+            node.set_attribute("ignored", True)
+
+    assert not run.sampled
+    assert exporter.spans() == []
+    # exporter가 없으면 span을 만들지 않음
+    with Tracer().span("graph run") as span:
+        assert not span.sampled
+
+
+def test_file_and_otlp_exporters(tmp_path, monkeypatch):
+    """JSON lines 파일 기록과 OTLP/HTTP JSON 전송 형식 테스트"""
+    path = tmp_path / "traces.jsonl"
+    otlp = OTLPHttpExporter("http://collector:4318/v1/traces", interval=60)
+    local = Tracer([JsonLinesExporter(str(path)), otlp])
+    sent = []
+
+    class Response:
+        def raise_for_status(self):
+            pass
+
+    def post(url, json, timeout):
+        sent.append((url, json))
+        return Response()
+
+    monkeypatch.setattr("src.utils.tracing.requests.post", post)
+
+    with local.span("graph run", kind="run", hops=2):
+        with local.span("http naver", kind="http", upstream="naver"):
+            pass
+    local.shutdown()
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line["name"] for line in lines] == ["http naver", "graph run"]
+
+    url, payload = sent[0]
+    assert url == "http://collector:4318/v1/traces"
+    spans = payload["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    http, run = spans
+    assert http["parentSpanId"] == run["spanId"]
+    assert http["kind"] == 3 and run["kind"] == 2
+    assert len(run["traceId"]) == 32 and len(run["spanId"]) == 16
+    assert int(run["endTimeUnixNano"]) >= int(http["endTimeUnixNano"])
+    assert {"key": "hops", "value": {"intValue": "2"}} in run["attributes"]
+
+
+class QuoteTool(BaseTool):
+    name: str = "quote_tool"
+    description: str = "returns a quote"
+
+    def _run(self, query: str, run_manager=None) -> str:
+        with track_http("quotes"):
+            return f"quote for {query}"
+
+
+class QuoteNode(Node):
+    def __init__(self):
+        super().__init__()
+        self.tool = QuoteTool()
+
+    def _run(self, state: dict) -> Command:
+        result = self.tool.invoke({"query": "삼성전자"})
+        return Command(
+            update={"messages": [HumanMessage(content=result, name="quote")]},
+            goto="supervisor",
+        )
+
+    def _invoke(self, query: str) -> Optional[RawResponse]:
+        return None
+
+
+def test_graph_run_spans_cover_nodes_tools_and_http(monkeypatch):
+    """그래프 실행 → 노드 → 도구 → 외부 호출 순서로 span이 연결되는지 테스트"""
+    exporter = InMemoryExporter()
+    monkeypatch.setattr(tracer, "exporters", [exporter])
+    monkeypatch.setattr(tracer, "sample_rate", 1.0)
+    query = "삼성전자 시세 알려줘"
+    llm = ScriptedChatModel(plans={query: [["quotenode"]]}, latency=0)
+    builder = SupervisorGraphBuilder()
+    builder.add_node(QuoteNode())
+    builder.build()
+
+    builder.execute(SupervisorState(llm=llm, messages=[("user", query)]))
+
+    spans = {span.name: span for span in exporter.spans()}
+    run = spans["graph run"]
+    assert run.attributes["hops"] == 1
+    assert spans["node supervisornode"].parent_id == run.span_id
+    assert spans["node quotenode"].parent_id == run.span_id
+    assert spans["tool quote_tool"].parent_id == spans["node quotenode"].span_id
+    assert spans["http quotes"].parent_id == spans["tool quote_tool"].span_id
+    assert {span.trace_id for span in spans.values()} == {run.trace_id}
@@ -35,7 +35,7 @@ class TestAlphaVantageAPI(unittest.TestCase):
         self.assertIsNotNone(response)
         self.assertIn("Symbol", response)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_company_overview(self, mock_get):
         """회사 개요 조회 테스트"""
         # 목 응답 설정
@@ -62,7 +62,7 @@ class TestAlphaVantageAPI(unittest.TestCase):
         self.assertEqual(result["Name"], "Apple Inc")
         self.assertEqual(result["Sector"], "Technology")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_balance_sheet(self, mock_get):
         """대차대조표 조회 테스트"""
         # 목 응답 설정
@@ -95,7 +95,7 @@ class TestAlphaVantageAPI(unittest.TestCase):
             result["annualReports"][0]["totalShareholderEquity"], "50672000000"
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_income_statement(self, mock_get):
         """손익계산서 조회 테스트"""
         # 목 응답 설정
@@ -134,7 +134,7 @@ class TestAlphaVantageAPI(unittest.TestCase):
         self.assertEqual(result["annualReports"][0]["totalRevenue"], "394328000000")
         self.assertEqual(result["annualReports"][0]["netIncome"], "99803000000")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_cash_flow(self, mock_get):
         """현금흐름표 조회 테스트"""
         # 목 응답 설정
@@ -281,7 +281,7 @@ class TestAlphaVantageAPI(unittest.TestCase):
         if "roe" in analysis:
             self.assertIn("roe_evaluation", analysis)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_error_handling(self, mock_get):
         """에러 처리 테스트"""
         # 에러 응답 설정
@@ -299,7 +299,7 @@ class TestAlphaVantageAPI(unittest.TestCase):
         # 검증
         self.assertIn("error", result)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_api_limit_handling(self, mock_get):
         """API 제한 처리 테스트"""
         # API 제한 응답 설정
@@ -318,7 +318,7 @@ class TestAlphaVantageAPI(unittest.TestCase):
         self.assertIn("error", result)
         self.assertIn("API call frequency", result["error"])
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_caching(self, mock_get):
         """캐싱 기능 테스트"""
         # 목 응답 설정
@@ -340,7 +340,7 @@ class TestAlphaVantageAPI(unittest.TestCase):
         # 두 번째 호출 (캐시에서 가져와야 함)
         api.get_company_overview("MSFT")
 
-        # requests.get은 한 번만 호출되어야 함
+        # Session.get은 한 번만 호출되어야 함
         mock_get.assert_called_once()
 
 
@@ -1,6 +1,7 @@
+import asyncio
 import sys
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 from dotenv import load_dotenv
 from src.graph.nodes.us_financial import USFinancialAnalyzerNode
 from src.tools.us_stock.tool import USFinancialStatementTool
@@ -196,6 +197,42 @@ class TestUSFinancialNode(unittest.TestCase):
             )  # LLM 추출 결과 사용
             self.assertEqual(result.update["financial_analysis"]["market"], "US")
 
+    @patch("src.graph.nodes.us_financial.create_react_agent")
+    @patch(
+        "src.tools.us_stock.tool.USFinancialStatementTool._aextract_ticker",
+        new_callable=AsyncMock,
+    )
+    def test_arun_with_explicit_ticker(self, mock_extract_ticker, mock_create_agent):
+        """Test async node execution awaits the agent's ainvoke"""
+        mock_extract_ticker.return_value = "AAPL"
+
+        result_content = "Financial Statement Analysis for Apple Inc (Ticker: AAPL)"
+
+        # Set up mocked agent with async invoke
+        mock_agent = MagicMock()
+        mock_agent.ainvoke = AsyncMock(
+            return_value={"messages": [AIMessage(content=result_content)]}
+        )
+        mock_create_agent.return_value = mock_agent
+
+        state = {
+            "llm": MagicMock(),
+            "messages": [HumanMessage(content="Analyze AAPL financials")],
+        }
+
+        # Execute node
+        self.node.agent = mock_agent
+        result = asyncio.run(self.node._arun(state))
+
+        # Verify
+        mock_agent.ainvoke.assert_awaited_once_with(state)
+        mock_agent.invoke.assert_not_called()
+        self.assertEqual(result.goto, "supervisor")
+        self.assertEqual(result.update["financial_analysis"]["ticker"], "AAPL")
+        self.assertEqual(
+            result.update["financial_analysis"]["analysis_text"], result_content
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
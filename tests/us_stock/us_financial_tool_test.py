@@ -1,3 +1,4 @@
+import asyncio
 import sys
 import unittest
 from unittest.mock import patch, MagicMock
@@ -222,5 +223,96 @@ class TestTickerExtraction(unittest.TestCase):
                 )
 
 
+class TestAsyncFinancialAnalysis(unittest.TestCase):
+    """Test class for the async Alpha Vantage analysis path"""
+
+    def setUp(self):
+        self.tool = USFinancialStatementTool()
+        self.wrapper = self.tool.api_wrapper
+
+    def test_statements_fetched_concurrently(self):
+        """Test that the four statements are requested at the same time"""
+        in_flight = {"now": 0, "max": 0}
+
+        async def fetch(section, ticker):
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            if section == "cash_flow":
+                raise RuntimeError("timeout")
+            if section == "balance_sheet":
+                return {"error": "API call frequency exceeded"}
+            return {"Name": "Apple Inc"} if section == "profile" else {"ok": True}
+
+        def fake(section):
+            async def fetch_section(ticker):
+                return await fetch(section, ticker)
+
+            return fetch_section
+
+        with (
+            patch.object(
+                type(self.wrapper), "aget_company_overview", side_effect=fake("profile")
+            ),
+            patch.object(
+                type(self.wrapper),
+                "aget_balance_sheet",
+                side_effect=fake("balance_sheet"),
+            ),
+            patch.object(
+                type(self.wrapper),
+                "aget_income_statement",
+                side_effect=fake("income_statement"),
+            ),
+            patch.object(
+                type(self.wrapper), "aget_cash_flow", side_effect=fake("cash_flow")
+            ),
+            patch("src.tools.us_stock.analyze_financial_data", return_value={}),
+        ):
+            result = asyncio.run(
+                self.wrapper.analyze_financial_statements_async("AAPL")
+            )
+
+        self.assertEqual(in_flight["max"], 4)
+        self.assertEqual(result["company_name"], "Apple Inc")
+        self.assertEqual(result["income_statement"], {"ok": True})
+        self.assertEqual(result["balance_sheet_error"], "API call frequency exceeded")
+        self.assertEqual(result["cash_flow_error"], "timeout")
+
+    @patch("src.tools.us_stock.tool.format_financial_analysis", return_value="report")
+    def test_arun_uses_async_extraction(self, mock_format):
+        """Test that the tool's async path awaits ticker extraction and analysis"""
+        llm = MagicMock()
+
+        async def ainvoke(prompt):
+            return MagicMock(content="aapl")
+
+        llm.ainvoke = ainvoke
+        self.tool.llm = llm
+
+        async def overview(ticker):
+            return {"Name": "Apple Inc"}
+
+        async def analyze(ticker):
+            return {"ticker": ticker}
+
+        with (
+            patch.object(
+                type(self.wrapper), "aget_company_overview", side_effect=overview
+            ),
+            patch.object(
+                type(self.wrapper),
+                "analyze_financial_statements_async",
+                side_effect=analyze,
+            ) as mock_analyze,
+        ):
+            result = asyncio.run(self.tool.ainvoke({"query": "Analyze Apple"}))
+
+        self.assertEqual(result, "report")
+        mock_analyze.assert_called_once_with("AAPL")
+        mock_format.assert_called_once_with({"ticker": "AAPL"})
+
+
 if __name__ == "__main__":
     unittest.main()